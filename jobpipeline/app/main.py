@@ -47,31 +47,45 @@ class JobPipelineWindow(QMainWindow):
         self.summary = QLabel("No runs yet")
         run_btn = QPushButton("Run pipeline now")
         run_btn.clicked.connect(self.run_pipeline)
+        rescore_btn = QPushButton("Rescore stored jobs")
+        rescore_btn.clicked.connect(self.rescore_jobs)
         top.addWidget(self.summary)
         top.addWidget(run_btn)
+        top.addWidget(rescore_btn)
         root_layout.addLayout(top)
 
+        self.profile_filter = QComboBox()
+        self.profile_filter.addItems([profile["name"] for profile in self.config["profiles"]])
+        self.profile_filter.currentTextChanged.connect(self.refresh_jobs)
         self.status_filter = QComboBox()
         self.status_filter.addItems(["All", "New", "Review", "Applied", "Interview", "Rejected", "Archived"])
         self.grade_filter = QComboBox()
         self.grade_filter.addItems(["All", "A", "B", "C", "D"])
         self.remote_filter = QComboBox()
         self.remote_filter.addItems(["All", "Y", "N", "Unknown"])
-        for cb in (self.status_filter, self.grade_filter, self.remote_filter):
+        self.sort_key = QComboBox()
+        self.sort_key.addItems(["Last seen", "Fit score", "Similarity"])
+        for cb in (self.status_filter, self.grade_filter, self.remote_filter, self.sort_key):
             cb.currentTextChanged.connect(self.refresh_jobs)
 
         filters = QHBoxLayout()
+        filters.addWidget(QLabel("Profile"))
+        filters.addWidget(self.profile_filter)
         filters.addWidget(QLabel("Status"))
         filters.addWidget(self.status_filter)
         filters.addWidget(QLabel("Grade"))
         filters.addWidget(self.grade_filter)
         filters.addWidget(QLabel("Remote"))
         filters.addWidget(self.remote_filter)
+        filters.addWidget(QLabel("Sort"))
+        filters.addWidget(self.sort_key)
         root_layout.addLayout(filters)
 
         split = QSplitter(Qt.Horizontal)
-        self.table = QTableWidget(0, 8)
-        self.table.setHorizontalHeaderLabels(["Job ID", "Company", "Title", "Location", "Remote", "Grade", "Status", "Link"])
+        self.table = QTableWidget(0, 9)
+        self.table.setHorizontalHeaderLabels(
+            ["Job ID", "Company", "Title", "Location", "Remote", "Grade", "Similarity", "Status", "Link"]
+        )
         self.table.cellClicked.connect(self.show_detail)
         split.addWidget(self.table)
 
@@ -121,6 +135,14 @@ class JobPipelineWindow(QMainWindow):
         self.refresh_jobs()
         self.refresh_summary()
 
+    def rescore_jobs(self) -> None:
+        # Pick up profile edits made to the config file since the window opened.
+        self.config = load_config(self.config_path)
+        self.orchestrator.config = self.config
+        counts = self.orchestrator.rescore()
+        QMessageBox.information(self, "Rescore completed", f"Counts: {counts}")
+        self.refresh_jobs()
+
     def refresh_summary(self) -> None:
         runs = self.repo.list_runs()
         if not runs:
@@ -132,7 +154,9 @@ class JobPipelineWindow(QMainWindow):
         )
 
     def refresh_jobs(self) -> None:
-        rows = self.repo.list_jobs()
+        profile = self.profile_filter.currentText() or None
+        rows = self.repo.list_jobs(profile=profile, primary_profile=self.config["profiles"][0]["name"])
+        similarity = self.orchestrator.similarity(profile)
         status = self.status_filter.currentText()
         grade = self.grade_filter.currentText()
         remote = self.remote_filter.currentText()
@@ -145,6 +169,10 @@ class JobPipelineWindow(QMainWindow):
             if remote != "All" and row["remote_flag"] != remote:
                 continue
             filtered.append(row)
+        if self.sort_key.currentText() == "Fit score":
+            filtered.sort(key=lambda row: row["fit_score"] or 0, reverse=True)
+        elif self.sort_key.currentText() == "Similarity":
+            filtered.sort(key=lambda row: similarity.get(row["job_id"], 0.0), reverse=True)
 
         self.table.setRowCount(len(filtered))
         for idx, row in enumerate(filtered):
@@ -155,6 +183,7 @@ class JobPipelineWindow(QMainWindow):
                 row["location_text"],
                 row["remote_flag"],
                 row["fit_grade"],
+                similarity.get(row["job_id"], 0.0),
                 row["user_status"],
                 row["canonical_url"],
             ]
@@ -163,14 +192,18 @@ class JobPipelineWindow(QMainWindow):
 
     def show_detail(self, row: int, _: int) -> None:
         self.selected_job_id = self.table.item(row, 0).text()
-        self.selected_link = self.table.item(row, 7).text()
-        jobs = {j["job_id"]: j for j in self.repo.list_jobs()}
+        self.selected_link = self.table.item(row, 8).text()
+        rows = self.repo.list_jobs(
+            profile=self.profile_filter.currentText() or None, primary_profile=self.config["profiles"][0]["name"]
+        )
+        jobs = {j["job_id"]: j for j in rows}
         job = jobs.get(self.selected_job_id)
         if not job:
             return
         self.details.setText(
             f"{job['title']} @ {job['company']}\n"
             f"Fit: {job['fit_score']} ({job['fit_grade']})\n"
+            f"Resume similarity: {self.table.item(row, 6).text()}\n"
             f"Notes: {job['fit_notes']}\n\n"
             f"Description:\n{job['description_raw'][:2500]}"
         )
@@ -187,6 +220,10 @@ class JobPipelineWindow(QMainWindow):
         if self.selected_link:
             webbrowser.open(self.selected_link)
 
+    def closeEvent(self, event) -> None:  # noqa: N802
+        self.orchestrator.close()
+        super().closeEvent(event)
+
 
 def main() -> None:
     parser = argparse.ArgumentParser()
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import hashlib
+
+from jobpipeline.collectors.parsers import ParserBackend, is_fast_path_complete, scan_json_ld
+from jobpipeline.collectors.skills import extract_skills
+from jobpipeline.core.models import CanonicalJob, SourceItem
+from jobpipeline.utils.text import canonicalize_url
+
+
+def make_job_id(canonical_url: str, company: str, title: str, location: str) -> str:
+    raw = f"{canonical_url}|{company.lower()}|{title.lower()}|{location.lower()}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def extract_job(
+    item: SourceItem,
+    body: str | bytes,
+    final_url: str,
+    now: str,
+    parser: ParserBackend,
+    encoding: str | None = None,
+) -> tuple[CanonicalJob, str]:
+    """Build a job from a fetched page; also returns the extraction path ("json_ld" or "dom")."""
+    html = body.decode(encoding or "utf-8", errors="replace") if isinstance(body, bytes) else body
+    data = scan_json_ld(html)
+    if is_fast_path_complete(data):
+        path, page_title, page_text = "json_ld", None, ""
+    else:
+        # Hand the backend the original bytes so lxml decodes once instead of re-encoding.
+        page = parser.parse(body, encoding)
+        path, data, page_title, page_text = "dom", page.json_ld, page.title, page.text
+    title = data.get("title") or page_title or "Unknown title"
+    company = data.get("hiringOrganization", {}).get("name") if isinstance(data.get("hiringOrganization"), dict) else data.get("company")
+    company = company or "Unknown company"
+    location = data.get("jobLocation", {}).get("address", {}).get("addressLocality") if isinstance(data.get("jobLocation"), dict) else data.get("location")
+    location = location or "Unknown"
+    description = parser.fragment_text(data["description"]) if data.get("description") else page_text
+    job = build_job(
+        item,
+        final_url=final_url,
+        now=now,
+        title=title,
+        company=company,
+        location=location,
+        description=description,
+        posted_date=data.get("datePosted"),
+        apply_url=data.get("url") or final_url,
+    )
+    return job, path
+
+
+def build_job(
+    item: SourceItem,
+    *,
+    final_url: str,
+    now: str,
+    title: str,
+    company: str,
+    location: str,
+    description: str,
+    posted_date: str | None,
+    apply_url: str | None,
+    employment_type: str = "Unknown",
+    remote: bool | None = None,
+) -> CanonicalJob:
+    """Assemble a successfully collected job; shared by page extraction and the ATS API adapters."""
+    canonical_url = canonicalize_url(final_url)
+    job_id = make_job_id(canonical_url, company, title, location)
+    if remote is None:
+        remote = "remote" in f"{title} {location} {description}".lower()
+    return CanonicalJob(
+        job_id=job_id,
+        source_domain=item.source_domain,
+        source_name=item.source_name,
+        job_url=item.job_url,
+        canonical_url=canonical_url,
+        apply_url=apply_url,
+        title=title,
+        company=company,
+        location_text=location,
+        remote_flag="Y" if remote else "Unknown",
+        employment_type=employment_type,
+        posted_date=posted_date,
+        collected_at=now,
+        description_raw=description,
+        salary_text=None,
+        skills_extracted=extract_skills(description),
+        fetch_status="success",
+        failure_reason=None,
+        first_seen=now,
+        last_seen=now,
+        repost_count=0,
+        merged_from=[],
+        fit_score=0,
+        fit_grade="D",
+        fit_notes="Not scored yet",
+        missing_must_have=[],
+        flags=[],
+    )
+
+
+def failed_job(item: SourceItem, now: str, reason: str) -> CanonicalJob:
+    canonical_url = canonicalize_url(item.job_url)
+    job_id = make_job_id(canonical_url, "unknown", "unknown", "unknown")
+    return CanonicalJob(
+        job_id=job_id,
+        source_domain=item.source_domain,
+        source_name=item.source_name,
+        job_url=item.job_url,
+        canonical_url=canonical_url,
+        apply_url=None,
+        title="Unknown",
+        company="Unknown",
+        location_text="Unknown",
+        remote_flag="Unknown",
+        employment_type="Unknown",
+        posted_date=None,
+        collected_at=now,
+        description_raw="",
+        salary_text=None,
+        skills_extracted=[],
+        fetch_status="failed",
+        failure_reason=reason,
+        first_seen=now,
+        last_seen=now,
+        repost_count=0,
+        merged_from=[],
+        fit_score=0,
+        fit_grade="D",
+        fit_notes="Collection failed",
+        missing_must_have=[],
+        flags=["collect_failed"],
+    )
@@ -1,136 +1,235 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
 from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
 
+from jobpipeline.collectors.extract import extract_job, failed_job, make_job_id
+from jobpipeline.collectors.parse_pool import ParsePool
+from jobpipeline.collectors.parsers import ParserBackend, get_parser_backend
 from jobpipeline.core.models import CanonicalJob, SourceItem
-from jobpipeline.utils.text import canonicalize_url, normalize_whitespace, tokenize_skills
-from jobpipeline.utils.throttle import DomainThrottle
+from jobpipeline.utils.http import HttpClientFactory
+from jobpipeline.utils.throttle import (
+    THROTTLE_STATUSES,
+    DomainRateLimiter,
+    backoff_delay,
+    is_transient,
+    retry_after_seconds,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class JobCollector:
-    def __init__(self, per_domain_delay_seconds: int, max_retries: int) -> None:
-        self.throttle = DomainThrottle(delay_seconds=per_domain_delay_seconds)
+    def __init__(
+        self,
+        per_domain_delay_seconds: int,
+        max_retries: int,
+        concurrency: int = 8,
+        client: httpx.Client | None = None,
+        http: HttpClientFactory | None = None,
+        parser: ParserBackend | None = None,
+        parse_workers: int = 0,
+        backoff_base_seconds: float = 1.0,
+        backoff_max_seconds: float = 30.0,
+        max_delay_seconds: float = 120.0,
+    ) -> None:
+        self.per_domain_delay_seconds = per_domain_delay_seconds
+        self.limiter = DomainRateLimiter(per_domain_delay_seconds, max_delay_seconds=max_delay_seconds)
         self.max_retries = max_retries
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.concurrency = max(1, concurrency)
+        self.client = client
+        # Builds the per-run AsyncClient for collect_many with the same cache and circuit breaker.
+        self.http = http or HttpClientFactory()
+        self.parser = parser or get_parser_backend()
+        # 0 parses inline; N > 0 hands response bodies to N worker processes in collect_many.
+        self.parse_workers = max(0, parse_workers)
+        # How often each extraction path ran: "json_ld" (pre-scan only), "dom" (full parse) or "api".
+        self.parse_paths: Counter[str] = Counter()
 
     def collect(self, item: SourceItem) -> CanonicalJob:
+        if item.job is not None:
+            self.parse_paths["api"] += 1
+            return item.job
+        domain = urlparse(item.job_url).netloc
+        now = datetime.utcnow().replace(microsecond=0).isoformat()
+        try:
+            response = self._fetch(item.job_url, domain)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("collect_failed", extra={"extra_fields": {"url": item.job_url}})
+            return self._failed_job(item, now, str(exc))
+        try:
+            return self._parse_success(item, response.content, str(response.url), now, response.charset_encoding)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("parse_failed", extra={"extra_fields": {"url": item.job_url}})
+            return self._failed_job(item, now, f"parse error: {exc}")
+
+    def _fetch(self, url: str, domain: str) -> httpx.Response:
+        attempt = 0
+        while True:
+            self.limiter.wait(domain)
+            try:
+                response = self._get(url)
+                self._record_outcome(domain, response)
+                response.raise_for_status()
+                return response
+            except Exception as exc:
+                self._record_error(domain, exc)
+                if attempt >= self.max_retries or not is_transient(exc):
+                    raise
+            time.sleep(self._backoff(attempt))
+            attempt += 1
+
+    def _record_outcome(self, domain: str, response: httpx.Response) -> None:
+        if response.status_code in THROTTLE_STATUSES:
+            self.limiter.record_throttle(domain, retry_after_seconds(response))
+        elif response.status_code < 400:
+            self.limiter.record_success(domain)
+
+    def _record_error(self, domain: str, exc: Exception) -> None:
+        if isinstance(exc, httpx.TimeoutException):
+            self.limiter.record_throttle(domain)
+
+    def _backoff(self, attempt: int) -> float:
+        return backoff_delay(attempt, self.backoff_base_seconds, self.backoff_max_seconds)
+
+    def _get(self, url: str) -> httpx.Response:
+        if self.client is None:
+            return httpx.get(url, timeout=20, follow_redirects=True)
+        return self.client.get(url, follow_redirects=True)
+
+    def collect_many(self, items: list[SourceItem]) -> list[CanonicalJob]:
+        """Collect items concurrently; output order matches ``items``."""
+        if not items:
+            return []
+        return asyncio.run(self._collect_all(items))
+
+    async def _collect_all(self, items: list[SourceItem]) -> list[CanonicalJob]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        per_host = max(1, int(self.http.settings.get("max_connections_per_host", self.concurrency)))
+        host_slots: dict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(per_host))
+        pool = ParsePool(self.parse_workers, self.parser.name) if self.parse_workers else None
+        try:
+            async with self.http.async_client() as client:
+
+                async def run(item: SourceItem) -> CanonicalJob:
+                    async with host_slots[urlparse(item.job_url).netloc]:
+                        return await self.collect_async(item, client, semaphore, pool)
+
+                jobs = list(await asyncio.gather(*(run(item) for item in items)))
+        finally:
+            if pool is not None:
+                pool.close()
+        logger.info("collect_many_completed", extra={"extra_fields": {"parse_paths": dict(self.parse_paths)}})
+        return jobs
+
+    def collect_stream(self, items: Iterable[SourceItem], emit: Callable[[SourceItem, CanonicalJob], None]) -> None:
+        """Collect items as a (possibly blocking) iterable yields them, passing each job to ``emit``.
+
+        Jobs are emitted in completion order. At most ``2 * concurrency`` items are pulled ahead of
+        the fetches, so a blocking ``emit`` (e.g. a full queue) applies backpressure upstream.
+        """
+        asyncio.run(self._collect_stream(iter(items), emit))
+
+    async def _collect_stream(self, items: Iterator[SourceItem], emit: Callable[[SourceItem, CanonicalJob], None]) -> None:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        in_flight = asyncio.Semaphore(self.concurrency * 2)
+        per_host = max(1, int(self.http.settings.get("max_connections_per_host", self.concurrency)))
+        host_slots: dict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(per_host))
+        pool = ParsePool(self.parse_workers, self.parser.name) if self.parse_workers else None
+        tasks: set[asyncio.Task[None]] = set()
+        errors: list[Exception] = []
+        try:
+            async with self.http.async_client() as client:
+
+                async def run(item: SourceItem) -> None:
+                    try:
+                        async with host_slots[urlparse(item.job_url).netloc]:
+                            job = await self.collect_async(item, client, semaphore, pool)
+                        await asyncio.to_thread(emit, item, job)
+                    except Exception as exc:  # noqa: BLE001
+                        errors.append(exc)
+                    finally:
+                        in_flight.release()
+
+                while not errors:
+                    await in_flight.acquire()
+                    item = await asyncio.to_thread(next, items, None)
+                    if item is None:
+                        break
+                    task = asyncio.create_task(run(item))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                if tasks:
+                    await asyncio.gather(*tasks)
+        finally:
+            if pool is not None:
+                pool.close()
+        if errors:
+            raise errors[0]
+
+    async def collect_async(
+        self,
+        item: SourceItem,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        pool: ParsePool | None = None,
+    ) -> CanonicalJob:
+        if item.job is not None:
+            self.parse_paths["api"] += 1
+            return item.job
         domain = urlparse(item.job_url).netloc
-        self.throttle.wait(domain)
         now = datetime.utcnow().replace(microsecond=0).isoformat()
 
         for attempt in range(self.max_retries + 1):
+            await self.limiter.wait_async(domain, semaphore)
+            failure: Exception | None = None
             try:
-                response = httpx.get(item.job_url, timeout=20, follow_redirects=True)
+                response = await client.get(item.job_url, follow_redirects=True)
+                self._record_outcome(domain, response)
                 response.raise_for_status()
-                return self._parse_success(item, response.text, str(response.url), now)
             except Exception as exc:  # noqa: BLE001
-                if attempt == self.max_retries:
-                    logger.warning("collect_failed", extra={"extra_fields": {"url": item.job_url}})
-                    return self._failed_job(item, now, str(exc))
-        return self._failed_job(item, now, "unknown")
-
-    def _parse_success(self, item: SourceItem, html: str, final_url: str, now: str) -> CanonicalJob:
-        soup = BeautifulSoup(html, "html.parser")
-        data = self._parse_json_ld(soup)
-        title = data.get("title") or soup.title.get_text(strip=True) if soup.title else "Unknown title"
-        company = data.get("hiringOrganization", {}).get("name") if isinstance(data.get("hiringOrganization"), dict) else data.get("company")
-        company = company or "Unknown company"
-        location = data.get("jobLocation", {}).get("address", {}).get("addressLocality") if isinstance(data.get("jobLocation"), dict) else data.get("location")
-        location = location or "Unknown"
-        description = normalize_whitespace(BeautifulSoup(data.get("description", "") or html, "html.parser").get_text(" "))
-        posted = data.get("datePosted")
-        apply_url = data.get("url") or final_url
-        canonical_url = canonicalize_url(final_url)
-        job_id = self._make_job_id(canonical_url, company, title, location)
-        remote_flag = "Y" if "remote" in f"{title} {location} {description}".lower() else "Unknown"
-        return CanonicalJob(
-            job_id=job_id,
-            source_domain=item.source_domain,
-            source_name=item.source_name,
-            job_url=item.job_url,
-            canonical_url=canonical_url,
-            apply_url=apply_url,
-            title=title,
-            company=company,
-            location_text=location,
-            remote_flag=remote_flag,
-            employment_type="Unknown",
-            posted_date=posted,
-            collected_at=now,
-            description_raw=description,
-            salary_text=None,
-            skills_extracted=tokenize_skills(description),
-            fetch_status="success",
-            failure_reason=None,
-            first_seen=now,
-            last_seen=now,
-            repost_count=0,
-            merged_from=[],
-            fit_score=0,
-            fit_grade="D",
-            fit_notes="Not scored yet",
-            missing_must_have=[],
-            flags=[],
-        )
+                self._record_error(domain, exc)
+                failure = exc
+            finally:
+                # Release the fetch slot before backing off or parsing so other domains keep going.
+                semaphore.release()
+            if failure is None:
+                break
+            if attempt == self.max_retries or not is_transient(failure):
+                logger.warning("collect_failed", extra={"extra_fields": {"url": item.job_url}})
+                return self._failed_job(item, now, str(failure))
+            await asyncio.sleep(self._backoff(attempt))
 
-    @staticmethod
-    def _parse_json_ld(soup: BeautifulSoup) -> dict:
-        for script in soup.select("script[type='application/ld+json']"):
-            try:
-                payload = json.loads(script.text)
-            except json.JSONDecodeError:
-                continue
-            if isinstance(payload, list):
-                for node in payload:
-                    if isinstance(node, dict) and node.get("@type") == "JobPosting":
-                        return node
-            if isinstance(payload, dict) and payload.get("@type") == "JobPosting":
-                return payload
-        return {}
+        body, final_url, encoding = response.content, str(response.url), response.charset_encoding
+        try:
+            if pool is None:
+                return self._parse_success(item, body, final_url, now, encoding)
+            job, path = await pool.parse(item, body, final_url, now, encoding)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("parse_failed", extra={"extra_fields": {"url": item.job_url}})
+            return self._failed_job(item, now, f"parse error: {exc}")
+        self.parse_paths[path] += 1
+        return job
+
+    def _parse_success(
+        self, item: SourceItem, html: str | bytes, final_url: str, now: str, encoding: str | None = None
+    ) -> CanonicalJob:
+        job, path = extract_job(item, html, final_url, now, self.parser, encoding)
+        self.parse_paths[path] += 1
+        return job
 
     @staticmethod
     def _make_job_id(canonical_url: str, company: str, title: str, location: str) -> str:
-        import hashlib
-
-        raw = f"{canonical_url}|{company.lower()}|{title.lower()}|{location.lower()}"
-        return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+        return make_job_id(canonical_url, company, title, location)
 
     def _failed_job(self, item: SourceItem, now: str, reason: str) -> CanonicalJob:
-        canonical_url = canonicalize_url(item.job_url)
-        job_id = self._make_job_id(canonical_url, "unknown", "unknown", "unknown")
-        return CanonicalJob(
-            job_id=job_id,
-            source_domain=item.source_domain,
-            source_name=item.source_name,
-            job_url=item.job_url,
-            canonical_url=canonical_url,
-            apply_url=None,
-            title="Unknown",
-            company="Unknown",
-            location_text="Unknown",
-            remote_flag="Unknown",
-            employment_type="Unknown",
-            posted_date=None,
-            collected_at=now,
-            description_raw="",
-            salary_text=None,
-            skills_extracted=[],
-            fetch_status="failed",
-            failure_reason=reason,
-            first_seen=now,
-            last_seen=now,
-            repost_count=0,
-            merged_from=[],
-            fit_score=0,
-            fit_grade="D",
-            fit_notes="Collection failed",
-            missing_must_have=[],
-            flags=["collect_failed"],
-        )
+        return failed_job(item, now, reason)
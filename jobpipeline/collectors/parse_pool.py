@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+from jobpipeline.collectors.extract import extract_job
+from jobpipeline.collectors.parsers import ParserBackend, get_parser_backend
+from jobpipeline.core.models import CanonicalJob, SourceItem
+
+_worker_parser: ParserBackend | None = None
+
+
+def _init_worker(parser_name: str) -> None:
+    global _worker_parser
+    _worker_parser = get_parser_backend(parser_name)
+
+
+def _parse_in_worker(
+    item: SourceItem, body: bytes, final_url: str, now: str, encoding: str | None
+) -> tuple[CanonicalJob, str]:
+    assert _worker_parser is not None
+    return extract_job(item, body, final_url, now, _worker_parser, encoding)
+
+
+class ParsePool:
+    """Runs HTML extraction in worker processes so parsing scales across cores while fetching continues.
+
+    Bodies cross the process boundary as raw bytes; workers decode them once.
+    """
+
+    def __init__(self, workers: int, parser_name: str) -> None:
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(parser_name,))
+
+    async def parse(
+        self, item: SourceItem, body: bytes, final_url: str, now: str, encoding: str | None
+    ) -> tuple[CanonicalJob, str]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, _parse_in_worker, item, body, final_url, now, encoding)
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True, cancel_futures=True)
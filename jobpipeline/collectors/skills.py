@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+from jobpipeline.scoring.matcher import KeywordMatcher, normalize_keyword
+
+# Canonical skill -> synonyms also credited to it. Matching is case-insensitive on word boundaries,
+# multi-word entries tolerate line breaks, and only the longest entry at a position counts
+# ("windows server" does not also record "windows"). Extend here rather than in per-call code.
+SKILL_DICTIONARY: dict[str, tuple[str, ...]] = {
+    "active directory": ("ad ds", "azure ad", "entra id"),
+    "ansible": (),
+    "aws": ("amazon web services",),
+    "azure": ("microsoft azure",),
+    "bash": ("shell scripting",),
+    "bgp": ("border gateway protocol",),
+    "c#": (),
+    "c++": (),
+    "ccna": (),
+    "ccnp": (),
+    "cisco": (),
+    "comptia a+": ("a+ certification",),
+    "comptia network+": ("network+",),
+    "comptia security+": ("security+",),
+    "customer service": ("customer support",),
+    "dhcp": (),
+    "dns": ("domain name system",),
+    "docker": (),
+    "eigrp": (),
+    "firewalls": ("firewall",),
+    "fortinet": ("fortigate",),
+    "gcp": ("google cloud", "google cloud platform"),
+    "git": (),
+    "group policy": ("gpo",),
+    "help desk": ("helpdesk", "service desk"),
+    "intune": ("microsoft intune",),
+    "itil": (),
+    "java": (),
+    "javascript": ("js",),
+    "jira": (),
+    "juniper": ("junos",),
+    "kubernetes": ("k8s",),
+    "lan/wan": ("lan", "wan"),
+    "linux": ("rhel", "ubuntu", "centos"),
+    "macos": ("mac os", "os x"),
+    "microsoft 365": ("office 365", "o365", "m365"),
+    # Not bare "excel": as a verb it is in half of all job ads.
+    "microsoft excel": ("ms excel", "excel spreadsheets"),
+    "mpls": (),
+    "networking": ("computer networking",),
+    "ospf": (),
+    "palo alto": ("palo alto networks", "pan-os"),
+    "powershell": (),
+    "python": (),
+    "routing": (),
+    "sccm": ("mecm", "configuration manager"),
+    "servicenow": ("service now",),
+    "siem": (),
+    "splunk": (),
+    "sql": ("mysql", "postgresql", "sql server"),
+    "switching": (),
+    "tcp/ip": ("tcp", "tcp-ip"),
+    "terraform": (),
+    "ticketing": ("ticketing systems",),
+    "troubleshooting": ("troubleshoot",),
+    "vlan": ("vlans",),
+    "vmware": ("vsphere", "esxi"),
+    "voip": (),
+    "vpn": ("vpns",),
+    "windows": ("windows 10", "windows 11"),
+    "windows server": (),
+    "wireshark": (),
+    "wireless": ("wi-fi", "wifi", "wlan"),
+}
+
+
+class SkillExtractor:
+    """Finds dictionary skills (and their synonyms) in text and reports canonical names."""
+
+    def __init__(self, dictionary: dict[str, tuple[str, ...]] | None = None) -> None:
+        dictionary = dictionary if dictionary is not None else SKILL_DICTIONARY
+        self._matcher = KeywordMatcher(
+            {skill: [skill, *synonyms] for skill, synonyms in dictionary.items()}, credit_prefixes=False
+        )
+
+    def extract(self, text: str) -> list[str]:
+        return sorted(normalize_keyword(skill) for skill in self._matcher.scan(text))
+
+
+@lru_cache(maxsize=1)
+def default_extractor() -> SkillExtractor:
+    return SkillExtractor()
+
+
+def extract_skills(text: str) -> list[str]:
+    """Canonical dictionary skills mentioned in ``text``, sorted."""
+    return default_extractor().extract(text)
+
+
+def canonical_skill(name: str) -> str:
+    """The dictionary name for ``name`` or one of its synonyms; unknown names are only normalized."""
+    key = normalize_keyword(name)
+    for skill, synonyms in SKILL_DICTIONARY.items():
+        if key == skill or key in synonyms:
+            return skill
+    return key
@@ -7,13 +7,32 @@ from jobpipeline.utils.config import load_config
 from jobpipeline.utils.logging_utils import setup_logging
 
 
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run JobPipeline pipeline")
     parser.add_argument("--config", default="config.yaml")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("run", help="search, collect, score and export (default)")
+    rescore = commands.add_parser("rescore", help="rescore stored jobs against the current profiles, offline")
+    rescore.add_argument("--chunk-size", type=positive_int, default=500)
     args = parser.parse_args()
     setup_logging()
     config = load_config(args.config)
-    counts = PipelineOrchestrator(config).run()
+    orchestrator = PipelineOrchestrator(config)
+    try:
+        if args.command == "rescore":
+            counts = orchestrator.rescore(chunk_size=args.chunk_size)
+            print("Rescore complete:", counts)
+            return
+        counts = orchestrator.run()
+    finally:
+        orchestrator.close()
     print("Run complete:", counts)
 
 
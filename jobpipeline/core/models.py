@@ -28,6 +28,8 @@ class SourceItem:
     source_name: str
     source_domain: str
     snippet_meta: dict[str, Any] = field(default_factory=dict)
+    # Set by adapters that already have the full posting (ATS JSON APIs); the collector skips the fetch.
+    job: CanonicalJob | None = None
 
 
 @dataclass(slots=True)
@@ -65,3 +67,23 @@ class CanonicalJob:
     @staticmethod
     def now_iso() -> str:
         return datetime.utcnow().replace(microsecond=0).isoformat()
+
+
+@dataclass(slots=True)
+class FitResult:
+    """One job's fit against one profile; ``jobs`` holds the first profile's, ``job_scores`` all of them."""
+
+    profile: str
+    fit_score: int
+    fit_grade: str
+    fit_notes: str
+    missing_must_have: list[str]
+    flags: list[str]
+
+    def apply(self, job: CanonicalJob) -> CanonicalJob:
+        job.fit_score = self.fit_score
+        job.fit_grade = self.fit_grade
+        job.fit_notes = self.fit_notes
+        job.missing_must_have = list(self.missing_must_have)
+        job.flags = list(self.flags)
+        return job
@@ -1,72 +1,479 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+import sqlite3
+from collections.abc import Iterable
+from dataclasses import asdict, replace
+from datetime import datetime, timedelta
 
 from jobpipeline.collectors.job_collector import JobCollector
-from jobpipeline.core.models import SearchProfile
+from jobpipeline.collectors.parsers import get_parser_backend
+from jobpipeline.core.models import CanonicalJob, FitResult, SearchProfile, SourceItem
+from jobpipeline.core.streaming import StreamingPipeline
+from jobpipeline.dedupe.identity import IdentityIndex
+from jobpipeline.dedupe.minhash import MinHasher
 from jobpipeline.dedupe.service import DedupeService
-from jobpipeline.export.excel_sync import ExcelSync
-from jobpipeline.scoring.service import FitScorer
+from jobpipeline.export.excel_sync import PRIMARY_SHEET, ExcelSync, profile_sheet_names
+from jobpipeline.scoring.prefilter import SnippetFilter
+from jobpipeline.scoring.service import FitScorer, profile_fingerprint
+from jobpipeline.sources.base import item_published
 from jobpipeline.sources.discovery import DisabledProvider
-from jobpipeline.sources.greenhouse import GreenhousePublicBoardAdapter
-from jobpipeline.sources.lever import LeverPublicBoardAdapter
+from jobpipeline.sources.greenhouse import GreenhouseJobBoardApiAdapter, GreenhousePublicBoardAdapter
+from jobpipeline.sources.lever import LeverPostingsApiAdapter, LeverPublicBoardAdapter
 from jobpipeline.sources.manager import SourceManager
 from jobpipeline.sources.rss import GenericRSSAdapter
+from jobpipeline.storage.domain_health import DomainHealthStore
+from jobpipeline.storage.http_cache import HttpCache
+from jobpipeline.storage.near_duplicates import NearDuplicateIndex
 from jobpipeline.storage.repository import JobRepository
+from jobpipeline.storage.term_index import TermIndex
+from jobpipeline.storage.watermarks import WatermarkStore
+from jobpipeline.utils.http import HttpClientFactory, build_circuit_breaker, http_settings
+from jobpipeline.utils.text import canonicalize_url, parse_feed_date
 
 logger = logging.getLogger(__name__)
 
 
 class PipelineOrchestrator:
+    # Scored jobs are written this many at a time in the batch path (one transaction each).
+    store_batch_size = 500
+
     def __init__(self, config: dict, repository: JobRepository | None = None) -> None:
         self.config = config
         self.repository = repository or JobRepository()
+        self.http_settings = http_settings(config)
+        self.http_cache = (
+            HttpCache(self.repository.db_path, max_bytes=int(self.http_settings["cache_max_mb"] * 1024 * 1024))
+            if self.http_settings["cache_enabled"]
+            else None
+        )
+        self.health_store = DomainHealthStore(self.repository.db_path)
+        self.breaker = build_circuit_breaker(self.http_settings, self.health_store)
+        self.http = HttpClientFactory(self.http_settings, self.http_cache, self.breaker)
+        # One pooled client shared by every adapter and the collector; closed by close().
+        self.http_client = self.http.client()
+        self.parser = get_parser_backend(config["collector"].get("parser", "auto"))
         self.collector = JobCollector(
             per_domain_delay_seconds=config["collector"]["per_domain_delay_seconds"],
             max_retries=config["collector"]["max_retries"],
+            concurrency=config["collector"].get("concurrency", 8),
+            client=self.http_client,
+            http=self.http,
+            parser=self.parser,
+            parse_workers=config["collector"].get("parse_workers", 0),
+            backoff_base_seconds=config["collector"].get("backoff_base_seconds", 1.0),
+            backoff_max_seconds=config["collector"].get("backoff_max_seconds", 30.0),
+            max_delay_seconds=config["collector"].get("max_delay_seconds", 120.0),
         )
         self.scorer = FitScorer()
+        self._pending: list[tuple[CanonicalJob, list[FitResult]]] = []
+        self._pending_sightings: list[tuple[str, str, str, str]] = []
+        self.identities = IdentityIndex(self.repository)
+        dedupe = config.get("dedupe", {})
+        self.near_duplicates = (
+            NearDuplicateIndex(
+                self.repository.db_path,
+                MinHasher(num_perm=dedupe.get("minhash_permutations", 64), bands=dedupe.get("lsh_bands", 16)),
+                threshold=dedupe.get("near_duplicate_threshold", 0.8),
+            )
+            if dedupe.get("near_duplicates", False)
+            else None
+        )
+        self.watermarks = WatermarkStore(self.repository.db_path)
+        self.term_index = TermIndex(self.repository.db_path)
+        if self.term_index.is_empty():
+            for jobs in self.repository.iter_job_chunks():
+                self.term_index.add_many((job.job_id, self._index_text(job)) for job in jobs)
+
+    def close(self) -> None:
+        self.http_client.close()
+        self.breaker.save()
+        self.health_store.close()
+        if self.http_cache is not None:
+            self.http_cache.close()
+        if self.near_duplicates is not None:
+            self.near_duplicates.close()
+        self.term_index.close()
+        self.watermarks.close()
 
     def _profile(self) -> SearchProfile:
-        payload = self.config["profiles"][0]
-        return SearchProfile(**payload)
+        return self._profiles()[0]
+
+    def _profiles(self) -> list[SearchProfile]:
+        return [SearchProfile(**payload) for payload in self.config["profiles"]]
+
+    @staticmethod
+    def _search_profile(profiles: list[SearchProfile]) -> SearchProfile:
+        """One profile whose titles cover every profile, so sources are searched once per run."""
+        if len(profiles) == 1:
+            return profiles[0]
+        return replace(
+            profiles[0],
+            target_titles=list(dict.fromkeys(title for p in profiles for title in p.target_titles)),
+            adjacent_titles=list(dict.fromkeys(title for p in profiles for title in p.adjacent_titles)),
+        )
+
+    def _resolve_identity(self, job: CanonicalJob, stored_ids: set[str]) -> str | None:
+        """Give ``job`` its stable id; if that posting was already stored this run, merge into it and return its id."""
+        stable_id = self.identities.resolve(job)
+        if stable_id in stored_ids:
+            # The same posting reached under two URLs in one run (redirect or shared ATS id).
+            self._merge_into(stable_id, job)
+            return stable_id
+        if stable_id != job.job_id and self.repository.is_merged_into(job.job_id, stable_id):
+            # A repost folded in an earlier run: a sighting of the stored job, already counted once.
+            self._flush_stored()
+            self.repository.merge_sighting(stable_id, job.source_name, job.source_domain, job.last_seen, repost=False)
+            return stable_id
+        job.job_id = stable_id
+        return None
+
+    def _merge_near_duplicate(self, job: CanonicalJob) -> str | None:
+        """Fold ``job`` into a stored near-identical posting (new URL, same role); returns that job's id."""
+        if self.near_duplicates is None or job.fetch_status != "success":
+            return None
+        signature = self.near_duplicates.hasher.signature(job)
+        # Jobs already stored under their own id keep their row; only new postings are folded.
+        match = None if self.near_duplicates.contains(job.job_id) else self.near_duplicates.find(signature, job.job_id)
+        if match is None:
+            self.near_duplicates.add(job.job_id, signature)
+            return None
+        target_id, similarity = match
+        logger.info(
+            "near_duplicate_merged",
+            extra={"extra_fields": {"job_id": job.job_id, "into": target_id, "similarity": round(similarity, 3)}},
+        )
+        self._merge_into(target_id, job)
+        # The repost's URL and ATS keys were recorded against its own, never stored, id.
+        self.identities.reassign(job.job_id, target_id)
+        return target_id
+
+    def _merge_into(self, target_id: str, job: CanonicalJob) -> None:
+        # The target may still be waiting in the current write batch.
+        self._flush_stored()
+        self.repository.merge_duplicate(target_id, job)
+
+    def _fingerprints(self, profiles: list[SearchProfile]) -> dict[str, str]:
+        mode = self.config["filters"]["seniority_mode"]
+        return {profile.name: profile_fingerprint(profile, mode) for profile in profiles}
+
+    def _invalidate_fingerprints(self, profiles: list[SearchProfile]) -> None:
+        """A run scoring with a changed profile leaves the corpus mixed, so its next rescore must not be skipped."""
+        stored = self.repository.get_fingerprints()
+        current = self._fingerprints(profiles)
+        stale = [name for name, fingerprint in current.items() if name in stored and stored[name] != fingerprint]
+        if stale:
+            self.repository.clear_fingerprints(stale)
+
+    def _store_scored(
+        self,
+        job: CanonicalJob,
+        profiles: list[SearchProfile],
+        results: list[FitResult] | None = None,
+        defer: bool = False,
+    ) -> None:
+        """Score ``job`` against every profile (unless already scored); ``jobs`` keeps the first profile's fit.
+
+        With ``defer`` the write waits for a batch of ``store_batch_size``; call :meth:`_flush_stored` after.
+        """
+        if results is None:
+            results = self.scorer.score_profiles(job, profiles, self.config["filters"]["seniority_mode"])
+        self._pending.append((results[0].apply(job), results))
+        if not defer or len(self._pending) >= self.store_batch_size:
+            self._flush_stored()
+
+    def _flush_stored(self) -> None:
+        """Write the pending batch, with the identity keys and sightings gathered for it, in one transaction."""
+        batch, self._pending = self._pending, []
+        sightings, self._pending_sightings = self._pending_sightings, []
+        self.repository.upsert_jobs([job for job, _ in batch], self.identities.take_new(), sightings)
+        if not batch:
+            return
+        self.repository.upsert_scores_many([(job.job_id, results) for job, results in batch])
+        self.term_index.add_many((job.job_id, self._index_text(job)) for job, _ in batch)
+
+    def _discard_pending(self) -> None:
+        self._pending.clear()
+        self._pending_sightings.clear()
+        self.identities.take_new()
+
+    @staticmethod
+    def _index_text(job: CanonicalJob) -> str:
+        return f"{job.title}\n{job.description_raw}"
+
+    def similarity(self, profile_name: str | None = None) -> dict[str, float]:
+        """BM25 similarity (0-100) of stored jobs to a profile's resume skills and target titles."""
+        profiles = self._profiles()
+        profile = next((p for p in profiles if p.name == profile_name), profiles[0])
+        return self.term_index.similarity(" ".join([*profile.master_resume_skills, *profile.target_titles]))
+
+    def _export(self, jobs: Iterable[CanonicalJob], job_ids: list[str], profiles: list[SearchProfile]) -> int:
+        """Sync the first profile to the ``Jobs`` sheet and every other profile to a sheet of its own."""
+        sheets: dict[str, Iterable[CanonicalJob]] = {PRIMARY_SHEET: jobs}
+        secondary = profiles[1:]
+        for profile, sheet in zip(secondary, profile_sheet_names([profile.name for profile in secondary])):
+            sheets[sheet] = self.repository.iter_jobs(job_ids, profile=profile.name)
+        return ExcelSync(self.config["excel_path"]).sync_sheets(sheets)[PRIMARY_SHEET]
 
     def _source_manager(self) -> SourceManager:
-        adapters = [GenericRSSAdapter(feed["name"], feed["url"]) for feed in self.config["sources"]["rss_feeds"]]
-        adapters.extend(GreenhousePublicBoardAdapter(url) for url in self.config["sources"].get("greenhouse_boards", []))
-        adapters.extend(LeverPublicBoardAdapter(url) for url in self.config["sources"].get("lever_boards", []))
+        client = self.http_client
+        adapters = [GenericRSSAdapter(feed["name"], feed["url"], client) for feed in self.config["sources"]["rss_feeds"]]
+        adapters.extend(GreenhousePublicBoardAdapter(url, client) for url in self.config["sources"].get("greenhouse_boards", []))
+        adapters.extend(LeverPublicBoardAdapter(url, client) for url in self.config["sources"].get("lever_boards", []))
+        adapters.extend(
+            GreenhouseJobBoardApiAdapter(token, client, self.parser)
+            for token in self.config["sources"].get("greenhouse_api_boards", [])
+        )
+        adapters.extend(
+            LeverPostingsApiAdapter(company, client, self.parser)
+            for company in self.config["sources"].get("lever_api_boards", [])
+        )
         provider = DisabledProvider()
-        return SourceManager(adapters, self.config["filters"]["exclude_domains"], provider)
+        limits = self.config["limits"]
+        now = datetime.utcnow().replace(microsecond=0).isoformat()
+        return SourceManager(
+            adapters,
+            self.config["filters"]["exclude_domains"],
+            provider,
+            deadline_seconds=limits.get("adapter_deadline_seconds", 60),
+            max_workers=limits.get("search_workers", 8),
+            watermarks=self.watermarks.load() if self.config["sources"].get("incremental", False) else None,
+            cutoff=self._window_cutoff(now),
+        )
+
+    def _window_cutoff(self, now: str) -> str | None:
+        """Oldest publish date still inside the widest profile ``time_window_days`` (``filters.enforce_time_window``)."""
+        if not self.config["filters"].get("enforce_time_window", False):
+            return None
+        days = max(profile.time_window_days for profile in self._profiles())
+        return (datetime.fromisoformat(now) - timedelta(days=days)).isoformat()
+
+    @staticmethod
+    def _out_of_window(job: CanonicalJob, cutoff: str | None) -> bool:
+        if cutoff is None:
+            return False
+        posted = parse_feed_date(job.posted_date or "")
+        return posted is not None and posted < cutoff
+
+    @staticmethod
+    def _watermark_entry(item: SourceItem) -> tuple[str | None, str, str | None]:
+        return item.snippet_meta.get("watermark_key"), canonicalize_url(item.job_url), item_published(item)
+
+    def _record_watermarks(self, entries: Iterable[tuple[str | None, str, str | None]], failed: set[str], now: str) -> None:
+        """Mark this run's search results as seen per source; failed fetches stay unmarked and are retried."""
+        if not self.config["sources"].get("incremental", False):
+            return
+        marks: dict[str, tuple[list[str], str | None]] = {}
+        for source, key, published in entries:
+            if source is None or key in failed:
+                continue
+            keys, newest = marks.get(source, ([], None))
+            keys.append(key)
+            if published and (newest is None or published > newest):
+                newest = published
+            marks[source] = (keys, newest)
+        for source, (keys, newest) in marks.items():
+            self.watermarks.record(source, keys, newest, now)
+        retention = self.config["sources"].get("watermark_retention_days", 30)
+        self.watermarks.prune((datetime.fromisoformat(now) - timedelta(days=retention)).isoformat())
+
+    def _fresh_cutoff(self, now: str) -> str | None:
+        ttl_hours = self.config["collector"].get("fresh_ttl_hours", 0)
+        if not ttl_hours:
+            return None
+        return (datetime.fromisoformat(now) - timedelta(hours=ttl_hours)).isoformat()
+
+    def _reuse_row(self, row: sqlite3.Row | None, item: SourceItem, now: str, cutoff: str) -> CanonicalJob | None:
+        """The stored job for ``row`` if it can stand in for fetching ``item`` again, else ``None``."""
+        if not row or row["fetch_status"] != "success" or (row["collected_at"] or "") < cutoff:
+            return None
+        job = JobRepository.row_to_job(row)
+        job.source_name = item.source_name
+        job.source_domain = item.source_domain
+        job.last_seen = now
+        job.repost_count += 1
+        return job
+
+    def _reuse_fresh(
+        self, items: list[SourceItem], now: str
+    ) -> tuple[list[SourceItem], list[tuple[SourceItem, CanonicalJob]]]:
+        """Split items into ones to fetch and stored jobs still within ``collector.fresh_ttl_hours``.
+
+        Known canonical URLs are looked up in one batch rather than one query per item.
+        """
+        cutoff = self._fresh_cutoff(now)
+        if cutoff is None:
+            return items, []
+        # Items already complete from an ATS API go to the collector, which returns them without fetching.
+        pending = [item for item in items if item.job is None]
+        known = self.repository.get_jobs_by_canonical_urls([canonicalize_url(item.job_url) for item in pending])
+        to_fetch: list[SourceItem] = []
+        reused: list[tuple[SourceItem, CanonicalJob]] = []
+        for item in items:
+            row = known.get(canonicalize_url(item.job_url)) if item.job is None else None
+            job = self._reuse_row(row, item, now, cutoff)
+            if job is None:
+                to_fetch.append(item)
+            else:
+                reused.append((item, job))
+        return to_fetch, reused
+
+    def _snippet_filter(self, profiles: list[SearchProfile]) -> SnippetFilter | None:
+        filters = self.config["filters"]
+        if not filters.get("snippet_prefilter", True):
+            return None
+        return SnippetFilter(
+            profiles,
+            seniority_mode=filters["seniority_mode"],
+            exclude_keywords=filters.get("exclude_keywords", []),
+            require_title_match=filters.get("require_title_match", False),
+        )
+
+    @staticmethod
+    def _count_rejection(counts: dict[str, int], reason: str) -> None:
+        counts["prefiltered"] = counts.get("prefiltered", 0) + 1
+        counts[f"prefiltered_{reason}"] = counts.get(f"prefiltered_{reason}", 0) + 1
+
+    def _prefilter(self, items: list[SourceItem], profiles: list[SearchProfile]) -> tuple[list[SourceItem], dict[str, int]]:
+        """Drop items whose snippet title is certain to be rejected, before anything is fetched."""
+        counts = {"prefiltered": 0}
+        snippet_filter = self._snippet_filter(profiles)
+        if snippet_filter is None:
+            return items, counts
+        kept: list[SourceItem] = []
+        for item in items:
+            reason = snippet_filter.reject(item)
+            if reason is None:
+                kept.append(item)
+            else:
+                self._count_rejection(counts, reason)
+        return kept, counts
 
     def run(self) -> dict[str, int]:
         started = datetime.utcnow().replace(microsecond=0).isoformat()
         run_id = self.repository.create_run(started)
-        profile = self._profile()
+        profiles = self._profiles()
         manager = self._source_manager()
         max_jobs = self.config["limits"]["max_jobs_per_run"]
 
-        found = manager.search(profile, max_jobs=max_jobs)
-        collected = [self.collector.collect(item) for item in found]
+        self.collector.parse_paths.clear()
+        self.identities.clear()
+        self._discard_pending()
+        self._invalidate_fingerprints(profiles)
+        if self.config["collector"].get("streaming", False):
+            counts = StreamingPipeline(self, manager, profiles, started).run(run_id, max_jobs)
+            return self._finish(run_id, counts)
+
+        found, source_stats = manager.search_with_stats(self._search_profile(profiles), max_jobs=max_jobs)
+        logger.info("search_completed", extra={"extra_fields": {"sources": [asdict(stat) for stat in source_stats]}})
+        unique_items, duplicates = DedupeService.dedupe_items(found)
+        skipped = len(found) - len(unique_items)
+        unique_items, prefiltered = self._prefilter(unique_items, profiles)
+        to_fetch, reused = self._reuse_fresh(unique_items, started)
+        if self.config["collector"].get("async_mode", False):
+            fetched = self.collector.collect_many(to_fetch)
+        else:
+            fetched = [self.collector.collect(item) for item in to_fetch]
+        sightings: dict[str, list[SourceItem]] = {}
+        collected: list[CanonicalJob] = []
+        failed_keys = {canonicalize_url(item.job_url) for item, job in zip(to_fetch, fetched) if job.fetch_status != "success"}
+        for item, job in [*reused, *zip(to_fetch, fetched)]:
+            extra = duplicates.get(canonicalize_url(item.job_url), [])
+            DedupeService.merge_sightings(job, extra)
+            sightings.setdefault(job.job_id, []).extend(extra)
+            collected.append(job)
         unique_jobs, merged = DedupeService.dedupe(collected)
+        merged += skipped
 
         failed = 0
-        for job in unique_jobs:
-            if job.fetch_status != "success":
-                failed += 1
-                self.repository.add_run_error(run_id, job.source_domain, job.failure_reason or "unknown")
-            scored = self.scorer.score(job, profile, self.config["filters"]["seniority_mode"])
-            self.repository.upsert_job(scored)
-
-        exported = ExcelSync(self.config["excel_path"]).sync(unique_jobs)
-        finished = datetime.utcnow().replace(microsecond=0).isoformat()
+        errors: list[tuple[str, str, str]] = []
+        near_duplicates = 0
+        out_of_window = 0
+        cutoff = self._window_cutoff(started)
+        stored_jobs: list[CanonicalJob] = []
+        stored_ids: set[str] = set()
+        self.identities.prefetch(unique_jobs)
+        scores = self.scorer.score_many(unique_jobs, profiles, self.config["filters"]["seniority_mode"])
+        try:
+            for job, results in zip(unique_jobs, scores):
+                if job.fetch_status != "success":
+                    failed += 1
+                    errors.append((job.source_domain, job.failure_reason or "unknown", ""))
+                if self._out_of_window(job, cutoff):
+                    out_of_window += 1
+                    continue
+                original_id = job.job_id
+                if self._resolve_identity(job, stored_ids) is not None:
+                    merged += 1
+                    continue
+                if self._merge_near_duplicate(job) is not None:
+                    near_duplicates += 1
+                    continue
+                self._store_scored(job, profiles, results, defer=True)
+                stored_jobs.append(job)
+                stored_ids.add(job.job_id)
+                folded = [seen for job_id in (original_id, *job.merged_from) for seen in sightings.get(job_id, [])]
+                self._pending_sightings.extend(
+                    (job.job_id, seen.source_name, seen.source_domain, job.last_seen) for seen in folded
+                )
+            self._flush_stored()
+        finally:
+            # A failed run must not leave its unwritten batch for the next run to store.
+            self._discard_pending()
+        self.repository.add_run_errors(run_id, errors)
+        self._record_watermarks((self._watermark_entry(item) for item in found), failed_keys, started)
+        exported = self._export(stored_jobs, [job.job_id for job in stored_jobs], profiles)
         counts = {
             "found": len(found),
             "collected": len(collected),
+            "reused": len(reused),
+            "skipped_duplicates": skipped,
             "failed": failed,
             "merged": merged,
+            "near_duplicates": near_duplicates,
+            "out_of_window": out_of_window,
             "exported": exported,
+            **prefiltered,
         }
+        return self._finish(run_id, counts)
+
+    def rescore(self, chunk_size: int = 500) -> dict[str, int]:
+        """Rescore the stored corpus against the current profiles without touching the network.
+
+        Only profiles whose fingerprint changed since the last rescore are scored, and only scores
+        that differ are written, one transaction per chunk.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        profiles = self._profiles()
+        primary = profiles[0].name
+        fingerprints = self._fingerprints(profiles)
+        stored = self.repository.get_fingerprints()
+        stale = [profile for profile in profiles if stored.get(profile.name) != fingerprints[profile.name]]
+        counts = {"profiles": len(stale), "scanned": 0, "changed": 0}
+        if stale:
+            mode = self.config["filters"]["seniority_mode"]
+            for jobs in self.repository.iter_job_chunks(chunk_size):
+                job_ids = [job.job_id for job in jobs]
+                current = self.repository.get_scores(job_ids, primary)
+                changed = [
+                    (job_id, result)
+                    for job_id, results in zip(job_ids, self.scorer.score_many(jobs, stale, mode))
+                    for result in results
+                    if current.get((job_id, result.profile)) != self.repository.score_values(result)
+                ]
+                self.repository.update_scores(changed, primary)
+                counts["scanned"] += len(jobs)
+                counts["changed"] += len(changed)
+            finished = datetime.utcnow().replace(microsecond=0).isoformat()
+            self.repository.set_fingerprints({profile.name: fingerprints[profile.name] for profile in stale}, finished)
+        logger.info("rescore_completed", extra={"extra_fields": counts})
+        return counts
+
+    def _finish(self, run_id: int, counts: dict[str, int]) -> dict[str, int]:
+        counts.update({f"parsed_{path}": n for path, n in self.collector.parse_paths.items()})
+        finished = datetime.utcnow().replace(microsecond=0).isoformat()
         self.repository.finish_run(run_id, finished, counts)
+        self.breaker.save()
         logger.info("run_completed", extra={"extra_fields": counts})
         return counts
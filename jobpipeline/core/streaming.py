@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from collections.abc import Iterator
+from contextlib import closing
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+
+from jobpipeline.core.models import SearchProfile, SourceItem
+from jobpipeline.dedupe.service import DedupeService
+from jobpipeline.sources.manager import AdapterStats, SourceManager
+from jobpipeline.storage.repository import JobRepository
+from jobpipeline.utils.text import canonicalize_url
+
+if TYPE_CHECKING:
+    from jobpipeline.core.orchestrator import PipelineOrchestrator
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class _Stopped(Exception):
+    """Raised inside a stage when another stage failed and the run is being torn down."""
+
+
+@dataclass(slots=True)
+class _Sighting:
+    """A search result whose canonical URL was already planned earlier in the run."""
+
+    key: str
+    item: SourceItem
+
+
+class StreamingPipeline:
+    """Search, collect, dedupe, score and store as connected stages (``collector.streaming``).
+
+    Each stage runs in its own thread and hands work on through a bounded queue, so a slow stage
+    stalls the ones before it instead of letting results pile up; every job is committed as soon as
+    it arrives. Only canonical URLs and job ids are kept for the whole run, never descriptions.
+    The store stage runs on the calling thread because it owns the repository's SQLite connection.
+    """
+
+    def __init__(
+        self, orchestrator: PipelineOrchestrator, manager: SourceManager, profiles: list[SearchProfile], started: str
+    ) -> None:
+        self.orchestrator = orchestrator
+        self.manager = manager
+        self.profiles = profiles
+        self.started = started
+        self.queue_size = max(1, int(orchestrator.config["collector"].get("stream_queue_size", 64)))
+        self.stop = threading.Event()
+        self.errors: list[BaseException] = []
+        self.counts = dict.fromkeys(
+            ("found", "collected", "reused", "skipped_duplicates", "prefiltered", "failed", "merged", "near_duplicates", "out_of_window"), 0
+        )
+        # Small (source, key, published) tuples for the watermark update, and keys whose fetch failed.
+        self.seen: list[tuple[str | None, str, str | None]] = []
+        self.failed_keys: set[str] = set()
+
+    def run(self, run_id: int, max_jobs: int) -> dict[str, int]:
+        found_q: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        fetch_q: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        store_q: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        source_stats: list[AdapterStats] = []
+        stages = [
+            threading.Thread(target=self._guard, args=(self._search, max_jobs, source_stats, found_q), name="stream-search"),
+            threading.Thread(target=self._guard, args=(self._plan, found_q, fetch_q, store_q), name="stream-plan"),
+            threading.Thread(target=self._guard, args=(self._collect, fetch_q, store_q), name="stream-collect"),
+        ]
+        for stage in stages:
+            stage.start()
+        try:
+            job_ids = self._store(run_id, store_q)
+        except BaseException as exc:
+            self.errors.append(exc)
+            raise
+        finally:
+            self.stop.set()
+            for stage in stages:
+                stage.join()
+        if self.errors:
+            raise self.errors[0]
+
+        self.orchestrator._record_watermarks(self.seen, self.failed_keys, self.started)
+        logger.info("search_completed", extra={"extra_fields": {"sources": [asdict(stat) for stat in source_stats]}})
+        primary = self.orchestrator.repository.iter_jobs(job_ids)
+        self.counts["exported"] = self.orchestrator._export(primary, job_ids, self.profiles)
+        return self.counts
+
+    def _guard(self, stage, *args) -> None:  # type: ignore[no-untyped-def]
+        try:
+            stage(*args)
+        except _Stopped:
+            pass
+        except BaseException as exc:  # noqa: BLE001
+            self.errors.append(exc)
+            self.stop.set()
+
+    def _put(self, target: queue.Queue, value: object) -> None:
+        while True:
+            if self.stop.is_set():
+                raise _Stopped
+            try:
+                target.put(value, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _drain(self, source: queue.Queue) -> Iterator:
+        while True:
+            if self.stop.is_set():
+                return
+            try:
+                value = source.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if value is _DONE:
+                return
+            yield value
+
+    def _search(self, max_jobs: int, source_stats: list[AdapterStats], found_q: queue.Queue) -> None:
+        try:
+            search_profile = self.orchestrator._search_profile(self.profiles)
+            with closing(self.manager.iter_search(search_profile, max_jobs, source_stats)) as items:
+                for item in items:
+                    self.counts["found"] += 1
+                    self.seen.append(self.orchestrator._watermark_entry(item))
+                    self._put(found_q, item)
+        finally:
+            self._put(found_q, _DONE)
+
+    def _plan(self, found_q: queue.Queue, fetch_q: queue.Queue, store_q: queue.Queue) -> None:
+        """Pre-fetch dedupe, snippet rejection and fresh-TTL reuse, one item at a time."""
+        cutoff = self.orchestrator._fresh_cutoff(self.started)
+        snippet_filter = self.orchestrator._snippet_filter(self.profiles)
+        planned: set[str] = set()
+        # SQLite connections are bound to their thread, so lookups use a connection of their own.
+        reader = JobRepository(self.orchestrator.repository.db_path) if cutoff else None
+        try:
+            for item in self._drain(found_q):
+                key = canonicalize_url(item.job_url)
+                if key in planned:
+                    self.counts["skipped_duplicates"] += 1
+                    self._put(store_q, _Sighting(key, item))
+                    continue
+                planned.add(key)
+                reason = snippet_filter.reject(item) if snippet_filter is not None else None
+                if reason is not None:
+                    self.orchestrator._count_rejection(self.counts, reason)
+                    continue
+                if reader is not None and cutoff is not None and item.job is None:
+                    job = self.orchestrator._reuse_row(reader.get_job_by_canonical_url(key), item, self.started, cutoff)
+                    if job is not None:
+                        self.counts["reused"] += 1
+                        self._put(store_q, (item, job))
+                        continue
+                self._put(fetch_q, item)
+        finally:
+            if reader is not None:
+                reader.close()
+            self._put(fetch_q, _DONE)
+
+    def _collect(self, fetch_q: queue.Queue, store_q: queue.Queue) -> None:
+        try:
+            self.orchestrator.collector.collect_stream(
+                self._drain(fetch_q), lambda item, job: self._put(store_q, (item, job))
+            )
+        finally:
+            self._put(store_q, _DONE)
+
+    def _store(self, run_id: int, store_q: queue.Queue) -> list[str]:
+        repository = self.orchestrator.repository
+        stored: dict[str, str] = {}  # search-side canonical URL -> job_id
+        stored_ids: set[str] = set()
+        pending: dict[str, list[SourceItem]] = {}  # sightings that arrived before their job
+        job_ids: list[str] = []
+        errors: list[tuple[str, str, str]] = []
+        cutoff = self.orchestrator._window_cutoff(self.started)
+        for message in self._drain(store_q):
+            if isinstance(message, _Sighting):
+                self.counts["merged"] += 1
+                if message.key in stored:
+                    item = message.item
+                    repository.merge_sighting(stored[message.key], item.source_name, item.source_domain, self.started)
+                else:
+                    pending.setdefault(message.key, []).append(message.item)
+                continue
+
+            item, job = message
+            self.counts["collected"] += 1
+            key = canonicalize_url(item.job_url)
+            extra = pending.pop(key, [])
+            if job.fetch_status != "success":
+                self.counts["failed"] += 1
+                errors.append((job.source_domain, job.failure_reason or "unknown", ""))
+                self.failed_keys.add(key)
+            if self.orchestrator._out_of_window(job, cutoff):
+                self.counts["out_of_window"] += 1
+                continue
+            existing_id = self.orchestrator._resolve_identity(job, stored_ids)
+            if existing_id is not None:
+                self.counts["merged"] += 1
+                stored[key] = existing_id
+                for seen in extra:
+                    repository.merge_sighting(stored[key], seen.source_name, seen.source_domain, job.last_seen)
+                continue
+            DedupeService.merge_sightings(job, extra)
+            target_id = self.orchestrator._merge_near_duplicate(job)
+            if target_id is not None:
+                self.counts["near_duplicates"] += 1
+                stored[key] = target_id
+                continue
+            self.orchestrator._store_scored(job, self.profiles)
+            repository.add_sightings(job.job_id, [(seen.source_name, seen.source_domain) for seen in extra], job.last_seen)
+            stored[key] = job.job_id
+            stored_ids.add(job.job_id)
+            job_ids.append(job.job_id)
+        repository.add_run_errors(run_id, errors)
+        return job_ids
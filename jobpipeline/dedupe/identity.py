@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from jobpipeline.core.models import CanonicalJob
+from jobpipeline.storage.repository import JobRepository
+from jobpipeline.utils.text import identity_keys
+
+
+class IdentityIndex:
+    """Maps identity keys to the stable ``job_id`` first assigned to a posting.
+
+    ``job_id`` hashes title and location, so an edited title would otherwise fork the posting's
+    history. Lookups hit a per-run dict first and the ``job_identity`` table (primary key) on a miss.
+    Keys first seen this run stay in memory until :meth:`take_new` hands them to a batch write.
+    """
+
+    def __init__(self, repository: JobRepository) -> None:
+        self.repository = repository
+        self._cache: dict[str, str] = {}
+        self._new: dict[str, str] = {}
+
+    def prefetch(self, jobs: list[CanonicalJob]) -> None:
+        """Warm the cache for a whole batch with one query per 500 keys."""
+        keys = [key for job in jobs for key in identity_keys(job.canonical_url) if key not in self._cache]
+        self._cache.update(self.repository.lookup_identities(keys))
+
+    def resolve(self, job: CanonicalJob) -> str:
+        """Stable id for ``job`` (its own id if the posting is new); remembers every key it is known by."""
+        keys = identity_keys(job.canonical_url)
+        missing = [key for key in keys if key not in self._cache]
+        if missing:
+            self._cache.update(self.repository.lookup_identities(missing))
+        stable_id = next((self._cache[key] for key in keys if key in self._cache), job.job_id)
+        new_keys = [key for key in keys if key not in self._cache]
+        self._cache.update(dict.fromkeys(new_keys, stable_id))
+        self._new.update(dict.fromkeys(new_keys, stable_id))
+        return stable_id
+
+    def take_new(self) -> list[tuple[str, str]]:
+        """``(identity_key, job_id)`` pairs resolved since the last call, for the caller to store."""
+        pairs, self._new = list(self._new.items()), {}
+        return pairs
+
+    def reassign(self, old_job_id: str, new_job_id: str) -> None:
+        """Make every key known for ``old_job_id`` resolve to ``new_job_id`` (a repost folded into it)."""
+        self.repository.reassign_identities(old_job_id, new_job_id)
+        for keys in (self._cache, self._new):
+            for key, job_id in keys.items():
+                if job_id == old_job_id:
+                    keys[key] = new_job_id
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._new.clear()
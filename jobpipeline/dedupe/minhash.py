@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+
+from jobpipeline.core.models import CanonicalJob
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def _hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=4).digest(), "little")
+
+
+def job_features(job: CanonicalJob, shingle_size: int = 5) -> set[str]:
+    """Word shingles of the description plus normalized company and title tokens."""
+    words = _WORD_RE.findall(job.description_raw.lower())
+    features = {" ".join(words[i : i + shingle_size]) for i in range(max(1, len(words) - shingle_size + 1))}
+    features.add("company:" + " ".join(_WORD_RE.findall(job.company.lower())))
+    features.add("title:" + " ".join(_WORD_RE.findall(job.title.lower())))
+    return features
+
+
+class MinHasher:
+    """MinHash signatures with LSH banding; the seed is fixed so signatures stay comparable across runs."""
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, shingle_size: int = 5, seed: int = 1) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        self._perms = [(rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(num_perm)]
+
+    def signature(self, job: CanonicalJob) -> list[int]:
+        hashes = [_hash(feature) for feature in job_features(job, self.shingle_size)]
+        return [min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes) for a, b in self._perms]
+
+    def band_keys(self, signature: list[int]) -> list[str]:
+        """One bucket key per band; two signatures sharing any key are candidate duplicates."""
+        keys = []
+        for band in range(self.bands):
+            rows = signature[band * self.rows : (band + 1) * self.rows]
+            keys.append(f"{band}:" + hashlib.blake2b(repr(rows).encode(), digest_size=8).hexdigest())
+        return keys
+
+    @staticmethod
+    def similarity(left: list[int], right: list[int]) -> float:
+        """Estimated Jaccard similarity of the two feature sets."""
+        return sum(1 for a, b in zip(left, right) if a == b) / max(1, len(left))
@@ -1,9 +1,38 @@
 from __future__ import annotations
 
-from jobpipeline.core.models import CanonicalJob
+from jobpipeline.core.models import CanonicalJob, SourceItem
+from jobpipeline.utils.text import canonicalize_url
 
 
 class DedupeService:
+    @staticmethod
+    def dedupe_items(items: list[SourceItem]) -> tuple[list[SourceItem], dict[str, list[SourceItem]]]:
+        """Collapse search results that share a canonical URL before anything is fetched.
+
+        Returns one item per canonical URL (preferring one that already carries an API-built job)
+        and, keyed by canonical URL, the other sightings that were folded into it.
+        """
+        kept: dict[str, SourceItem] = {}
+        duplicates: dict[str, list[SourceItem]] = {}
+        for item in items:
+            key = canonicalize_url(item.job_url)
+            existing = kept.get(key)
+            if existing is None:
+                kept[key] = item
+                continue
+            if item.job is not None and existing.job is None:
+                kept[key], item = item, existing
+            duplicates.setdefault(key, []).append(item)
+        return list(kept.values()), duplicates
+
+    @staticmethod
+    def merge_sightings(job: CanonicalJob, sightings: list[SourceItem]) -> None:
+        """Apply sightings dropped by :meth:`dedupe_items` to the job collected for their URL."""
+        for item in sightings:
+            job.repost_count += 1
+            if item.source_name not in job.source_name.split(","):
+                job.source_name = f"{job.source_name},{item.source_name}"
+
     @staticmethod
     def dedupe(jobs: list[CanonicalJob]) -> tuple[list[CanonicalJob], int]:
         by_canonical: dict[str, CanonicalJob] = {}
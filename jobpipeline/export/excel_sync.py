@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import re
+from collections.abc import Iterable
 from pathlib import Path
 
 from openpyxl import Workbook, load_workbook
 from openpyxl.styles import Font
+from openpyxl.worksheet.worksheet import Worksheet
 
 from jobpipeline.core.models import CanonicalJob
 
@@ -27,19 +30,57 @@ COLUMNS = [
 ]
 
 
+PRIMARY_SHEET = "Jobs"
+_INVALID_SHEET_CHARS = re.compile(r"[\[\]:*?/\\]")
+
+
+def profile_sheet_name(profile_name: str) -> str:
+    """Excel sheet for a secondary profile (sheet names are limited to 31 chars and a safe charset)."""
+    return _INVALID_SHEET_CHARS.sub("_", profile_name).strip()[:31] or "Profile"
+
+
+def profile_sheet_names(profile_names: list[str]) -> list[str]:
+    """Distinct sheets for secondary profiles, in order.
+
+    Excel compares sheet names case-insensitively, and sanitizing can map two profiles to one name,
+    so a clash with ``PRIMARY_SHEET`` or an earlier profile gets a numeric suffix.
+    """
+    taken = {PRIMARY_SHEET.casefold()}
+    names = []
+    for profile_name in profile_names:
+        base = name = profile_sheet_name(profile_name)
+        suffix = 1
+        while name.casefold() in taken:
+            suffix += 1
+            name = f"{base[: 31 - len(str(suffix)) - 1]}_{suffix}"
+        taken.add(name.casefold())
+        names.append(name)
+    return names
+
+
 class ExcelSync:
     def __init__(self, path: str) -> None:
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
 
-    def sync(self, jobs: list[CanonicalJob]) -> int:
+    def sync(self, jobs: Iterable[CanonicalJob]) -> int:
+        return self.sync_sheets({PRIMARY_SHEET: jobs})[PRIMARY_SHEET]
+
+    def sync_sheets(self, sheets: dict[str, Iterable[CanonicalJob]]) -> dict[str, int]:
+        """Sync several sheets (one per profile) with a single workbook load and save."""
         if self.path.exists():
             wb = load_workbook(self.path)
-            ws = wb["Jobs"] if "Jobs" in wb.sheetnames else wb.create_sheet("Jobs")
         else:
             wb = Workbook()
-            ws = wb.active
-            ws.title = "Jobs"
+            wb.active.title = PRIMARY_SHEET
+        exported = {}
+        for name, jobs in sheets.items():
+            ws = wb[name] if name in wb.sheetnames else wb.create_sheet(name)
+            exported[name] = self._sync_sheet(ws, jobs)
+        wb.save(self.path)
+        return exported
+
+    def _sync_sheet(self, ws: Worksheet, jobs: Iterable[CanonicalJob]) -> int:
 
         if ws.max_row < 1 or ws.cell(1, 1).value != "Job ID":
             ws.delete_rows(1, ws.max_row)
@@ -117,6 +158,4 @@ class ExcelSync:
         }
         for idx, width in widths.items():
             ws.column_dimensions[chr(64 + idx)].width = width
-
-        wb.save(self.path)
         return exported
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+
+from jobpipeline.core.models import SearchProfile
+
+SENIORITY_TERMS = ("senior", "principal", "staff")
+CLEARANCE_TERMS = ("clearance",)
+_WORD_CHAR = re.compile(r"\w")
+
+
+def normalize_keyword(keyword: str) -> str:
+    return " ".join(keyword.lower().split())
+
+
+def _trie_pattern(keywords: list[str]) -> str:
+    """Prefix-factored alternation, so the regex engine walks a trie instead of trying each keyword.
+
+    Greedy optional tails make the longest keyword win at each start; spaces match any whitespace run.
+    """
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node: dict) -> str:
+        terminal = "" in node
+        branches = [
+            (r"\s+" if char == " " else re.escape(char)) + render(child) for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if terminal:
+            return f"(?:{body})?"
+        return body
+
+    return render(trie)
+
+
+class KeywordMatcher:
+    """Finds every keyword of several groups in one pass, on word boundaries and case-insensitively.
+
+    ``bgp`` no longer matches inside ``ebgp``; multi-word keywords tolerate line breaks. With
+    ``credit_prefixes`` a match also credits the shorter keywords it starts with ("network engineer"
+    credits "network"); without it only the longest keyword at each position counts.
+    """
+
+    def __init__(self, groups: dict[str, list[str]], credit_prefixes: bool = True) -> None:
+        self._groups: dict[str, set[str]] = defaultdict(set)
+        for group, keywords in groups.items():
+            for keyword in keywords:
+                if normalize_keyword(keyword):
+                    self._groups[normalize_keyword(keyword)].add(group)
+        keywords = sorted(self._groups)
+        # Longer keywords that start with a shorter one ending on a word boundary ("network engineer"
+        # and "network", "c++" and "c"): the regex only reports the longest per start, so credit those too.
+        self._prefixes: dict[str, list[str]] = {}
+        if credit_prefixes:
+            self._prefixes = {
+                keyword: [
+                    other
+                    for other in keywords
+                    if len(other) < len(keyword) and keyword.startswith(other) and not _WORD_CHAR.match(keyword[len(other)])
+                ]
+                for keyword in keywords
+            }
+        self._pattern = (
+            re.compile(r"(?<!\w)(?=(" + _trie_pattern(keywords) + r")(?!\w))", re.IGNORECASE) if keywords else None
+        )
+
+    def scan(self, text: str) -> dict[str, set[str]]:
+        """Matched keywords (normalized) per group."""
+        found: dict[str, set[str]] = defaultdict(set)
+        if self._pattern is None or not text:
+            return found
+        for match in self._pattern.finditer(text):
+            keyword = normalize_keyword(match.group(1))
+            for hit in (keyword, *self._prefixes.get(keyword, ())):
+                for group in self._groups.get(hit, ()):
+                    found[group].add(hit)
+        return found
+
+
+def profile_matcher(profile: SearchProfile) -> KeywordMatcher:
+    return KeywordMatcher(
+        {
+            "must": profile.must_have_keywords,
+            "nice": profile.nice_to_have_keywords,
+            "title": profile.target_titles + profile.adjacent_titles,
+            "exclude": profile.exclude_keywords,
+            "seniority": list(SENIORITY_TERMS),
+            "clearance": list(CLEARANCE_TERMS),
+        }
+    )
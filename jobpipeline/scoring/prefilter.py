@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from jobpipeline.core.models import SearchProfile, SourceItem
+from jobpipeline.scoring.matcher import KeywordMatcher, profile_matcher
+
+
+def snippet_title(item: SourceItem) -> str:
+    """The title a search result carries before its page is fetched (feed title or board link text)."""
+    if item.job is not None:
+        return item.job.title
+    return item.snippet_meta.get("feed_title") or item.snippet_meta.get("link_text") or ""
+
+
+class SnippetFilter:
+    """Drops search results whose title alone guarantees a zero fit for every profile.
+
+    The rules mirror :meth:`FitScorer.evaluate` on the title: an exclude keyword, a clearance term,
+    or (with ``seniority_mode: reject``) a seniority term. ``filters.exclude_keywords`` apply to all
+    profiles. ``require_title_match`` also drops titles matching no target or adjacent title, which
+    is a policy rather than a certainty, so it is opt-in. Results without a title are kept.
+    """
+
+    def __init__(
+        self,
+        profiles: list[SearchProfile],
+        seniority_mode: str = "downrank",
+        exclude_keywords: list[str] | None = None,
+        require_title_match: bool = False,
+    ) -> None:
+        self._matchers = [profile_matcher(profile) for profile in profiles]
+        self.seniority_mode = seniority_mode
+        self.require_title_match = require_title_match
+        self._global = KeywordMatcher({"exclude": exclude_keywords or []})
+
+    def reject(self, item: SourceItem) -> str | None:
+        """Reason ``item`` is certain to be rejected (``excluded``, ``clearance``, ``seniority``, ``title``), else None."""
+        title = snippet_title(item)
+        if not title:
+            return None
+        if self._global.scan(title)["exclude"]:
+            return "excluded"
+        reasons = [self._reject_for(matcher.scan(title)) for matcher in self._matchers]
+        if any(reason is None for reason in reasons):
+            return None
+        return reasons[0]
+
+    def _reject_for(self, hits: dict[str, set[str]]) -> str | None:
+        if hits["exclude"]:
+            return "excluded"
+        if hits["clearance"]:
+            return "clearance"
+        if hits["seniority"] and self.seniority_mode == "reject":
+            return "seniority"
+        if self.require_title_match and not hits["title"]:
+            return "title"
+        return None
@@ -1,26 +1,215 @@
 from __future__ import annotations
 
-from jobpipeline.core.models import CanonicalJob, SearchProfile
+import hashlib
+import json
+from dataclasses import asdict
+
+from jobpipeline.core.models import CanonicalJob, FitResult, SearchProfile
+from jobpipeline.scoring.matcher import CLEARANCE_TERMS, SENIORITY_TERMS, KeywordMatcher, normalize_keyword, profile_matcher
 from jobpipeline.utils.text import extract_years_requirement
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional extra; score_many falls back to per-job scoring
+    np = None
+
+
+def profile_fingerprint(profile: SearchProfile, seniority_mode: str) -> str:
+    """Hash of everything a profile's scores depend on; equal fingerprints mean equal scores."""
+    payload = json.dumps([asdict(profile), seniority_mode], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class _MatchMatrix:
+    """Job-by-keyword hits for :meth:`FitScorer.score_many`, split by title and description."""
+
+    def __init__(self, column: dict[str, int], in_title: np.ndarray, in_body: np.ndarray) -> None:
+        self._column = column
+        self._blank = in_title.shape[1] - 1
+        self._title = in_title
+        self._body = in_body
+        self._anywhere = in_title | in_body
+
+    def _columns(self, keywords: list[str]) -> list[int]:
+        return [self._column.get(keyword, self._blank) for keyword in keywords]
+
+    def title(self, keywords: list[str]) -> np.ndarray:
+        return self._title[:, self._columns(keywords)]
+
+    def body(self, keywords: list[str]) -> np.ndarray:
+        return self._body[:, self._columns(keywords)]
+
+    def anywhere(self, keywords: list[str]) -> np.ndarray:
+        return self._anywhere[:, self._columns(keywords)]
+
 
 class FitScorer:
+    def __init__(self) -> None:
+        # Compiled once per distinct profile keyword set, then reused for every job.
+        self._matchers: dict[tuple, KeywordMatcher] = {}
+
+    def _matcher(self, profile: SearchProfile) -> KeywordMatcher:
+        key = (
+            tuple(profile.must_have_keywords),
+            tuple(profile.nice_to_have_keywords),
+            tuple(profile.target_titles + profile.adjacent_titles),
+            tuple(profile.exclude_keywords),
+        )
+        if key not in self._matchers:
+            self._matchers[key] = profile_matcher(profile)
+        return self._matchers[key]
+
     def score(self, job: CanonicalJob, profile: SearchProfile, seniority_mode: str = "downrank") -> CanonicalJob:
-        text = f"{job.title} {job.description_raw}".lower()
-        must = [k.lower() for k in profile.must_have_keywords]
-        nice = [k.lower() for k in profile.nice_to_have_keywords]
+        return self.evaluate(job, profile, seniority_mode).apply(job)
+
+    def score_profiles(
+        self, job: CanonicalJob, profiles: list[SearchProfile], seniority_mode: str = "downrank"
+    ) -> list[FitResult]:
+        return [self.evaluate(job, profile, seniority_mode) for profile in profiles]
 
-        missing = [k for k in must if k not in text]
+    def score_many(
+        self, jobs: list[CanonicalJob], profiles: list[SearchProfile], seniority_mode: str = "downrank"
+    ) -> list[list[FitResult]]:
+        """Batch form of :meth:`score_profiles`: ``result[i][p]`` is job ``i`` against profile ``p``.
+
+        Each job is scanned once for the keywords of every profile into a job-by-keyword match
+        matrix; the score components are then NumPy array operations over the whole batch. Results
+        are identical to :meth:`evaluate`. Without NumPy this falls back to scoring job by job.
+        """
+        if np is None or not jobs or not profiles:
+            return [self.score_profiles(job, profiles, seniority_mode) for job in jobs]
+
+        vocabulary = sorted(
+            {
+                normalize_keyword(k)
+                for profile in profiles
+                for k in (
+                    profile.must_have_keywords
+                    + profile.nice_to_have_keywords
+                    + profile.target_titles
+                    + profile.adjacent_titles
+                    + profile.exclude_keywords
+                )
+                if normalize_keyword(k)
+            }
+            | set(SENIORITY_TERMS)
+            | set(CLEARANCE_TERMS)
+        )
+        column = {keyword: idx for idx, keyword in enumerate(vocabulary)}
+        matcher = self._batch_matcher(vocabulary)
+        # One spare all-False column stands in for blank keywords, which never match.
+        in_title = np.zeros((len(jobs), len(vocabulary) + 1), dtype=bool)
+        in_body = np.zeros((len(jobs), len(vocabulary) + 1), dtype=bool)
+        years = np.full(len(jobs), -1, dtype=np.int64)
+        for row, job in enumerate(jobs):
+            in_title[row, [column[k] for k in matcher.scan(job.title)["kw"]]] = True
+            in_body[row, [column[k] for k in matcher.scan(job.description_raw)["kw"]]] = True
+            found = extract_years_requirement(f"{job.title} {job.description_raw}")
+            if found is not None:
+                years[row] = found
+        matches = _MatchMatrix(column, in_title, in_body)
+        remote = np.array([job.remote_flag == "Y" for job in jobs])
+        return [
+            list(per_job)
+            for per_job in zip(
+                *(self._score_columns(profile, matches, remote, years, seniority_mode) for profile in profiles)
+            )
+        ]
+
+    def _batch_matcher(self, vocabulary: list[str]) -> KeywordMatcher:
+        key = ("batch", tuple(vocabulary))
+        if key not in self._matchers:
+            self._matchers[key] = KeywordMatcher({"kw": vocabulary})
+        return self._matchers[key]
+
+    @staticmethod
+    def _score_columns(
+        profile: SearchProfile, matches: _MatchMatrix, remote: np.ndarray, years: np.ndarray, seniority_mode: str
+    ) -> list[FitResult]:
+        """:meth:`evaluate` over the whole batch for one profile: same arithmetic, same order of operations."""
+        must = [normalize_keyword(k) for k in profile.must_have_keywords]
+        nice = [normalize_keyword(k) for k in profile.nice_to_have_keywords]
+        exclude = [normalize_keyword(k) for k in profile.exclude_keywords]
+        must_hit = matches.anywhere(must)
+        must_matches = must_hit.sum(axis=1)
+        nice_matches = matches.anywhere(nice).sum(axis=1)
+        clearance = matches.anywhere(list(CLEARANCE_TERMS)).any(axis=1)
+        seniority = matches.anywhere(list(SENIORITY_TERMS)).any(axis=1)
+
+        score = (must_matches / max(1, len(must)) * 40).astype(np.int64)
+        score += (nice_matches / max(1, len(nice)) * 20).astype(np.int64)
+        titles = [normalize_keyword(t) for t in profile.target_titles + profile.adjacent_titles]
+        score += np.where(matches.title(titles).any(axis=1), 20, 5)
+        if profile.location_mode.lower() == "remote":
+            score += np.where(remote, 10, 4)
+        else:
+            score += 6
+        experience_mismatch = (years >= 0) & (years > profile.experience_max_years)
+        score += np.where(years < 0, 6, np.where(experience_mismatch, 1, 10))
+        score = np.where(clearance, 0, score)
+        if seniority_mode == "reject":
+            score = np.where(seniority, 0, score)
+        else:
+            score = np.where(seniority, np.maximum(0, score - 25), score)
+        excluded_title = matches.title(exclude)
+        excluded = excluded_title.any(axis=1)
+        score = np.clip(np.where(excluded, 0, score), 0, 100)
+        grades = np.select([score >= 85, score >= 70, score >= 55], ["A", "B", "C"], "D")
+        excluded_body = matches.body(exclude) & ~excluded_title
+
+        results = []
+        for row in range(len(years)):
+            missing = [k for k, hit in zip(must, must_hit[row]) if not hit]
+            flags = [
+                name
+                for name, on in (
+                    ("experience_mismatch", experience_mismatch[row]),
+                    ("clearance", clearance[row]),
+                    ("seniority", seniority[row]),
+                    ("missing_must_have", bool(missing)),
+                    ("excluded", excluded[row]),
+                )
+                if on
+            ]
+            notes = (
+                f"must matched {int(must_matches[row])}/{len(must)}; nice matched {int(nice_matches[row])}/{len(nice)}; "
+                f"flags={','.join(flags) or 'none'}"
+            )
+            in_description = sorted({k for k, hit in zip(exclude, excluded_body[row]) if hit})
+            if in_description:
+                notes += f"; excluded terms in description: {', '.join(in_description)}"
+            results.append(
+                FitResult(
+                    profile=profile.name,
+                    fit_score=int(score[row]),
+                    fit_grade=str(grades[row]),
+                    fit_notes=notes,
+                    missing_must_have=missing,
+                    flags=flags,
+                )
+            )
+        return results
+
+    def evaluate(self, job: CanonicalJob, profile: SearchProfile, seniority_mode: str = "downrank") -> FitResult:
+        """Score ``job`` against ``profile`` without modifying it."""
+        matcher = self._matcher(profile)
+        title_hits = matcher.scan(job.title)
+        body_hits = matcher.scan(job.description_raw)
+        hits = {group: title_hits[group] | body_hits[group] for group in ("must", "nice", "seniority", "clearance")}
+        must = [normalize_keyword(k) for k in profile.must_have_keywords]
+        nice = [normalize_keyword(k) for k in profile.nice_to_have_keywords]
+
+        missing = [k for k in must if k not in hits["must"]]
         flags: list[str] = []
         score = 0
 
         must_matches = len(must) - len(missing)
         score += int((must_matches / max(1, len(must))) * 40)
 
-        nice_matches = sum(1 for k in nice if k in text)
+        nice_matches = sum(1 for k in nice if k in hits["nice"])
         score += int((nice_matches / max(1, len(nice))) * 20)
 
-        title_match = any(t.lower() in job.title.lower() for t in profile.target_titles + profile.adjacent_titles)
+        title_match = bool(title_hits["title"])
         score += 20 if title_match else 5
 
         if profile.location_mode.lower() == "remote":
@@ -28,7 +217,7 @@ class FitScorer:
         else:
             score += 6
 
-        years = extract_years_requirement(text)
+        years = extract_years_requirement(f"{job.title} {job.description_raw}")
         if years is None:
             score += 6
         elif years <= profile.experience_max_years:
@@ -37,11 +226,11 @@ class FitScorer:
             score += 1
             flags.append("experience_mismatch")
 
-        if "clearance" in text:
+        if hits["clearance"]:
             flags.append("clearance")
             score = 0
 
-        if any(k in text for k in ["senior", "principal", "staff"]):
+        if hits["seniority"]:
             flags.append("seniority")
             if seniority_mode == "reject":
                 score = 0
@@ -51,13 +240,23 @@ class FitScorer:
         if missing:
             flags.append("missing_must_have")
 
+        # An excluded term in the title rules the job out; in the description it is only reported.
+        if title_hits["exclude"]:
+            flags.append("excluded")
+            score = 0
+
         score = max(0, min(100, score))
         grade = "A" if score >= 85 else "B" if score >= 70 else "C" if score >= 55 else "D"
         notes = f"must matched {must_matches}/{len(must)}; nice matched {nice_matches}/{len(nice)}; flags={','.join(flags) or 'none'}"
+        excluded_in_body = sorted(body_hits["exclude"] - title_hits["exclude"])
+        if excluded_in_body:
+            notes += f"; excluded terms in description: {', '.join(excluded_in_body)}"
 
-        job.fit_score = score
-        job.fit_grade = grade
-        job.fit_notes = notes
-        job.missing_must_have = missing
-        job.flags = flags
-        return job
+        return FitResult(
+            profile=profile.name,
+            fit_score=score,
+            fit_grade=grade,
+            fit_notes=notes,
+            missing_must_have=missing,
+            flags=flags,
+        )
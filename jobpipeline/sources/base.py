@@ -1,13 +1,66 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+
+import httpx
 
 from jobpipeline.core.models import SearchProfile, SourceItem
+from jobpipeline.storage.watermarks import SourceWatermark
+from jobpipeline.utils.text import canonicalize_url, parse_feed_date
+
+
+def item_published(item: SourceItem) -> str | None:
+    """Publish date a search result carries (feed date or ATS posted date) as naive UTC ISO, if any."""
+    if item.snippet_meta.get("published"):
+        return item.snippet_meta["published"]
+    return parse_feed_date(item.job.posted_date or "") if item.job is not None else None
 
 
 class SourceAdapter(ABC):
     name: str
+    client: httpx.Client | None = None
+    # Sources that list items newest first let iter_new stop at the first old or seen item.
+    date_ordered: bool = False
 
     @abstractmethod
     def search(self, profile: SearchProfile, max_items: int) -> list[SourceItem]:
         raise NotImplementedError
+
+    def iter_search(self, profile: SearchProfile, max_items: int) -> Iterator[SourceItem]:
+        """Yield items as they become available; adapters that can stream their source override this."""
+        yield from self.search(profile, max_items)
+
+    @property
+    def watermark_key(self) -> str:
+        """Identifies this source in ``source_watermarks``; adapters for one site override it per feed/board."""
+        return self.name
+
+    def iter_new(
+        self, profile: SearchProfile, max_items: int, watermark: SourceWatermark | None, cutoff: str | None
+    ) -> Iterator[SourceItem]:
+        """Items not processed by an earlier run and published after ``cutoff``.
+
+        For ``date_ordered`` sources the walk stops at the first dated item that is older than
+        ``cutoff`` or already seen at or below the watermark. Other sources (ATS APIs, board anchors)
+        have no order to rely on, so such items are skipped instead. Items are tagged with
+        ``watermark_key``.
+        """
+        for item in self.iter_search(profile, max_items):
+            published = item_published(item)
+            seen = watermark is not None and canonicalize_url(item.job_url) in watermark.seen
+            old = published is not None and (
+                (cutoff is not None and published < cutoff)
+                or (seen and watermark.newest is not None and published <= watermark.newest)
+            )
+            if old and self.date_ordered:
+                return
+            if old or seen:
+                continue
+            item.snippet_meta["watermark_key"] = self.watermark_key
+            yield item
+
+    def _get(self, url: str) -> httpx.Response:
+        if self.client is None:
+            return httpx.get(url, timeout=20)
+        return self.client.get(url)
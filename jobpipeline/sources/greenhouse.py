@@ -1,22 +1,30 @@
 from __future__ import annotations
 
+import html
 from urllib.parse import urljoin, urlparse
 
 import httpx
 from bs4 import BeautifulSoup
 
-from jobpipeline.core.models import SearchProfile, SourceItem
+from jobpipeline.collectors.extract import build_job
+from jobpipeline.collectors.parsers import ParserBackend, get_parser_backend
+from jobpipeline.core.models import CanonicalJob, SearchProfile, SourceItem
 from jobpipeline.sources.base import SourceAdapter
 
 
 class GreenhousePublicBoardAdapter(SourceAdapter):
-    def __init__(self, board_url: str) -> None:
+    def __init__(self, board_url: str, client: httpx.Client | None = None) -> None:
         self.board_url = board_url.rstrip("/")
+        self.client = client
         self.name = "Greenhouse"
 
+    @property
+    def watermark_key(self) -> str:
+        return f"greenhouse:{self.board_url}"
+
     def search(self, profile: SearchProfile, max_items: int) -> list[SourceItem]:
         try:
-            response = httpx.get(self.board_url, timeout=20)
+            response = self._get(self.board_url)
             response.raise_for_status()
         except httpx.HTTPError:
             return []
@@ -33,9 +41,64 @@ class GreenhousePublicBoardAdapter(SourceAdapter):
                     job_url=full_url,
                     source_name=self.name,
                     source_domain=domain,
-                    snippet_meta={"board": self.board_url},
+                    snippet_meta={"board": self.board_url, "link_text": link.get_text(" ", strip=True)},
                 )
             )
             if len(found) >= max_items:
                 break
         return found
+
+
+class GreenhouseJobBoardApiAdapter(SourceAdapter):
+    """Reads the public Job Board API, which returns every posting with its description in one call."""
+
+    def __init__(
+        self,
+        board_token: str,
+        client: httpx.Client | None = None,
+        parser: ParserBackend | None = None,
+        api_base: str = "https://boards-api.greenhouse.io",
+    ) -> None:
+        self.board_token = board_token
+        self.client = client
+        self.parser = parser or get_parser_backend()
+        self.api_url = f"{api_base.rstrip('/')}/v1/boards/{board_token}/jobs?content=true"
+        self.name = "Greenhouse"
+
+    @property
+    def watermark_key(self) -> str:
+        return f"greenhouse-api:{self.board_token}"
+
+    def search(self, profile: SearchProfile, max_items: int) -> list[SourceItem]:
+        try:
+            response = self._get(self.api_url)
+            response.raise_for_status()
+            postings = response.json().get("jobs", [])
+        except (httpx.HTTPError, ValueError):
+            return []
+        now = CanonicalJob.now_iso()
+        found: list[SourceItem] = []
+        for posting in postings[:max_items]:
+            url = posting.get("absolute_url")
+            if not url:
+                continue
+            item = SourceItem(
+                job_url=url,
+                source_name=self.name,
+                source_domain=urlparse(url).netloc,
+                snippet_meta={"board": self.board_token, "feed_title": posting.get("title", "")},
+            )
+            item.job = build_job(
+                item,
+                final_url=url,
+                now=now,
+                title=posting.get("title") or "Unknown title",
+                company=posting.get("company_name") or self.board_token,
+                location=(posting.get("location") or {}).get("name") or "Unknown",
+                # The API HTML-escapes the description markup.
+                description=self.parser.fragment_text(html.unescape(posting.get("content") or "")),
+                posted_date=posting.get("first_published") or posting.get("updated_at"),
+                apply_url=url,
+            )
+            found.append(item)
+        return found
@@ -1,22 +1,31 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from urllib.parse import urljoin, urlparse
 
 import httpx
 from bs4 import BeautifulSoup
 
-from jobpipeline.core.models import SearchProfile, SourceItem
+from jobpipeline.collectors.extract import build_job
+from jobpipeline.collectors.parsers import ParserBackend, get_parser_backend
+from jobpipeline.core.models import CanonicalJob, SearchProfile, SourceItem
 from jobpipeline.sources.base import SourceAdapter
+from jobpipeline.utils.text import normalize_whitespace
 
 
 class LeverPublicBoardAdapter(SourceAdapter):
-    def __init__(self, board_url: str) -> None:
+    def __init__(self, board_url: str, client: httpx.Client | None = None) -> None:
         self.board_url = board_url.rstrip("/")
+        self.client = client
         self.name = "Lever"
 
+    @property
+    def watermark_key(self) -> str:
+        return f"lever:{self.board_url}"
+
     def search(self, profile: SearchProfile, max_items: int) -> list[SourceItem]:
         try:
-            response = httpx.get(self.board_url, timeout=20)
+            response = self._get(self.board_url)
             response.raise_for_status()
         except httpx.HTTPError:
             return []
@@ -33,9 +42,84 @@ class LeverPublicBoardAdapter(SourceAdapter):
                     job_url=full_url,
                     source_name=self.name,
                     source_domain=domain,
-                    snippet_meta={"board": self.board_url},
+                    snippet_meta={"board": self.board_url, "link_text": link.get_text(" ", strip=True)},
                 )
             )
             if len(found) >= max_items:
                 break
         return found
+
+
+class LeverPostingsApiAdapter(SourceAdapter):
+    """Reads the public Lever postings API, which returns every posting with its description in one call."""
+
+    def __init__(
+        self,
+        company: str,
+        client: httpx.Client | None = None,
+        parser: ParserBackend | None = None,
+        api_base: str = "https://api.lever.co",
+        company_name: str | None = None,
+    ) -> None:
+        self.company = company
+        self.company_name = company_name or company
+        self.client = client
+        self.parser = parser or get_parser_backend()
+        self.api_url = f"{api_base.rstrip('/')}/v0/postings/{company}?mode=json"
+        self.name = "Lever"
+
+    @property
+    def watermark_key(self) -> str:
+        return f"lever-api:{self.company}"
+
+    def search(self, profile: SearchProfile, max_items: int) -> list[SourceItem]:
+        try:
+            response = self._get(self.api_url)
+            response.raise_for_status()
+            postings = response.json()
+        except (httpx.HTTPError, ValueError):
+            return []
+        if not isinstance(postings, list):
+            return []
+        now = CanonicalJob.now_iso()
+        found: list[SourceItem] = []
+        for posting in postings[:max_items]:
+            url = posting.get("hostedUrl")
+            if not url:
+                continue
+            categories = posting.get("categories") or {}
+            item = SourceItem(
+                job_url=url,
+                source_name=self.name,
+                source_domain=urlparse(url).netloc,
+                snippet_meta={"board": self.company, "feed_title": posting.get("text", "")},
+            )
+            item.job = build_job(
+                item,
+                final_url=url,
+                now=now,
+                title=posting.get("text") or "Unknown title",
+                company=self.company_name,
+                location=categories.get("location") or "Unknown",
+                description=self._description(posting),
+                posted_date=self._posted_date(posting.get("createdAt")),
+                apply_url=posting.get("applyUrl") or url,
+                employment_type=categories.get("commitment") or "Unknown",
+                remote=True if posting.get("workplaceType") == "remote" else None,
+            )
+            found.append(item)
+        return found
+
+    def _description(self, posting: dict) -> str:
+        parts = [posting.get("descriptionPlain") or ""]
+        for section in posting.get("lists") or []:
+            parts.append(section.get("text") or "")
+            parts.append(self.parser.fragment_text(section.get("content") or ""))
+        parts.append(posting.get("additionalPlain") or "")
+        return normalize_whitespace(" ".join(parts))
+
+    @staticmethod
+    def _posted_date(created_at_ms: int | None) -> str | None:
+        if not created_at_ms:
+            return None
+        return datetime.fromtimestamp(created_at_ms / 1000, tz=timezone.utc).date().isoformat()
@@ -1,8 +1,68 @@
 from __future__ import annotations
 
+import math
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import closing
+from dataclasses import dataclass
+
 from jobpipeline.core.models import SearchProfile, SourceItem
 from jobpipeline.sources.base import SourceAdapter
 from jobpipeline.sources.discovery import SearchProvider
+from jobpipeline.storage.watermarks import SourceWatermark
+
+
+@dataclass(slots=True)
+class AdapterStats:
+    name: str
+    elapsed_seconds: float
+    returned: int
+    used: int = 0
+    timed_out: bool = False
+    error: str | None = None
+
+
+class _StreamBudget:
+    """Streaming counterpart of :meth:`SourceManager._allocate`.
+
+    Each still-running source may take an equal share of whatever finished sources left unused, so the
+    share only grows as sources finish and the total never exceeds the budget.
+    """
+
+    def __init__(self, budget: int, sources: int) -> None:
+        self.budget = budget
+        self.used = [0] * sources
+        self.active = set(range(sources))
+        self.closed = False
+        self._cond = threading.Condition()
+
+    def acquire(self, idx: int, deadline: float) -> bool:
+        with self._cond:
+            while not self.closed and time.monotonic() < deadline:
+                if sum(self.used) >= self.budget:
+                    return False
+                if self.used[idx] < self._level():
+                    self.used[idx] += 1
+                    return True
+                self._cond.wait(0.1)
+            return False
+
+    def _level(self) -> int:
+        left = self.budget - sum(used for idx, used in enumerate(self.used) if idx not in self.active)
+        return math.ceil(left / max(1, len(self.active)))
+
+    def finish(self, idx: int) -> None:
+        with self._cond:
+            self.active.discard(idx)
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
 
 
 class SourceManager:
@@ -11,20 +71,181 @@ class SourceManager:
         adapters: list[SourceAdapter],
         exclude_domains: list[str] | None = None,
         provider: SearchProvider | None = None,
+        deadline_seconds: float = 60.0,
+        max_workers: int = 8,
+        queue_size: int = 64,
+        watermarks: dict[str, SourceWatermark] | None = None,
+        cutoff: str | None = None,
     ) -> None:
+        """``watermarks`` (incremental runs) and ``cutoff`` (time window) make adapters skip old items."""
         self.adapters = adapters
         self.exclude_domains = set(exclude_domains or [])
         self.provider = provider
+        self.deadline_seconds = deadline_seconds
+        self.max_workers = max(1, max_workers)
+        self.queue_size = max(1, queue_size)
+        self.watermarks = watermarks
+        self.cutoff = cutoff
 
     def search(self, profile: SearchProfile, max_jobs: int) -> list[SourceItem]:
-        items: list[SourceItem] = []
-        per_adapter = max(1, max_jobs // max(1, len(self.adapters)))
-        for adapter in self.adapters:
-            items.extend(adapter.search(profile, per_adapter))
+        return self.search_with_stats(profile, max_jobs)[0]
+
+    def search_with_stats(self, profile: SearchProfile, max_jobs: int) -> tuple[list[SourceItem], list[AdapterStats]]:
+        """Query every adapter and discovery title concurrently and share ``max_jobs`` between them.
+
+        Each source is asked for the whole budget (a feed or board costs one request either way);
+        sources that miss the deadline are dropped, and quota a source cannot use goes to the others.
+        """
+        tasks = self._tasks(profile, max_jobs)
+        if not tasks:
+            return [], []
+        results: list[list[SourceItem]] = [[] for _ in tasks]
+        stats = [AdapterStats(name=name, elapsed_seconds=0.0, returned=0) for name, _ in tasks]
+        started = time.monotonic()
+        pool = ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks)), thread_name_prefix="source")
+        try:
+            futures = {pool.submit(self._timed, task): idx for idx, (_, task) in enumerate(tasks)}
+            done, pending = wait(futures, timeout=self.deadline_seconds)
+            for future in done:
+                idx = futures[future]
+                elapsed, items, error = future.result()
+                kept = [item for item in items if item.source_domain not in self.exclude_domains]
+                results[idx] = kept
+                stats[idx].elapsed_seconds = round(elapsed, 3)
+                stats[idx].returned = len(kept)
+                stats[idx].error = error
+            for future in pending:
+                idx = futures[future]
+                stats[idx].timed_out = True
+                stats[idx].elapsed_seconds = round(time.monotonic() - started, 3)
+        finally:
+            # Do not block on stragglers; their results are discarded.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        quotas = self._allocate([len(items) for items in results], max_jobs)
+        found: list[SourceItem] = []
+        for idx, quota in enumerate(quotas):
+            found.extend(results[idx][:quota])
+            stats[idx].used = quota
+        return found, stats
+
+    def iter_search(
+        self, profile: SearchProfile, max_jobs: int, stats: list[AdapterStats] | None = None
+    ) -> Iterator[SourceItem]:
+        """Streaming form of :meth:`search_with_stats`: yield items as adapters produce them.
+
+        Adapters push into a bounded queue, so a slow consumer pauses them instead of buffering
+        whole feeds. Per-adapter stats are appended to ``stats`` and filled in as sources finish.
+        """
+        tasks: list[tuple[str, Callable[[], Iterable[SourceItem]]]] = [
+            (adapter.name, lambda adapter=adapter: self._adapter_items(adapter, profile, max_jobs)) for adapter in self.adapters
+        ]
+        if self.provider:
+            for title in profile.target_titles:
+                tasks.append((f"Discovery:{title}", lambda title=title: self._discover(title)))
+        if not tasks or max_jobs <= 0:
+            return
+        source_stats = [AdapterStats(name=name, elapsed_seconds=0.0, returned=0) for name, _ in tasks]
+        if stats is not None:
+            stats.extend(source_stats)
+        budget = _StreamBudget(max_jobs, len(tasks))
+        out: queue.Queue[SourceItem] = queue.Queue(maxsize=self.queue_size)
+        started = time.monotonic()
+        deadline = started + self.deadline_seconds
+
+        def produce(idx: int, task: Callable[[], Iterable[SourceItem]]) -> None:
+            stat = source_stats[idx]
+            try:
+                with closing(iter(task())) as items:
+                    for item in items:
+                        if item.source_domain in self.exclude_domains:
+                            continue
+                        stat.returned += 1
+                        if not budget.acquire(idx, deadline) or not self._put(out, item, budget):
+                            break
+                        stat.used += 1
+            except Exception as exc:  # noqa: BLE001
+                stat.error = str(exc)
+            finally:
+                stat.elapsed_seconds = round(time.monotonic() - started, 3)
+                budget.finish(idx)
+
+        pool = ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks)), thread_name_prefix="source")
+        try:
+            for idx, (_, task) in enumerate(tasks):
+                pool.submit(produce, idx, task)
+            while True:
+                try:
+                    yield out.get(timeout=0.05)
+                except queue.Empty:
+                    if not budget.active:
+                        break
+                    if time.monotonic() >= deadline:
+                        for idx in budget.active:
+                            source_stats[idx].timed_out = True
+                        break
+        finally:
+            budget.close()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _put(out: queue.Queue[SourceItem], item: SourceItem, budget: _StreamBudget) -> bool:
+        while not budget.closed:
+            try:
+                out.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _tasks(self, profile: SearchProfile, max_jobs: int) -> list[tuple[str, Callable[[], list[SourceItem]]]]:
+        tasks: list[tuple[str, Callable[[], list[SourceItem]]]] = [
+            (adapter.name, lambda adapter=adapter: list(self._adapter_items(adapter, profile, max_jobs)))
+            for adapter in self.adapters
+        ]
         if self.provider:
             for title in profile.target_titles:
-                for url in self.provider.search(title):
-                    domain = url.split("/")[2] if "//" in url else ""
-                    items.append(SourceItem(job_url=url, source_name="Discovery", source_domain=domain))
-        filtered = [item for item in items if item.source_domain not in self.exclude_domains]
-        return filtered[:max_jobs]
+                tasks.append((f"Discovery:{title}", lambda title=title: self._discover(title)))
+        return tasks
+
+    def _adapter_items(self, adapter: SourceAdapter, profile: SearchProfile, max_jobs: int) -> Iterable[SourceItem]:
+        if self.watermarks is None and self.cutoff is None:
+            return adapter.iter_search(profile, max_jobs)
+        watermark = self.watermarks.get(adapter.watermark_key) if self.watermarks is not None else None
+        return adapter.iter_new(profile, max_jobs, watermark, self.cutoff)
+
+    def _discover(self, title: str) -> list[SourceItem]:
+        assert self.provider is not None
+        items: list[SourceItem] = []
+        for url in self.provider.search(title):
+            domain = url.split("/")[2] if "//" in url else ""
+            items.append(SourceItem(job_url=url, source_name="Discovery", source_domain=domain))
+        return items
+
+    @staticmethod
+    def _timed(task: Callable[[], list[SourceItem]]) -> tuple[float, list[SourceItem], str | None]:
+        started = time.monotonic()
+        try:
+            items = task()
+            error = None
+        except Exception as exc:  # noqa: BLE001
+            items, error = [], str(exc)
+        return time.monotonic() - started, items, error
+
+    @staticmethod
+    def _allocate(available: list[int], budget: int) -> list[int]:
+        """Water-fill ``budget`` across sources: equal shares, with unused shares passed on."""
+        quotas = [0] * len(available)
+        active = [idx for idx, count in enumerate(available) if count > 0]
+        remaining = budget
+        while remaining > 0 and active:
+            share = max(1, remaining // len(active))
+            for idx in list(active):
+                take = min(share, available[idx] - quotas[idx], remaining)
+                quotas[idx] += take
+                remaining -= take
+                if quotas[idx] == available[idx]:
+                    active.remove(idx)
+                if remaining == 0:
+                    break
+        return quotas
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from urllib.parse import urlparse
 import xml.etree.ElementTree as ET
 
@@ -7,34 +9,114 @@ import httpx
 
 from jobpipeline.core.models import SearchProfile, SourceItem
 from jobpipeline.sources.base import SourceAdapter
+from jobpipeline.utils.http import STREAM_EXTENSION
+from jobpipeline.utils.text import parse_feed_date
+
+# RSS <item> and Atom <entry>; tags are compared without their namespace.
+ENTRY_TAGS = {"item", "entry"}
+DATE_TAGS = ("pubDate", "published", "updated")
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _child_text(node: ET.Element, name: str) -> str:
+    for child in node:
+        if _local(child.tag) == name:
+            return (child.text or "").strip()
+    return ""
+
+
+def _entry_link(node: ET.Element) -> str:
+    """RSS puts the URL in ``<link>`` text; Atom in the ``href`` of the alternate ``<link>``."""
+    for child in node:
+        if _local(child.tag) != "link":
+            continue
+        if child.get("href") and child.get("rel", "alternate") == "alternate":
+            return child.get("href", "").strip()
+        if child.text and child.text.strip():
+            return child.text.strip()
+    return ""
 
 
 class GenericRSSAdapter(SourceAdapter):
-    def __init__(self, name: str, url: str) -> None:
+    chunk_size = 16 * 1024
+    date_ordered = True
+
+    def __init__(self, name: str, url: str, client: httpx.Client | None = None) -> None:
         self.name = name
         self.url = url
+        self.client = client
+
+    @property
+    def watermark_key(self) -> str:
+        return f"rss:{self.url}"
 
     def search(self, profile: SearchProfile, max_items: int) -> list[SourceItem]:
+        return list(self.iter_search(profile, max_items))
+
+    def iter_search(self, profile: SearchProfile, max_items: int) -> Iterator[SourceItem]:
         try:
-            response = httpx.get(self.url, timeout=20)
-            response.raise_for_status()
+            with self._stream(self.url) as response:
+                response.raise_for_status()
+                yield from self._iter_items(response.iter_bytes(self.chunk_size), max_items)
         except httpx.HTTPError:
-            return []
-
-        root = ET.fromstring(response.text)
-        items: list[SourceItem] = []
-        for node in root.findall(".//item")[:max_items]:
-            link = (node.findtext("link") or "").strip()
-            title = (node.findtext("title") or "").strip()
-            if not link:
-                continue
-            domain = urlparse(link).netloc
-            items.append(
-                SourceItem(
-                    job_url=link,
-                    source_name=self.name,
-                    source_domain=domain,
-                    snippet_meta={"feed_title": title},
-                )
-            )
-        return items
+            return
+
+    @contextmanager
+    def _stream(self, url: str) -> Iterator[httpx.Response]:
+        if self.client is None:
+            with httpx.stream("GET", url, timeout=20) as response:
+                yield response
+        else:
+            with self.client.stream("GET", url, extensions={STREAM_EXTENSION: True}) as response:
+                yield response
+
+    def _iter_items(self, chunks: Iterator[bytes], max_items: int) -> Iterator[SourceItem]:
+        """Parse RSS or Atom incrementally, stopping (and closing the stream) after ``max_items``."""
+        if max_items <= 0:
+            return
+        parser = ET.XMLPullParser(events=("start", "end"))
+        open_nodes: list[ET.Element] = []
+        emitted = 0
+        try:
+            for chunk in chunks:
+                parser.feed(chunk)
+                for event, node in parser.read_events():
+                    if event == "start":
+                        open_nodes.append(node)
+                        continue
+                    open_nodes.pop()
+                    if _local(node.tag) not in ENTRY_TAGS:
+                        continue
+                    item = self._to_item(node)
+                    # Detach parsed entries so memory stays flat on multi-MB feeds.
+                    if open_nodes:
+                        open_nodes[-1].remove(node)
+                    if item is None:
+                        continue
+                    yield item
+                    emitted += 1
+                    if emitted >= max_items:
+                        return
+        except ET.ParseError:
+            # Keep whatever parsed cleanly before the malformed part.
+            return
+
+    def _to_item(self, node: ET.Element) -> SourceItem | None:
+        link = _entry_link(node)
+        if not link:
+            return None
+        meta = {"feed_title": _child_text(node, "title")}
+        for tag in DATE_TAGS:
+            published = parse_feed_date(_child_text(node, tag))
+            if published:
+                meta["published"] = published
+                break
+        return SourceItem(
+            job_url=link,
+            source_name=self.name,
+            source_domain=urlparse(link).netloc,
+            snippet_meta=meta,
+        )
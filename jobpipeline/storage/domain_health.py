@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+
+
+class DomainHealthStore:
+    """Persists circuit-breaker cooldowns and latency samples per host across runs."""
+
+    def __init__(self, db_path: str = "data/jobpipeline.db") -> None:
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS domain_health (
+                domain TEXT PRIMARY KEY,
+                opened_until REAL,
+                latency_samples TEXT
+            );
+            """
+        )
+        self.conn.commit()
+
+    def load(self) -> dict[str, tuple[float, list[float]]]:
+        with self._lock:
+            rows = self.conn.execute("SELECT * FROM domain_health").fetchall()
+        return {row["domain"]: (row["opened_until"] or 0.0, json.loads(row["latency_samples"] or "[]")) for row in rows}
+
+    def save(self, states: dict[str, tuple[float, list[float]]]) -> None:
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO domain_health VALUES (?,?,?)",
+                [(domain, opened_until, json.dumps(samples)) for domain, (opened_until, samples) in states.items()],
+            )
+            self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    url: str
+    etag: str | None
+    last_modified: str | None
+    body_hash: str
+    content_type: str | None
+    content_encoding: str | None
+    body: bytes
+
+
+class HttpCache:
+    """SQLite store of validators and bodies for conditional GETs, bounded by total body size."""
+
+    def __init__(self, db_path: str = "data/jobpipeline.db", max_bytes: int = 200 * 1024 * 1024) -> None:
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._init_schema()
+        self.total_bytes = int(self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0])
+
+    def _init_schema(self) -> None:
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body_hash TEXT,
+                content_type TEXT,
+                content_encoding TEXT,
+                body BLOB,
+                size INTEGER,
+                stored_at REAL,
+                last_used REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_http_cache_last_used ON http_cache(last_used);
+            """
+        )
+        self.conn.commit()
+
+    def lookup(self, url: str) -> CacheEntry | None:
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM http_cache WHERE url=?", (url,)).fetchone()
+        if not row:
+            return None
+        return CacheEntry(
+            url=row["url"],
+            etag=row["etag"],
+            last_modified=row["last_modified"],
+            body_hash=row["body_hash"],
+            content_type=row["content_type"],
+            content_encoding=row["content_encoding"],
+            body=zlib.decompress(row["body"]),
+        )
+
+    @staticmethod
+    def conditional_headers(entry: CacheEntry) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    @staticmethod
+    def body_hash(body: bytes) -> str:
+        return hashlib.sha256(body).hexdigest()
+
+    def touch(self, url: str) -> None:
+        with self._lock:
+            self.conn.execute("UPDATE http_cache SET last_used=? WHERE url=?", (time.time(), url))
+            self.conn.commit()
+
+    def store(
+        self,
+        url: str,
+        etag: str | None,
+        last_modified: str | None,
+        content_type: str | None,
+        content_encoding: str | None,
+        body: bytes,
+    ) -> str:
+        """Save the response and return its body hash."""
+        digest = self.body_hash(body)
+        packed = zlib.compress(body)
+        now = time.time()
+        with self._lock:
+            previous = self.conn.execute("SELECT size FROM http_cache WHERE url=?", (url,)).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO http_cache VALUES (?,?,?,?,?,?,?,?,?,?)",
+                (url, etag, last_modified, digest, content_type, content_encoding, packed, len(packed), now, now),
+            )
+            self.total_bytes += len(packed) - (previous["size"] if previous else 0)
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+            self.conn.commit()
+        return digest
+
+    def _evict(self) -> None:
+        # Drop least recently used entries until the cache is back under 90% of its budget.
+        target = int(self.max_bytes * 0.9)
+        rows = self.conn.execute("SELECT url, size FROM http_cache ORDER BY last_used ASC").fetchall()
+        doomed: list[tuple[str]] = []
+        for row in rows:
+            if self.total_bytes <= target:
+                break
+            doomed.append((row["url"],))
+            self.total_bytes -= row["size"]
+        self.conn.executemany("DELETE FROM http_cache WHERE url=?", doomed)
+
+    def close(self) -> None:
+        self.conn.close()
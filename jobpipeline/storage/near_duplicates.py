@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from array import array
+from pathlib import Path
+
+from jobpipeline.dedupe.minhash import MinHasher
+
+
+class NearDuplicateIndex:
+    """MinHash/LSH index of stored jobs, so reposts under a new URL are found across runs.
+
+    Lookups only compare against jobs sharing an LSH bucket, so cost grows with the number of
+    candidates rather than with the size of the table.
+    """
+
+    def __init__(self, db_path: str = "data/jobpipeline.db", hasher: MinHasher | None = None, threshold: float = 0.8) -> None:
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.hasher = hasher or MinHasher()
+        self.threshold = threshold
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS minhash_signatures (
+                job_id TEXT PRIMARY KEY,
+                signature BLOB
+            );
+            CREATE TABLE IF NOT EXISTS minhash_bands (
+                band_key TEXT,
+                job_id TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_minhash_bands_key ON minhash_bands(band_key);
+            CREATE INDEX IF NOT EXISTS idx_minhash_bands_job ON minhash_bands(job_id);
+            """
+        )
+        self.conn.commit()
+
+    def contains(self, job_id: str) -> bool:
+        with self._lock:
+            return self.conn.execute("SELECT 1 FROM minhash_signatures WHERE job_id=?", (job_id,)).fetchone() is not None
+
+    def find(self, signature: list[int], exclude_job_id: str | None = None) -> tuple[str, float] | None:
+        """Best stored match at or above the threshold, as ``(job_id, similarity)``."""
+        keys = self.hasher.band_keys(signature)
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            rows = self.conn.execute(
+                f"""
+                SELECT DISTINCT s.job_id, s.signature FROM minhash_bands b
+                JOIN minhash_signatures s ON s.job_id = b.job_id
+                WHERE b.band_key IN ({placeholders})
+                """,
+                keys,
+            ).fetchall()
+        best: tuple[str, float] | None = None
+        for job_id, blob in rows:
+            if job_id == exclude_job_id:
+                continue
+            similarity = self.hasher.similarity(signature, self._unpack(blob))
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (job_id, similarity)
+        return best
+
+    def add(self, job_id: str, signature: list[int]) -> None:
+        with self._lock:
+            self.conn.execute("DELETE FROM minhash_bands WHERE job_id=?", (job_id,))
+            self.conn.execute("INSERT OR REPLACE INTO minhash_signatures VALUES (?,?)", (job_id, self._pack(signature)))
+            self.conn.executemany(
+                "INSERT INTO minhash_bands VALUES (?,?)", [(key, job_id) for key in self.hasher.band_keys(signature)]
+            )
+            self.conn.commit()
+
+    @staticmethod
+    def _pack(signature: list[int]) -> bytes:
+        return array("I", signature).tobytes()
+
+    @staticmethod
+    def _unpack(blob: bytes) -> list[int]:
+        values = array("I")
+        values.frombytes(blob)
+        return values.tolist()
+
+    def close(self) -> None:
+        self.conn.close()
@@ -2,16 +2,31 @@ from __future__ import annotations
 
 import json
 import sqlite3
+from collections.abc import Iterator
 from pathlib import Path
 
-from jobpipeline.core.models import CanonicalJob
+from jobpipeline.collectors.skills import canonical_skill, extract_skills
+from jobpipeline.core.models import CanonicalJob, FitResult
+from jobpipeline.utils.text import identity_keys
+
+
+SCORE_COLUMNS = ("fit_score", "fit_grade", "fit_notes", "missing_must_have", "flags")
+# ``PRAGMA user_version`` once stored skills have been re-extracted into ``job_skills``; bump it when
+# the skill dictionary changes what existing rows should hold.
+SKILLS_SCHEMA_VERSION = 2
 
 
 class JobRepository:
     def __init__(self, db_path: str = "data/jobpipeline.db") -> None:
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
         self.conn = sqlite3.connect(db_path)
         self.conn.row_factory = sqlite3.Row
+        # WAL with synchronous=NORMAL syncs at checkpoints instead of on every commit.
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA cache_size=-65536")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
         self._init_schema()
 
     def _init_schema(self) -> None:
@@ -54,6 +69,35 @@ class JobRepository:
                 source_domain TEXT,
                 seen_at TEXT
             );
+            CREATE TABLE IF NOT EXISTS job_scores (
+                job_id TEXT,
+                profile TEXT,
+                fit_score INTEGER,
+                fit_grade TEXT,
+                fit_notes TEXT,
+                missing_must_have TEXT,
+                flags TEXT,
+                PRIMARY KEY (job_id, profile)
+            );
+            CREATE TABLE IF NOT EXISTS score_fingerprints (
+                profile TEXT PRIMARY KEY,
+                fingerprint TEXT,
+                scored_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS skills (
+                skill_id INTEGER PRIMARY KEY,
+                name TEXT UNIQUE
+            );
+            CREATE TABLE IF NOT EXISTS job_skills (
+                job_id TEXT,
+                skill_id INTEGER,
+                PRIMARY KEY (job_id, skill_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_job_skills_skill ON job_skills(skill_id);
+            CREATE TABLE IF NOT EXISTS job_identity (
+                identity_key TEXT PRIMARY KEY,
+                job_id TEXT
+            );
             CREATE TABLE IF NOT EXISTS runs (
                 run_id INTEGER PRIMARY KEY AUTOINCREMENT,
                 started_at TEXT,
@@ -73,89 +117,410 @@ class JobRepository:
             """
         )
         self.conn.commit()
+        self._skill_ids: dict[str, int] = {}
+        self._backfill_identities()
+        self._backfill_skills()
+        columns = [row["name"] for row in self.conn.execute("PRAGMA table_info(jobs)")]
+        # Per-profile reads take the fit columns from job_scores and everything else from jobs. Only the
+        # primary profile falls back to the fit kept in jobs; other profiles read as unscored until rescored.
+        def select(fit: str) -> str:
+            return "SELECT " + ", ".join(
+                fit.format(name=name) if name in SCORE_COLUMNS else f"jobs.{name}" for name in columns
+            ) + " FROM jobs LEFT JOIN job_scores s ON s.job_id = jobs.job_id AND s.profile = ?"
+
+        self._profile_select = select("s.{name} AS {name}")
+        self._primary_select = select("COALESCE(s.{name}, jobs.{name}) AS {name}")
+
+    def _backfill_identities(self) -> None:
+        """Seed ``job_identity`` for databases created before it existed."""
+        if self.conn.execute("SELECT 1 FROM job_identity LIMIT 1").fetchone():
+            return
+        rows = self.conn.execute("SELECT job_id, canonical_url FROM jobs").fetchall()
+        self.add_identities([(key, row["job_id"]) for row in rows for key in identity_keys(row["canonical_url"])])
+
+    def _backfill_skills(self) -> None:
+        """Re-extract skills for databases created before ``job_skills``, whose rows hold raw tokens.
+
+        Runs once per database: ``PRAGMA user_version`` records that it has, since an empty
+        ``job_skills`` table is also what a database of skill-less jobs looks like.
+        """
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] >= SKILLS_SCHEMA_VERSION:
+            return
+        rows = self.conn.execute("SELECT job_id, description_raw FROM jobs").fetchall()
+        with self.conn:
+            for row in rows:
+                skills = extract_skills(row["description_raw"] or "")
+                self.conn.execute("UPDATE jobs SET skills_extracted=? WHERE job_id=?", (json.dumps(skills), row["job_id"]))
+                self._write_skills(row["job_id"], skills)
+            self.conn.execute(f"PRAGMA user_version = {SKILLS_SCHEMA_VERSION}")
+
+    def _skill_id(self, name: str) -> int:
+        """Interned id of skill ``name``, created on first use."""
+        if name not in self._skill_ids:
+            self.conn.execute("INSERT OR IGNORE INTO skills(name) VALUES (?)", (name,))
+            row = self.conn.execute("SELECT skill_id FROM skills WHERE name=?", (name,)).fetchone()
+            self._skill_ids[name] = row["skill_id"]
+        return self._skill_ids[name]
+
+    def _write_skills(self, job_id: str, skills: list[str]) -> None:
+        self.conn.execute("DELETE FROM job_skills WHERE job_id=?", (job_id,))
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO job_skills VALUES (?,?)", [(job_id, self._skill_id(name)) for name in skills]
+        )
+
+    def jobs_with_skill(self, skill: str) -> list[sqlite3.Row]:
+        """Jobs mentioning ``skill`` (or a synonym of it), newest first, via the ``job_skills`` index."""
+        return self.conn.execute(
+            """
+            SELECT jobs.* FROM skills
+            JOIN job_skills ON job_skills.skill_id = skills.skill_id
+            JOIN jobs ON jobs.job_id = job_skills.job_id
+            WHERE skills.name = ?
+            ORDER BY jobs.last_seen DESC
+            """,
+            (canonical_skill(skill),),
+        ).fetchall()
+
+    def lookup_identities(self, keys: list[str]) -> dict[str, str]:
+        found: dict[str, str] = {}
+        keys = list(dict.fromkeys(keys))
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for row in self.conn.execute(f"SELECT identity_key, job_id FROM job_identity WHERE identity_key IN ({placeholders})", chunk):
+                found[row["identity_key"]] = row["job_id"]
+        return found
+
+    def add_identities(self, pairs: list[tuple[str, str]]) -> None:
+        """Record ``(identity_key, job_id)`` pairs; a key keeps the job it was first seen with."""
+        if not pairs:
+            return
+        self.conn.executemany("INSERT OR IGNORE INTO job_identity VALUES (?,?)", pairs)
+        self.conn.commit()
+
+    def reassign_identities(self, old_job_id: str, new_job_id: str) -> None:
+        """Point every identity key recorded for ``old_job_id`` at ``new_job_id``."""
+        self.conn.execute("UPDATE job_identity SET job_id=? WHERE job_id=?", (new_job_id, old_job_id))
+        self.conn.commit()
+
+    def is_merged_into(self, job_id: str, target_id: str) -> bool:
+        """Whether ``job_id`` was folded into the stored job ``target_id`` (listed in its ``merged_from``)."""
+        row = self.conn.execute("SELECT merged_from FROM jobs WHERE job_id=?", (target_id,)).fetchone()
+        return row is not None and job_id in json.loads(row["merged_from"] or "[]")
 
     def upsert_job(self, job: CanonicalJob) -> None:
-        existing = self.conn.execute("SELECT user_status, user_notes, first_seen, source_name FROM jobs WHERE job_id=?", (job.job_id,)).fetchone()
-        user_status = existing["user_status"] if existing else job.user_status
-        user_notes = existing["user_notes"] if existing else job.user_notes
-        first_seen = existing["first_seen"] if existing else job.first_seen
-        source_name = existing["source_name"] if existing else job.source_name
-        if existing and job.source_name not in source_name.split(","):
+        self.upsert_jobs([job])
+
+    def upsert_jobs(
+        self,
+        jobs: list[CanonicalJob],
+        identities: list[tuple[str, str]] | None = None,
+        sightings: list[tuple[str, str, str, str]] | None = None,
+    ) -> None:
+        """Insert or update a batch of jobs in one transaction.
+
+        User fields, ``first_seen`` and accumulated source names of stored rows are read with one
+        query per 500 jobs and kept; every job also records a ``job_sources_seen`` sighting.
+        ``identities`` (see :meth:`add_identities`) and extra ``(job_id, source_name, source_domain,
+        seen_at)`` ``sightings`` gathered alongside the batch are written in the same transaction.
+        """
+        identities = identities or []
+        sightings = sightings or []
+        if not jobs and not identities and not sightings:
+            return
+        existing: dict[str, dict] = {}
+        job_ids = list(dict.fromkeys(job.job_id for job in jobs))
+        for start in range(0, len(job_ids), 500):
+            chunk = job_ids[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for row in self.conn.execute(
+                f"SELECT job_id, user_status, user_notes, first_seen, source_name FROM jobs WHERE job_id IN ({placeholders})",
+                chunk,
+            ):
+                existing[row["job_id"]] = dict(row)
+        rows = []
+        for job in jobs:
+            # A job repeated within the batch sees the values its earlier copy will have written.
+            existing[job.job_id] = self._kept_fields(job, existing.get(job.job_id))
+            rows.append(self._job_values(job, existing[job.job_id]))
+        latest = {job.job_id: job for job in jobs}
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO jobs VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+                ON CONFLICT(job_id) DO UPDATE SET
+                    source_domain=excluded.source_domain,
+                    source_name=excluded.source_name,
+                    job_url=excluded.job_url,
+                    canonical_url=excluded.canonical_url,
+                    apply_url=excluded.apply_url,
+                    title=excluded.title,
+                    company=excluded.company,
+                    location_text=excluded.location_text,
+                    remote_flag=excluded.remote_flag,
+                    employment_type=excluded.employment_type,
+                    posted_date=excluded.posted_date,
+                    collected_at=excluded.collected_at,
+                    description_raw=excluded.description_raw,
+                    salary_text=excluded.salary_text,
+                    skills_extracted=excluded.skills_extracted,
+                    fetch_status=excluded.fetch_status,
+                    failure_reason=excluded.failure_reason,
+                    first_seen=excluded.first_seen,
+                    last_seen=excluded.last_seen,
+                    repost_count=excluded.repost_count,
+                    merged_from=excluded.merged_from,
+                    fit_score=excluded.fit_score,
+                    fit_grade=excluded.fit_grade,
+                    fit_notes=excluded.fit_notes,
+                    missing_must_have=excluded.missing_must_have,
+                    flags=excluded.flags,
+                    user_status=excluded.user_status,
+                    user_notes=excluded.user_notes
+                """,
+                rows,
+            )
+            self.conn.executemany(
+                "INSERT INTO job_sources_seen VALUES (?,?,?,?)",
+                [(job.job_id, job.source_name, job.source_domain, job.last_seen) for job in jobs],
+            )
+            self.conn.executemany("INSERT INTO job_sources_seen VALUES (?,?,?,?)", sightings)
+            self.conn.executemany("INSERT OR IGNORE INTO job_identity VALUES (?,?)", identities)
+            self.conn.executemany("DELETE FROM job_skills WHERE job_id=?", [(job_id,) for job_id in latest])
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO job_skills VALUES (?,?)",
+                [(job.job_id, self._skill_id(name)) for job in latest.values() for name in job.skills_extracted],
+            )
+
+    @staticmethod
+    def _kept_fields(job: CanonicalJob, existing: dict | None) -> dict:
+        """User fields and history a stored row keeps when ``job`` overwrites it."""
+        if not existing:
+            return {
+                "user_status": job.user_status,
+                "user_notes": job.user_notes,
+                "first_seen": job.first_seen,
+                "source_name": job.source_name,
+            }
+        source_name = existing["source_name"]
+        if job.source_name not in source_name.split(","):
             source_name = f"{source_name},{job.source_name}"
+        return {**existing, "source_name": source_name}
+
+    @staticmethod
+    def _job_values(job: CanonicalJob, kept: dict) -> tuple:
+        """Positional ``jobs`` row for ``job`` with the ``kept`` fields of the stored row."""
+        return (
+            job.job_id,
+            job.source_domain,
+            kept["source_name"],
+            job.job_url,
+            job.canonical_url,
+            job.apply_url,
+            job.title,
+            job.company,
+            job.location_text,
+            job.remote_flag,
+            job.employment_type,
+            job.posted_date,
+            job.collected_at,
+            job.description_raw,
+            job.salary_text,
+            json.dumps(job.skills_extracted),
+            job.fetch_status,
+            job.failure_reason,
+            kept["first_seen"],
+            job.last_seen,
+            job.repost_count,
+            json.dumps(job.merged_from),
+            job.fit_score,
+            job.fit_grade,
+            job.fit_notes,
+            json.dumps(job.missing_must_have),
+            json.dumps(job.flags),
+            kept["user_status"],
+            kept["user_notes"],
+        )
+
+    @staticmethod
+    def score_values(result: FitResult) -> tuple:
+        """``result`` as stored in the ``SCORE_COLUMNS`` of ``jobs`` / ``job_scores``."""
+        return (
+            result.fit_score,
+            result.fit_grade,
+            result.fit_notes,
+            json.dumps(result.missing_must_have),
+            json.dumps(result.flags),
+        )
 
+    def upsert_scores(self, job_id: str, results: list[FitResult]) -> None:
+        self.upsert_scores_many([(job_id, results)])
+
+    def upsert_scores_many(self, batch: list[tuple[str, list[FitResult]]]) -> None:
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO job_scores VALUES (?,?,?,?,?,?,?)",
+            [(job_id, result.profile, *self.score_values(result)) for job_id, results in batch for result in results],
+        )
+        self.conn.commit()
+
+    def get_scores(self, job_ids: list[str], primary_profile: str) -> dict[tuple[str, str], tuple]:
+        """Stored score values keyed by ``(job_id, profile)``.
+
+        Jobs stored before ``job_scores`` existed only have their fit in ``jobs``; it is reported
+        under ``primary_profile``.
+        """
+        found: dict[tuple[str, str], tuple] = {}
+        columns = ", ".join(SCORE_COLUMNS)
+        for start in range(0, len(job_ids), 500):
+            chunk = job_ids[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for row in self.conn.execute(f"SELECT job_id, {columns} FROM jobs WHERE job_id IN ({placeholders})", chunk):
+                found[(row["job_id"], primary_profile)] = tuple(row[name] for name in SCORE_COLUMNS)
+            for row in self.conn.execute(
+                f"SELECT job_id, profile, {columns} FROM job_scores WHERE job_id IN ({placeholders})", chunk
+            ):
+                found[(row["job_id"], row["profile"])] = tuple(row[name] for name in SCORE_COLUMNS)
+        return found
+
+    def update_scores(self, scores: list[tuple[str, FitResult]], primary_profile: str) -> None:
+        """Write rescored ``(job_id, result)`` pairs in one transaction.
+
+        Results for ``primary_profile`` also replace the fit columns of ``jobs``.
+        """
+        if not scores:
+            return
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO job_scores VALUES (?,?,?,?,?,?,?)",
+                [(job_id, result.profile, *self.score_values(result)) for job_id, result in scores],
+            )
+            self.conn.executemany(
+                "UPDATE jobs SET " + ", ".join(f"{name}=?" for name in SCORE_COLUMNS) + " WHERE job_id=?",
+                [(*self.score_values(result), job_id) for job_id, result in scores if result.profile == primary_profile],
+            )
+
+    def get_fingerprints(self) -> dict[str, str]:
+        return {row["profile"]: row["fingerprint"] for row in self.conn.execute("SELECT profile, fingerprint FROM score_fingerprints")}
+
+    def set_fingerprints(self, fingerprints: dict[str, str], scored_at: str) -> None:
+        """Record that every stored job is scored against these profile fingerprints."""
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO score_fingerprints VALUES (?,?,?)",
+            [(profile, fingerprint, scored_at) for profile, fingerprint in fingerprints.items()],
+        )
+        self.conn.commit()
+
+    def clear_fingerprints(self, profiles: list[str]) -> None:
+        self.conn.executemany("DELETE FROM score_fingerprints WHERE profile=?", [(profile,) for profile in profiles])
+        self.conn.commit()
+
+    def get_job_by_canonical_url(self, canonical_url: str) -> sqlite3.Row | None:
+        return self.conn.execute("SELECT * FROM jobs WHERE canonical_url=?", (canonical_url,)).fetchone()
+
+    def get_jobs_by_canonical_urls(self, canonical_urls: list[str]) -> dict[str, sqlite3.Row]:
+        """Batch form of :meth:`get_job_by_canonical_url`, one query per 500 URLs."""
+        rows: dict[str, sqlite3.Row] = {}
+        urls = list(dict.fromkeys(canonical_urls))
+        for start in range(0, len(urls), 500):
+            chunk = urls[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for row in self.conn.execute(f"SELECT * FROM jobs WHERE canonical_url IN ({placeholders})", chunk):
+                rows[row["canonical_url"]] = row
+        return rows
+
+    def add_sightings(self, job_id: str, sightings: list[tuple[str, str]], seen_at: str) -> None:
+        """Record extra ``(source_name, source_domain)`` sightings folded into ``job_id``."""
+        if not sightings:
+            return
+        self.conn.executemany(
+            "INSERT INTO job_sources_seen VALUES (?,?,?,?)",
+            [(job_id, name, domain, seen_at) for name, domain in sightings],
+        )
+        self.conn.commit()
+
+    def merge_sighting(
+        self, job_id: str, source_name: str, source_domain: str, seen_at: str, repost: bool = True
+    ) -> None:
+        """Fold a later sighting into an already stored job (same effect as :class:`DedupeService` merges).
+
+        ``repost=False`` records the sighting without counting it again (a repost folded in an earlier run).
+        """
         self.conn.execute(
             """
-            INSERT INTO jobs VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-            ON CONFLICT(job_id) DO UPDATE SET
-                source_domain=excluded.source_domain,
-                source_name=excluded.source_name,
-                job_url=excluded.job_url,
-                canonical_url=excluded.canonical_url,
-                apply_url=excluded.apply_url,
-                title=excluded.title,
-                company=excluded.company,
-                location_text=excluded.location_text,
-                remote_flag=excluded.remote_flag,
-                employment_type=excluded.employment_type,
-                posted_date=excluded.posted_date,
-                collected_at=excluded.collected_at,
-                description_raw=excluded.description_raw,
-                salary_text=excluded.salary_text,
-                skills_extracted=excluded.skills_extracted,
-                fetch_status=excluded.fetch_status,
-                failure_reason=excluded.failure_reason,
-                first_seen=excluded.first_seen,
-                last_seen=excluded.last_seen,
-                repost_count=excluded.repost_count,
-                merged_from=excluded.merged_from,
-                fit_score=excluded.fit_score,
-                fit_grade=excluded.fit_grade,
-                fit_notes=excluded.fit_notes,
-                missing_must_have=excluded.missing_must_have,
-                flags=excluded.flags,
-                user_status=excluded.user_status,
-                user_notes=excluded.user_notes
+            UPDATE jobs SET
+                repost_count=repost_count + ?,
+                last_seen=MAX(last_seen, ?),
+                source_name=CASE WHEN instr(',' || source_name || ',', ',' || ? || ',') > 0
+                    THEN source_name ELSE source_name || ',' || ? END
+            WHERE job_id=?
             """,
-            (
-                job.job_id,
-                job.source_domain,
-                source_name,
-                job.job_url,
-                job.canonical_url,
-                job.apply_url,
-                job.title,
-                job.company,
-                job.location_text,
-                job.remote_flag,
-                job.employment_type,
-                job.posted_date,
-                job.collected_at,
-                job.description_raw,
-                job.salary_text,
-                json.dumps(job.skills_extracted),
-                job.fetch_status,
-                job.failure_reason,
-                first_seen,
-                job.last_seen,
-                job.repost_count,
-                json.dumps(job.merged_from),
-                job.fit_score,
-                job.fit_grade,
-                job.fit_notes,
-                json.dumps(job.missing_must_have),
-                json.dumps(job.flags),
-                user_status,
-                user_notes,
-            ),
-        )
-        self.conn.execute(
-            "INSERT INTO job_sources_seen VALUES (?,?,?,?)",
-            (job.job_id, job.source_name, job.source_domain, job.last_seen),
+            (int(repost), seen_at, source_name, source_name, job_id),
         )
+        self.conn.execute("INSERT INTO job_sources_seen VALUES (?,?,?,?)", (job_id, source_name, source_domain, seen_at))
         self.conn.commit()
 
-    def list_jobs(self) -> list[sqlite3.Row]:
-        return self.conn.execute("SELECT * FROM jobs ORDER BY last_seen DESC").fetchall()
+    def merge_duplicate(self, job_id: str, duplicate: CanonicalJob) -> None:
+        """Fold ``duplicate`` (a repost under another URL) into the stored ``job_id``."""
+        row = self.conn.execute("SELECT merged_from FROM jobs WHERE job_id=?", (job_id,)).fetchone()
+        merged_from = json.loads(row["merged_from"] or "[]") if row else []
+        if duplicate.job_id != job_id and duplicate.job_id not in merged_from:
+            merged_from.append(duplicate.job_id)
+        self.conn.execute("UPDATE jobs SET merged_from=? WHERE job_id=?", (json.dumps(merged_from), job_id))
+        self.merge_sighting(job_id, duplicate.source_name, duplicate.source_domain, duplicate.last_seen)
+
+    def iter_jobs(
+        self, job_ids: list[str], profile: str | None = None, chunk_size: int = 500, primary_profile: str | None = None
+    ) -> Iterator[CanonicalJob]:
+        """Yield stored jobs for ``job_ids`` a chunk at a time, so callers never hold them all.
+
+        With ``profile``, fit fields come from that profile's ``job_scores`` row; see :meth:`list_jobs`.
+        """
+        select = self._select_for(profile, primary_profile)
+        for start in range(0, len(job_ids), chunk_size):
+            chunk = job_ids[start : start + chunk_size]
+            placeholders = ",".join("?" * len(chunk))
+            if profile is None:
+                cursor = self.conn.execute(f"SELECT * FROM jobs WHERE job_id IN ({placeholders})", chunk)
+            else:
+                cursor = self.conn.execute(f"{select} WHERE jobs.job_id IN ({placeholders})", [profile, *chunk])
+            rows = {row["job_id"]: row for row in cursor}
+            for job_id in chunk:
+                if job_id in rows:
+                    yield self.row_to_job(rows[job_id])
+
+    def iter_job_chunks(self, chunk_size: int = 500) -> Iterator[list[CanonicalJob]]:
+        """Yield every stored job, ``chunk_size`` at a time in ``job_id`` order."""
+        last = ""
+        while True:
+            rows = self.conn.execute(
+                "SELECT * FROM jobs WHERE job_id > ? ORDER BY job_id LIMIT ?", (last, chunk_size)
+            ).fetchall()
+            if not rows:
+                return
+            last = rows[-1]["job_id"]
+            yield [self.row_to_job(row) for row in rows]
+
+    @staticmethod
+    def row_to_job(row: sqlite3.Row) -> CanonicalJob:
+        data = dict(row)
+        for key in ("skills_extracted", "merged_from", "missing_must_have", "flags"):
+            data[key] = json.loads(data[key] or "[]")
+        return CanonicalJob(**data)
+
+    def _select_for(self, profile: str | None, primary_profile: str | None) -> str:
+        return self._primary_select if profile is not None and profile == primary_profile else self._profile_select
+
+    def list_jobs(self, profile: str | None = None, primary_profile: str | None = None) -> list[sqlite3.Row]:
+        """Stored jobs, newest first.
+
+        With ``profile``, fit fields come from that profile's ``job_scores`` row and are NULL for jobs
+        it has not scored. Jobs stored before ``job_scores`` existed only have their fit in ``jobs``;
+        it is reported when ``profile`` is ``primary_profile``.
+        """
+        if profile is None:
+            return self.conn.execute("SELECT * FROM jobs ORDER BY last_seen DESC").fetchall()
+        select = self._select_for(profile, primary_profile)
+        return self.conn.execute(f"{select} ORDER BY jobs.last_seen DESC", (profile,)).fetchall()
 
     def update_user_fields(self, job_id: str, status: str, notes: str) -> None:
         self.conn.execute("UPDATE jobs SET user_status=?, user_notes=? WHERE job_id=?", (status, notes, job_id))
@@ -185,9 +550,15 @@ class JobRepository:
         self.conn.commit()
 
     def add_run_error(self, run_id: int, domain: str, reason: str, trace_summary: str = "") -> None:
-        self.conn.execute(
+        self.add_run_errors(run_id, [(domain, reason, trace_summary)])
+
+    def add_run_errors(self, run_id: int, errors: list[tuple[str, str, str]]) -> None:
+        """Record ``(domain, reason, trace_summary)`` failures for a run in one transaction."""
+        if not errors:
+            return
+        self.conn.executemany(
             "INSERT INTO run_errors VALUES (?,?,?,?)",
-            (run_id, domain, reason, trace_summary),
+            [(run_id, domain, reason, trace_summary) for domain, reason, trace_summary in errors],
         )
         self.conn.commit()
 
@@ -196,3 +567,6 @@ class JobRepository:
 
     def list_failures(self) -> list[sqlite3.Row]:
         return self.conn.execute("SELECT * FROM run_errors ORDER BY run_id DESC").fetchall()
+
+    def close(self) -> None:
+        self.conn.close()
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import math
+import sqlite3
+import threading
+from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
+
+from jobpipeline.utils.text import tokenize_terms
+
+
+class TermIndex:
+    """Inverted index of stored jobs' terms, for BM25 similarity against a profile's resume.
+
+    Postings, document frequencies and corpus totals are adjusted per job as it is indexed, so
+    adding a batch of jobs costs in proportion to the batch, not the corpus. Scores are computed
+    at query time from whatever the index holds.
+    """
+
+    k1 = 1.2
+    b = 0.75
+
+    def __init__(self, db_path: str = "data/jobpipeline.db") -> None:
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS term_postings (
+                term TEXT,
+                job_id TEXT,
+                tf INTEGER,
+                PRIMARY KEY (term, job_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_term_postings_job ON term_postings(job_id);
+            CREATE TABLE IF NOT EXISTS term_df (
+                term TEXT PRIMARY KEY,
+                df INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS term_docs (
+                job_id TEXT PRIMARY KEY,
+                length INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS term_corpus (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                docs INTEGER,
+                total_length INTEGER
+            );
+            INSERT OR IGNORE INTO term_corpus VALUES (1, 0, 0);
+            """
+        )
+        self.conn.commit()
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return self.conn.execute("SELECT 1 FROM term_docs LIMIT 1").fetchone() is None
+
+    def add(self, job_id: str, text: str) -> None:
+        self.add_many([(job_id, text)])
+
+    def add_many(self, documents: Iterable[tuple[str, str]]) -> None:
+        """Index ``(job_id, text)`` pairs in one transaction, replacing earlier versions of those jobs."""
+        with self._lock, self.conn:
+            for job_id, text in documents:
+                self._remove(job_id)
+                counts = Counter(tokenize_terms(text))
+                length = sum(counts.values())
+                self.conn.executemany(
+                    "INSERT INTO term_postings VALUES (?,?,?)", [(term, job_id, tf) for term, tf in counts.items()]
+                )
+                self.conn.executemany(
+                    "INSERT INTO term_df VALUES (?, 1) ON CONFLICT(term) DO UPDATE SET df = df + 1",
+                    [(term,) for term in counts],
+                )
+                self.conn.execute("INSERT INTO term_docs VALUES (?,?)", (job_id, length))
+                self.conn.execute("UPDATE term_corpus SET docs = docs + 1, total_length = total_length + ? WHERE id = 1", (length,))
+
+    def _remove(self, job_id: str) -> None:
+        row = self.conn.execute("SELECT length FROM term_docs WHERE job_id=?", (job_id,)).fetchone()
+        if row is None:
+            return
+        terms = [(term,) for (term,) in self.conn.execute("SELECT term FROM term_postings WHERE job_id=?", (job_id,))]
+        self.conn.executemany("UPDATE term_df SET df = df - 1 WHERE term=?", terms)
+        self.conn.execute("DELETE FROM term_postings WHERE job_id=?", (job_id,))
+        self.conn.execute("DELETE FROM term_docs WHERE job_id=?", (job_id,))
+        self.conn.execute("UPDATE term_corpus SET docs = docs - 1, total_length = total_length - ? WHERE id = 1", (row[0],))
+
+    def similarity(self, query: str) -> dict[str, float]:
+        """BM25 of every job sharing a term with ``query``, as a percentage of the best attainable score.
+
+        Jobs missing from the result share no term with the query (similarity 0).
+        """
+        terms = list(dict.fromkeys(tokenize_terms(query)))
+        if not terms:
+            return {}
+        placeholders = ",".join("?" * len(terms))
+        with self._lock:
+            docs, total_length = self.conn.execute("SELECT docs, total_length FROM term_corpus WHERE id = 1").fetchone()
+            if not docs:
+                return {}
+            df = dict(self.conn.execute(f"SELECT term, df FROM term_df WHERE term IN ({placeholders})", terms))
+            postings = self.conn.execute(
+                f"""
+                SELECT p.term, p.job_id, p.tf, d.length FROM term_postings p
+                JOIN term_docs d ON d.job_id = p.job_id
+                WHERE p.term IN ({placeholders})
+                """,
+                terms,
+            ).fetchall()
+        idf = {term: math.log(1 + (docs - df.get(term, 0) + 0.5) / (df.get(term, 0) + 0.5)) for term in terms}
+        # A document saturating every query term scores sum(idf * (k1 + 1)); report against that.
+        ceiling = sum(idf.values()) * (self.k1 + 1)
+        average_length = total_length / docs
+        scores: dict[str, float] = {}
+        for term, job_id, tf, length in postings:
+            norm = tf + self.k1 * (1 - self.b + self.b * length / average_length)
+            scores[job_id] = scores.get(job_id, 0.0) + idf[term] * tf * (self.k1 + 1) / norm
+        return {job_id: round(100 * score / ceiling, 1) for job_id, score in scores.items()}
+
+    def close(self) -> None:
+        self.conn.close()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass(slots=True)
+class SourceWatermark:
+    """What a source had already produced: its newest publish date and the item keys seen."""
+
+    newest: str | None = None
+    seen: set[str] = field(default_factory=set)
+
+
+class WatermarkStore:
+    """Per-source high-water marks, so incremental runs only emit postings not processed before."""
+
+    def __init__(self, db_path: str = "data/jobpipeline.db") -> None:
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS source_watermarks (
+                source TEXT PRIMARY KEY,
+                newest TEXT,
+                updated_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS source_seen (
+                source TEXT,
+                item_key TEXT,
+                seen_at TEXT,
+                PRIMARY KEY (source, item_key)
+            );
+            """
+        )
+        self.conn.commit()
+
+    def load(self) -> dict[str, SourceWatermark]:
+        with self._lock:
+            marks = {source: SourceWatermark(newest) for source, newest in self.conn.execute("SELECT source, newest FROM source_watermarks")}
+            for source, key in self.conn.execute("SELECT source, item_key FROM source_seen"):
+                marks.setdefault(source, SourceWatermark()).seen.add(key)
+        return marks
+
+    def record(self, source: str, keys: list[str], newest: str | None, seen_at: str) -> None:
+        """Mark ``keys`` as processed for ``source`` and raise its watermark to ``newest``."""
+        with self._lock, self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO source_watermarks VALUES (?,?,?)
+                ON CONFLICT(source) DO UPDATE SET
+                    newest=CASE WHEN newest IS NULL OR excluded.newest > newest THEN excluded.newest ELSE newest END,
+                    updated_at=excluded.updated_at
+                """,
+                (source, newest, seen_at),
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO source_seen VALUES (?,?,?)", [(source, key, seen_at) for key in keys]
+            )
+
+    def prune(self, before: str) -> None:
+        """Forget item keys last seen before ``before``; such items are simply emitted again."""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM source_seen WHERE seen_at < ?", (before,))
+
+    def close(self) -> None:
+        self.conn.close()
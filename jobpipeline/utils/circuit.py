@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from jobpipeline.storage.domain_health import DomainHealthStore
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised instead of sending a request to a host whose circuit is open; never retried."""
+
+
+@dataclass(slots=True)
+class _HostState:
+    consecutive_failures: int = 0
+    opened_until: float = 0.0
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=50))
+    dirty: bool = False
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker with latency-based timeouts.
+
+    A host opens after ``failure_threshold`` consecutive failures in this run and stays open for
+    ``cooldown_seconds``; the cooldown is persisted, so later runs skip the host too. Once the
+    cooldown passes requests go through again, and the first failure re-opens it. Timeouts shrink towards
+    ``timeout_multiplier`` x the host's p95 latency, bounded by ``min_timeout`` and ``max_timeout``.
+    """
+
+    MIN_SAMPLES = 10
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        cooldown_seconds: float = 3600,
+        min_timeout: float = 5.0,
+        max_timeout: float = 20.0,
+        timeout_multiplier: float = 3.0,
+        store: DomainHealthStore | None = None,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_seconds = cooldown_seconds
+        self.min_timeout = min(min_timeout, max_timeout)
+        self.max_timeout = max_timeout
+        self.timeout_multiplier = timeout_multiplier
+        self.store = store
+        self._lock = threading.Lock()
+        self._hosts: dict[str, _HostState] = {}
+        if store is not None:
+            for host, (opened_until, samples) in store.load().items():
+                self._hosts[host] = _HostState(opened_until=opened_until, latencies=deque(samples, maxlen=50))
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState()
+        return state
+
+    def allow(self, host: str) -> bool:
+        with self._lock:
+            return self._state(host).opened_until <= time.time()
+
+    def timeout_for(self, host: str) -> float:
+        with self._lock:
+            samples = sorted(self._state(host).latencies)
+        if len(samples) < self.MIN_SAMPLES:
+            return self.max_timeout
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        return max(self.min_timeout, min(self.max_timeout, p95 * self.timeout_multiplier))
+
+    def record_success(self, host: str, latency: float) -> None:
+        with self._lock:
+            state = self._state(host)
+            state.consecutive_failures = 0
+            state.opened_until = 0.0
+            state.latencies.append(round(latency, 3))
+            state.dirty = True
+
+    def record_failure(self, host: str) -> None:
+        opened = False
+        with self._lock:
+            state = self._state(host)
+            state.consecutive_failures += 1
+            state.dirty = True
+            probing = 0 < state.opened_until <= time.time()
+            if probing or state.consecutive_failures >= self.failure_threshold:
+                state.opened_until = time.time() + self.cooldown_seconds
+                state.consecutive_failures = 0
+                opened = True
+        if opened:
+            # Save right away so a crash mid-run still keeps the host in cooldown.
+            self.save()
+
+    def save(self) -> None:
+        if self.store is None:
+            return
+        with self._lock:
+            dirty = {host: (s.opened_until, list(s.latencies)) for host, s in self._hosts.items() if s.dirty}
+            for host in dirty:
+                self._hosts[host].dirty = False
+        if dirty:
+            self.store.save(dirty)
@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+import importlib.util
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from jobpipeline.utils.circuit import CircuitBreaker, CircuitOpenError
+
+if TYPE_CHECKING:
+    from jobpipeline.storage.domain_health import DomainHealthStore
+    from jobpipeline.storage.http_cache import CacheEntry, HttpCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HTTP_SETTINGS: dict[str, Any] = {
+    "timeout_seconds": 20,
+    "connect_timeout_seconds": 10,
+    "max_connections": 20,
+    "max_keepalive_connections": 10,
+    "max_connections_per_host": 4,
+    "keepalive_expiry_seconds": 30,
+    "http2": False,
+    "cache_enabled": True,
+    "cache_max_mb": 200,
+    "circuit_failure_threshold": 5,
+    "circuit_cooldown_minutes": 60,
+    "adaptive_timeouts": True,
+    "min_timeout_seconds": 5,
+}
+
+USER_AGENT = "JobPipeline/0.1 (+local job tracker)"
+
+# Response header set by the caching transports: "miss", "revalidated" (304) or "unchanged".
+CACHE_STATUS_HEADER = "X-JobPipeline-Cache"
+# Request extension for ``client.stream(...)`` callers that may stop reading early. The caching
+# transports then pass the body through as it arrives and only cache it if it is read to the end.
+STREAM_EXTENSION = "jobpipeline.stream"
+
+
+def http_settings(config: dict[str, Any] | None) -> dict[str, Any]:
+    """Return the ``http`` config section merged over the defaults."""
+    merged = dict(DEFAULT_HTTP_SETTINGS)
+    merged.update((config or {}).get("http") or {})
+    return merged
+
+
+def _use_http2(settings: dict[str, Any]) -> bool:
+    http2 = bool(settings["http2"])
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning("http2_unavailable", extra={"extra_fields": {"hint": "pip install jobpipeline[http2]"}})
+        return False
+    return http2
+
+
+def _transport_kwargs(settings: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "limits": httpx.Limits(
+            max_connections=settings["max_connections"],
+            max_keepalive_connections=settings["max_keepalive_connections"],
+            keepalive_expiry=settings["keepalive_expiry_seconds"],
+        ),
+        "http2": _use_http2(settings),
+    }
+
+
+def _client_kwargs(settings: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "timeout": httpx.Timeout(settings["timeout_seconds"], connect=settings["connect_timeout_seconds"]),
+        "headers": {"User-Agent": USER_AGENT},
+    }
+
+
+def build_http_client(
+    settings: dict[str, Any], cache: HttpCache | None = None, breaker: CircuitBreaker | None = None
+) -> httpx.Client:
+    transport: httpx.BaseTransport = httpx.HTTPTransport(**_transport_kwargs(settings))
+    if cache is not None:
+        transport = CachingTransport(transport, cache)
+    if breaker is not None:
+        transport = GuardedTransport(transport, breaker)
+    return httpx.Client(transport=transport, **_client_kwargs(settings))
+
+
+def build_async_http_client(
+    settings: dict[str, Any], cache: HttpCache | None = None, breaker: CircuitBreaker | None = None
+) -> httpx.AsyncClient:
+    transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(**_transport_kwargs(settings))
+    if cache is not None:
+        transport = AsyncCachingTransport(transport, cache)
+    if breaker is not None:
+        transport = AsyncGuardedTransport(transport, breaker)
+    return httpx.AsyncClient(transport=transport, **_client_kwargs(settings))
+
+
+def build_circuit_breaker(settings: dict[str, Any], store: DomainHealthStore | None = None) -> CircuitBreaker:
+    max_timeout = float(settings["timeout_seconds"])
+    return CircuitBreaker(
+        failure_threshold=settings["circuit_failure_threshold"],
+        cooldown_seconds=settings["circuit_cooldown_minutes"] * 60,
+        min_timeout=float(settings["min_timeout_seconds"]) if settings["adaptive_timeouts"] else max_timeout,
+        max_timeout=max_timeout,
+        store=store,
+    )
+
+
+class HttpClientFactory:
+    """Builds sync and async clients that share pool settings, the HTTP cache and the circuit breaker."""
+
+    def __init__(
+        self,
+        settings: dict[str, Any] | None = None,
+        cache: HttpCache | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        self.settings = settings or DEFAULT_HTTP_SETTINGS
+        self.cache = cache
+        self.breaker = breaker
+
+    def client(self) -> httpx.Client:
+        return build_http_client(self.settings, self.cache, self.breaker)
+
+    def async_client(self) -> httpx.AsyncClient:
+        return build_async_http_client(self.settings, self.cache, self.breaker)
+
+
+class _Guard:
+    """Circuit-breaker checks and adaptive timeouts shared by the sync and async guarded transports."""
+
+    def __init__(self, breaker: CircuitBreaker) -> None:
+        self.breaker = breaker
+
+    def before(self, request: httpx.Request) -> float:
+        host = request.url.host
+        if not self.breaker.allow(host):
+            raise CircuitOpenError(f"circuit open for {host}", request=request)
+        timeout = dict(request.extensions.get("timeout") or {})
+        limit = self.breaker.timeout_for(host)
+        for key in ("read", "write"):
+            if timeout.get(key) is None or timeout[key] > limit:
+                timeout[key] = limit
+        request.extensions["timeout"] = timeout
+        return time.monotonic()
+
+    def after(self, request: httpx.Request, started: float, response: httpx.Response | None) -> None:
+        host = request.url.host
+        if response is None or response.status_code >= 500:
+            self.breaker.record_failure(host)
+        elif response.status_code != 429:
+            self.breaker.record_success(host, time.monotonic() - started)
+
+
+class GuardedTransport(httpx.BaseTransport):
+    def __init__(self, inner: httpx.BaseTransport, breaker: CircuitBreaker) -> None:
+        self.inner = inner
+        self.guard = _Guard(breaker)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        started = self.guard.before(request)
+        try:
+            response = self.inner.handle_request(request)
+        except httpx.TransportError:
+            self.guard.after(request, started, None)
+            raise
+        self.guard.after(request, started, response)
+        return response
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class AsyncGuardedTransport(httpx.AsyncBaseTransport):
+    def __init__(self, inner: httpx.AsyncBaseTransport, breaker: CircuitBreaker) -> None:
+        self.inner = inner
+        self.guard = _Guard(breaker)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = self.guard.before(request)
+        try:
+            response = await self.inner.handle_async_request(request)
+        except httpx.TransportError:
+            self.guard.after(request, started, None)
+            raise
+        self.guard.after(request, started, response)
+        return response
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+class _CachePolicy:
+    """Request/response rewriting shared by the sync and async caching transports."""
+
+    def __init__(self, cache: HttpCache) -> None:
+        self.cache = cache
+
+    def prepare(self, request: httpx.Request) -> CacheEntry | None:
+        if request.method != "GET":
+            return None
+        entry = self.cache.lookup(str(request.url))
+        if entry is not None:
+            for name, value in self.cache.conditional_headers(entry).items():
+                request.headers.setdefault(name, value)
+        return entry
+
+    def replay(self, request: httpx.Request, entry: CacheEntry) -> httpx.Response:
+        self.cache.touch(entry.url)
+        headers = {CACHE_STATUS_HEADER: "revalidated"}
+        if entry.content_type:
+            headers["Content-Type"] = entry.content_type
+        if entry.content_encoding:
+            headers["Content-Encoding"] = entry.content_encoding
+        return httpx.Response(200, headers=headers, content=entry.body, request=request)
+
+    @staticmethod
+    def cacheable(request: httpx.Request, response: httpx.Response) -> bool:
+        return (
+            request.method == "GET"
+            and response.status_code == 200
+            and ("etag" in response.headers or "last-modified" in response.headers)
+        )
+
+    def save(
+        self,
+        request: httpx.Request,
+        response: httpx.Response,
+        body: bytes,
+        content_encoding: str | None,
+        entry: CacheEntry | None,
+    ) -> httpx.Response:
+        digest = self._store(request, response, body, content_encoding)
+        status = "unchanged" if entry is not None and entry.body_hash == digest else "miss"
+        return httpx.Response(
+            response.status_code,
+            headers=self._headers(response, status, content_encoding),
+            content=body,
+            request=request,
+            extensions=self._extensions(response),
+        )
+
+    def tee(
+        self, request: httpx.Request, response: httpx.Response, stream: httpx.SyncByteStream | httpx.AsyncByteStream
+    ) -> httpx.Response:
+        """Response whose raw body streams through ``stream``, which caches it once fully read."""
+        return httpx.Response(
+            response.status_code,
+            headers=self._headers(response, "miss", response.headers.get("content-encoding")),
+            stream=stream,
+            request=request,
+            extensions=self._extensions(response),
+        )
+
+    def _store(
+        self, request: httpx.Request, response: httpx.Response, body: bytes, content_encoding: str | None
+    ) -> str:
+        return self.cache.store(
+            str(request.url),
+            response.headers.get("etag"),
+            response.headers.get("last-modified"),
+            response.headers.get("content-type"),
+            content_encoding,
+            body,
+        )
+
+    @staticmethod
+    def _headers(response: httpx.Response, status: str, content_encoding: str | None) -> httpx.Headers:
+        headers = httpx.Headers(response.headers)
+        headers[CACHE_STATUS_HEADER] = status
+        # Raw bytes keep their original Content-Encoding so the client decodes them as usual.
+        if content_encoding is None:
+            headers.pop("content-encoding", None)
+        return headers
+
+    @staticmethod
+    def _extensions(response: httpx.Response) -> dict[str, Any]:
+        return {k: v for k, v in response.extensions.items() if k in ("http_version", "reason_phrase")}
+
+
+class _TeeStream(httpx.SyncByteStream):
+    """Passes raw chunks through and caches the body only if the caller reads all of it."""
+
+    def __init__(self, policy: _CachePolicy, request: httpx.Request, response: httpx.Response) -> None:
+        self.policy = policy
+        self.request = request
+        self.response = response
+
+    def __iter__(self):  # type: ignore[no-untyped-def]
+        chunks: list[bytes] = []
+        for chunk in self.response.iter_raw():
+            chunks.append(chunk)
+            yield chunk
+        self.policy._store(self.request, self.response, b"".join(chunks), self.response.headers.get("content-encoding"))
+
+    def close(self) -> None:
+        self.response.close()
+
+
+class _AsyncTeeStream(httpx.AsyncByteStream):
+    def __init__(self, policy: _CachePolicy, request: httpx.Request, response: httpx.Response) -> None:
+        self.policy = policy
+        self.request = request
+        self.response = response
+
+    async def __aiter__(self):  # type: ignore[no-untyped-def]
+        chunks: list[bytes] = []
+        async for chunk in self.response.aiter_raw():
+            chunks.append(chunk)
+            yield chunk
+        self.policy._store(self.request, self.response, b"".join(chunks), self.response.headers.get("content-encoding"))
+
+    async def aclose(self) -> None:
+        await self.response.aclose()
+
+
+class CachingTransport(httpx.BaseTransport):
+    """Adds If-None-Match/If-Modified-Since from the cache and serves 304s from stored bodies."""
+
+    def __init__(self, inner: httpx.BaseTransport, cache: HttpCache) -> None:
+        self.inner = inner
+        self.policy = _CachePolicy(cache)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        entry = self.policy.prepare(request)
+        response = self.inner.handle_request(request)
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            return self.policy.replay(request, entry)
+        if not self.policy.cacheable(request, response):
+            return response
+        if response.is_stream_consumed:
+            # Transports such as MockTransport hand back an already-decoded body.
+            return self.policy.save(request, response, response.content, None, entry)
+        if request.extensions.get(STREAM_EXTENSION):
+            return self.policy.tee(request, response, _TeeStream(self.policy, request, response))
+        try:
+            body = b"".join(response.iter_raw())
+        finally:
+            response.close()
+        return self.policy.save(request, response, body, response.headers.get("content-encoding"), entry)
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class AsyncCachingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, inner: httpx.AsyncBaseTransport, cache: HttpCache) -> None:
+        self.inner = inner
+        self.policy = _CachePolicy(cache)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        entry = self.policy.prepare(request)
+        response = await self.inner.handle_async_request(request)
+        if response.status_code == 304 and entry is not None:
+            await response.aclose()
+            return self.policy.replay(request, entry)
+        if not self.policy.cacheable(request, response):
+            return response
+        if response.is_stream_consumed:
+            return self.policy.save(request, response, response.content, None, entry)
+        if request.extensions.get(STREAM_EXTENSION):
+            return self.policy.tee(request, response, _AsyncTeeStream(self.policy, request, response))
+        try:
+            body = b"".join([chunk async for chunk in response.aiter_raw()])
+        finally:
+            await response.aclose()
+        return self.policy.save(request, response, body, response.headers.get("content-encoding"), entry)
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import re
-from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import parse_qs, parse_qsl, urlencode, urlparse, urlunparse
 
 
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in is it of on or our the to we will with you your".split()
+)
 NOISE_PARAMS = {"utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content", "ref"}
+_GREENHOUSE_PATH_RE = re.compile(r"/jobs/(\d+)")
+_LEVER_PATH_RE = re.compile(r"^/[^/]+/([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})", re.IGNORECASE)
 
 
 def normalize_whitespace(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+    return " ".join(text.split())
 
 
 def canonicalize_url(url: str) -> str:
@@ -18,6 +25,25 @@ def canonicalize_url(url: str) -> str:
     return urlunparse(clean)
 
 
+def identity_keys(canonical_url: str) -> list[str]:
+    """Identity keys for a posting, most specific first: ATS posting ids, then the canonical URL.
+
+    Greenhouse ids come from ``gh_jid`` (company career pages) or ``/jobs/<id>`` on greenhouse.io;
+    Lever ids are the posting UUID in ``jobs.lever.co/<company>/<uuid>``.
+    """
+    parsed = urlparse(canonical_url)
+    keys: list[str] = []
+    gh_jid = parse_qs(parsed.query).get("gh_jid")
+    if gh_jid and gh_jid[0].isdigit():
+        keys.append(f"greenhouse:{gh_jid[0]}")
+    elif parsed.netloc.endswith("greenhouse.io") and (match := _GREENHOUSE_PATH_RE.search(parsed.path)):
+        keys.append(f"greenhouse:{match.group(1)}")
+    if parsed.netloc.endswith("lever.co") and (match := _LEVER_PATH_RE.match(parsed.path)):
+        keys.append(f"lever:{match.group(1).lower()}")
+    keys.append(f"url:{canonical_url}")
+    return keys
+
+
 def extract_years_requirement(text: str) -> int | None:
     match = re.search(r"(\d+)\+?\s+years", text.lower())
     if match:
@@ -25,6 +51,23 @@ def extract_years_requirement(text: str) -> int | None:
     return None
 
 
-def tokenize_skills(text: str) -> list[str]:
-    tokens = re.findall(r"[a-zA-Z][a-zA-Z0-9+#\-.]{1,30}", text.lower())
-    return sorted(set(tokens))
+def tokenize_terms(text: str) -> list[str]:
+    """Lowercased index terms of ``text`` in order, repeats kept (for term frequencies)."""
+    terms = (token.rstrip(".-") for token in re.findall(r"[a-z0-9][a-z0-9+#\-.]{0,30}", text.lower()))
+    return [term for term in terms if term and term not in STOPWORDS]
+
+
+def parse_feed_date(value: str) -> str | None:
+    """Normalize an RFC 822 (RSS) or RFC 3339 (Atom) timestamp to a naive UTC ISO string."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed.replace(microsecond=0).isoformat()
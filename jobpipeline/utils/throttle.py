@@ -1,17 +1,139 @@
 from __future__ import annotations
 
+import asyncio
+import random
+import threading
 import time
-from collections import defaultdict
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
 
+import httpx
 
-class DomainThrottle:
-    def __init__(self, delay_seconds: float) -> None:
-        self.delay_seconds = delay_seconds
-        self.last_called: dict[str, float] = defaultdict(float)
+# Statuses that mean "slow down and try again later" rather than "this will never work".
+THROTTLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Only network hiccups and throttle/5xx responses are worth retrying; 404s and parse errors are not."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in THROTTLE_STATUSES
+    return isinstance(exc, (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError))
+
+
+def retry_after_seconds(response: httpx.Response) -> float | None:
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def backoff_delay(attempt: int, base_seconds: float, max_seconds: float) -> float:
+    """Exponential backoff with full jitter for retry ``attempt`` (0-based)."""
+    return random.uniform(0, min(max_seconds, base_seconds * (2**attempt)))
+
+
+@dataclass(slots=True)
+class _Bucket:
+    interval: float
+    next_allowed: float = float("-inf")
+    blocked_until: float = float("-inf")
+    successes: int = 0
+
+
+class DomainRateLimiter:
+    """Per-domain token bucket (one token per ``interval``) that adapts to server feedback.
+
+    Throttle responses (429/5xx) double the domain's interval and honour ``Retry-After``; a run of
+    ``recovery_successes`` successes shrinks it back towards the configured base delay. The same
+    instance serves sync callers (:meth:`wait`) and coroutines (:meth:`wait_async`).
+    """
+
+    def __init__(
+        self,
+        delay_seconds: float,
+        max_delay_seconds: float = 120.0,
+        recovery_successes: int = 5,
+    ) -> None:
+        self.base_interval = max(0.0, float(delay_seconds))
+        self.max_interval = max(self.base_interval, float(max_delay_seconds))
+        self.recovery_successes = max(1, recovery_successes)
+        self._buckets: dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+        self._async_locks: dict[str, asyncio.Lock] = {}
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+
+    def _bucket(self, domain: str) -> _Bucket:
+        bucket = self._buckets.get(domain)
+        if bucket is None:
+            bucket = self._buckets[domain] = _Bucket(interval=self.base_interval)
+        return bucket
+
+    def _delay(self, domain: str) -> float:
+        bucket = self._bucket(domain)
+        return max(bucket.next_allowed, bucket.blocked_until) - time.monotonic()
+
+    def _consume(self, domain: str) -> None:
+        bucket = self._bucket(domain)
+        bucket.next_allowed = time.monotonic() + bucket.interval
+
+    def interval(self, domain: str) -> float:
+        with self._lock:
+            return self._bucket(domain).interval
 
     def wait(self, domain: str) -> None:
-        elapsed = time.time() - self.last_called[domain]
-        to_sleep = self.delay_seconds - elapsed
-        if to_sleep > 0:
-            time.sleep(to_sleep)
-        self.last_called[domain] = time.time()
+        while True:
+            with self._lock:
+                delay = self._delay(domain)
+                if delay <= 0:
+                    self._consume(domain)
+                    return
+            time.sleep(delay)
+
+    async def wait_async(self, domain: str, slots: asyncio.Semaphore | None = None) -> None:
+        """Wait for the domain's token, then take one of ``slots`` (if given) before spending it.
+
+        Taking the slot while still holding the domain lock keeps requests to one domain spaced
+        even when they queue for a slot. The caller releases the slot.
+        """
+        async with self._domain_lock(domain):
+            while True:
+                with self._lock:
+                    delay = self._delay(domain)
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+            if slots is not None:
+                await slots.acquire()
+            with self._lock:
+                self._consume(domain)
+
+    def _domain_lock(self, domain: str) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if loop is not self._async_loop:
+            # asyncio locks are bound to one loop; each collect_many runs its own.
+            self._async_loop = loop
+            self._async_locks = {}
+        return self._async_locks.setdefault(domain, asyncio.Lock())
+
+    def record_success(self, domain: str) -> None:
+        with self._lock:
+            bucket = self._bucket(domain)
+            bucket.successes += 1
+            if bucket.successes >= self.recovery_successes and bucket.interval > self.base_interval:
+                bucket.interval = max(self.base_interval, bucket.interval * 0.5)
+                bucket.successes = 0
+
+    def record_throttle(self, domain: str, retry_after: float | None = None) -> None:
+        with self._lock:
+            bucket = self._bucket(domain)
+            bucket.successes = 0
+            bucket.interval = min(self.max_interval, max(bucket.interval * 2, 1.0))
+            if retry_after is not None:
+                bucket.blocked_until = time.monotonic() + min(retry_after, self.max_interval)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import Any
+
+from jobpipeline.core.models import CanonicalJob, SearchProfile
+
+
+def make_job(job_id: str = "j1", canonical_url: str | None = None, source_name: str = "RSS", **fields: Any) -> CanonicalJob:
+    """A collected job at ``canonical_url`` (``https://example.com/<job_id>`` by default); ``fields`` override the rest."""
+    url = canonical_url or f"https://example.com/{job_id}"
+    values: dict[str, Any] = {
+        "job_id": job_id,
+        "source_domain": "example.com",
+        "source_name": source_name,
+        "job_url": url,
+        "canonical_url": url,
+        "apply_url": url,
+        "title": "IT Support Specialist",
+        "company": "Acme",
+        "location_text": "Remote",
+        "remote_flag": "Y",
+        "employment_type": "FT",
+        "posted_date": "2026-01-01",
+        "collected_at": "2026-01-02T00:00:00",
+        "description_raw": "Great role troubleshooting customer service active directory 2 years",
+        "salary_text": None,
+        "skills_extracted": ["troubleshooting"],
+        "fetch_status": "success",
+        "failure_reason": None,
+        "first_seen": "2026-01-02T00:00:00",
+        "last_seen": "2026-01-02T00:00:00",
+        "repost_count": 0,
+        "merged_from": [],
+        "fit_score": 0,
+        "fit_grade": "D",
+        "fit_notes": "",
+        "missing_must_have": [],
+        "flags": [],
+    }
+    values.update(fields)
+    return CanonicalJob(**values)
+
+
+def make_profile(**fields: Any) -> SearchProfile:
+    """A remote ``Network Engineer`` profile with no keywords; ``fields`` override any of it."""
+    values: dict[str, Any] = {
+        "name": "default",
+        "target_titles": ["Network Engineer"],
+        "adjacent_titles": [],
+        "location_mode": "remote",
+        "city": "",
+        "radius_km": 0,
+        "experience_min_years": 1,
+        "experience_max_years": 3,
+        "must_have_keywords": [],
+        "nice_to_have_keywords": [],
+        "exclude_keywords": [],
+        "time_window_days": 7,
+        "master_resume_skills": [],
+    }
+    values.update(fields)
+    return SearchProfile(**values)
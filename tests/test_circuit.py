@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+
+import httpx
+
+from jobpipeline.collectors.job_collector import JobCollector
+from jobpipeline.core.models import SourceItem
+from jobpipeline.storage.domain_health import DomainHealthStore
+from jobpipeline.utils.circuit import CircuitBreaker
+from jobpipeline.utils.http import GuardedTransport
+
+
+def test_open_circuit_skips_host_and_persists_cooldown(tmp_path: Path) -> None:
+    hits: Counter[str] = Counter()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hits[request.url.host] += 1
+        if request.url.host == "down.example":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, text="<html><title>Up</title><body>ok</body></html>")
+
+    store = DomainHealthStore(str(tmp_path / "health.db"))
+    breaker = CircuitBreaker(failure_threshold=3, cooldown_seconds=600, store=store)
+    client = httpx.Client(transport=GuardedTransport(httpx.MockTransport(handler), breaker))
+    collector = JobCollector(per_domain_delay_seconds=0, max_retries=1, client=client, backoff_base_seconds=0)
+
+    jobs = [
+        collector.collect(SourceItem(job_url=f"https://down.example/jobs/{idx}", source_name="RSS", source_domain="d"))
+        for idx in range(5)
+    ]
+    up = collector.collect(SourceItem(job_url="https://up.example/jobs/1", source_name="RSS", source_domain="u"))
+
+    assert all(job.fetch_status == "failed" for job in jobs)
+    assert hits["down.example"] == 3
+    assert "circuit open" in (jobs[-1].failure_reason or "")
+    assert up.fetch_status == "success"
+
+    # A fresh breaker (next run) loads the cooldown and still refuses the host.
+    assert not CircuitBreaker(store=DomainHealthStore(str(tmp_path / "health.db"))).allow("down.example")
+
+
+def test_timeouts_adapt_to_recorded_latency() -> None:
+    breaker = CircuitBreaker(min_timeout=2, max_timeout=20, timeout_multiplier=3)
+    assert breaker.timeout_for("fast.example") == 20
+    for _ in range(20):
+        breaker.record_success("fast.example", 0.4)
+        breaker.record_success("slow.example", 9.0)
+    assert breaker.timeout_for("fast.example") == 2
+    assert breaker.timeout_for("slow.example") == 20
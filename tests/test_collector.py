@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from jobpipeline.collectors.job_collector import JobCollector
+from jobpipeline.collectors.skills import extract_skills
+from jobpipeline.core.models import SourceItem
+from jobpipeline.utils.throttle import DomainRateLimiter, is_transient, retry_after_seconds
+
+PAGE = """<html><head><title>{title}</title>
+<script type="application/ld+json">
+{{"@type": "JobPosting", "title": "{title}", "hiringOrganization": {{"name": "Acme"}},
+ "description": "<p>Remote troubleshooting role</p>"}}
+</script></head><body><p>ignored</p></body></html>"""
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path.startswith("/missing"):
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = PAGE.format(title=f"Job {self.path.rsplit('/', 1)[-1]}").encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        return
+
+
+@pytest.fixture()
+def page_server() -> Iterator[int]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1]
+    server.shutdown()
+
+
+def test_collect_many_preserves_order_across_domains(page_server: int) -> None:
+    items = [
+        SourceItem(job_url=f"http://{host}:{page_server}/jobs/{idx}", source_name="RSS", source_domain=host)
+        for idx, host in enumerate(["127.0.0.1", "localhost", "127.0.0.1", "localhost"])
+    ]
+    items.append(SourceItem(job_url=f"http://127.0.0.1:{page_server}/missing/9", source_name="RSS", source_domain="x"))
+    collector = JobCollector(per_domain_delay_seconds=0, max_retries=0, concurrency=2)
+
+    jobs = collector.collect_many(items)
+
+    assert [job.title for job in jobs[:4]] == ["Job 0", "Job 1", "Job 2", "Job 3"]
+    assert all(job.fetch_status == "success" for job in jobs[:4])
+    assert jobs[4].fetch_status == "failed"
+
+
+def test_async_throttle_spaces_same_domain_only() -> None:
+    limiter = DomainRateLimiter(delay_seconds=0.2)
+    stamps: dict[str, list[float]] = {"a": [], "b": []}
+
+    async def hit(domain: str) -> None:
+        await limiter.wait_async(domain)
+        stamps[domain].append(time.monotonic())
+
+    async def main() -> float:
+        started = time.monotonic()
+        await asyncio.gather(hit("a"), hit("a"), hit("b"), hit("b"))
+        return time.monotonic() - started
+
+    elapsed = asyncio.run(main())
+    for domain in ("a", "b"):
+        first, second = sorted(stamps[domain])
+        assert second - first >= 0.19
+    # Both domains wait in parallel, so the run costs one delay rather than two.
+    assert elapsed < 0.35
+
+
+def test_parse_pool_matches_inline_parsing(page_server: int) -> None:
+    items = [
+        SourceItem(job_url=f"http://127.0.0.1:{page_server}/jobs/{idx}", source_name="RSS", source_domain="127.0.0.1")
+        for idx in range(3)
+    ]
+    inline = JobCollector(per_domain_delay_seconds=0, max_retries=0).collect_many(items)
+    pooled_collector = JobCollector(per_domain_delay_seconds=0, max_retries=0, parse_workers=2)
+    pooled = pooled_collector.collect_many(items)
+
+    for left, right in zip(inline, pooled):
+        left.collected_at = left.first_seen = left.last_seen = right.collected_at
+        assert left == right
+    assert pooled_collector.parse_paths == {"json_ld": 3}
+
+
+def test_retries_only_transient_failures() -> None:
+    hits: Counter[str] = Counter()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hits[request.url.path] += 1
+        if request.url.path == "/gone":
+            return httpx.Response(404)
+        if hits[request.url.path] == 1:
+            return httpx.Response(503, headers={"Retry-After": "0"})
+        return httpx.Response(200, text=PAGE.format(title="Recovered"))
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    collector = JobCollector(
+        per_domain_delay_seconds=0, max_retries=3, client=client, backoff_base_seconds=0, max_delay_seconds=0.05
+    )
+
+    recovered = collector.collect(SourceItem(job_url="https://x.example/flaky", source_name="RSS", source_domain="x"))
+    gone = collector.collect(SourceItem(job_url="https://x.example/gone", source_name="RSS", source_domain="x"))
+
+    assert recovered.fetch_status == "success"
+    assert hits["/flaky"] == 2
+    assert gone.fetch_status == "failed"
+    assert hits["/gone"] == 1
+    # The 503 slowed the domain down; it has not seen enough successes to speed back up yet.
+    assert collector.limiter.interval("x.example") == 0.05
+
+
+def test_limiter_backs_off_and_recovers() -> None:
+    limiter = DomainRateLimiter(delay_seconds=2, recovery_successes=2)
+    limiter.record_throttle("a.example")
+    limiter.record_throttle("a.example")
+    assert limiter.interval("a.example") == 8
+    for _ in range(4):
+        limiter.record_success("a.example")
+    assert limiter.interval("a.example") == 2
+    assert limiter.interval("b.example") == 2
+
+
+def test_transient_classification_and_retry_after() -> None:
+    request = httpx.Request("GET", "https://x.example/")
+    throttled = httpx.Response(429, headers={"Retry-After": "7"}, request=request)
+    assert is_transient(httpx.HTTPStatusError("429", request=request, response=throttled))
+    assert not is_transient(httpx.HTTPStatusError("404", request=request, response=httpx.Response(404)))
+    assert is_transient(httpx.ReadTimeout("slow", request=request))
+    assert not is_transient(ValueError("bad html"))
+    assert retry_after_seconds(throttled) == 7
+    assert retry_after_seconds(httpx.Response(503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0
+
+
+def test_skill_dictionary_matches_phrases_and_synonyms() -> None:
+    text = "Our team supports Active\nDirectory, O365 and Palo Alto firewalls; BGP/OSPF routing. The role is on-site."
+
+    assert extract_skills(text) == ["active directory", "bgp", "firewalls", "microsoft 365", "ospf", "palo alto", "routing"]
+    assert extract_skills("eBGP peering and ospfv3") == []
+    assert extract_skills("You will excel in a fast-paced team") == []
+    assert extract_skills("Advanced Excel spreadsheets on Windows Server 2019") == ["microsoft excel", "windows server"]
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import httpx
+from factories import make_profile
+
+from jobpipeline.sources.rss import GenericRSSAdapter
+from jobpipeline.storage.http_cache import HttpCache
+from jobpipeline.utils.http import CACHE_STATUS_HEADER, STREAM_EXTENSION, CachingTransport
+
+
+def test_conditional_get_serves_304_from_cache(tmp_path: Path) -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"ETag": '"v1"', "Content-Type": "text/html"}, content=b"<p>job</p>")
+
+    cache = HttpCache(str(tmp_path / "cache.db"))
+    client = httpx.Client(transport=CachingTransport(httpx.MockTransport(handler), cache))
+
+    first = client.get("https://boards.example.com/jobs/1")
+    second = client.get("https://boards.example.com/jobs/1")
+
+    assert first.headers[CACHE_STATUS_HEADER] == "miss"
+    assert second.status_code == 200
+    assert second.headers[CACHE_STATUS_HEADER] == "revalidated"
+    assert second.text == "<p>job</p>"
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = HttpCache(str(tmp_path / "cache.db"), max_bytes=1500)
+    for idx in range(3):
+        # Random bytes so zlib cannot shrink the bodies below the budget.
+        cache.store(f"https://x.example/{idx}", f'"{idx}"', None, None, None, os.urandom(600))
+    assert cache.lookup("https://x.example/0") is None
+    assert cache.lookup("https://x.example/2") is not None
+    assert cache.total_bytes <= 1500
+
+
+class CountingStream(httpx.SyncByteStream):
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = chunks
+        self.pulled = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self.chunks:
+            self.pulled += 1
+            yield chunk
+
+
+def test_streamed_feed_stops_early_through_the_cache(tmp_path: Path) -> None:
+    entries = "".join(f"<item><title>Job {i}</title><link>https://jobs.example.com/{i}</link></item>" for i in range(2000))
+    body = f"<rss><channel>{entries}</channel></rss>".encode()
+    chunks = [body[start : start + 1024] for start in range(0, len(body), 1024)]
+    streams: list[CountingStream] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        streams.append(CountingStream(chunks))
+        return httpx.Response(200, headers={"ETag": '"x"', "Content-Type": "application/rss+xml"}, stream=streams[-1])
+
+    cache = HttpCache(str(tmp_path / "cache.db"))
+    client = httpx.Client(transport=CachingTransport(httpx.MockTransport(handler), cache))
+    adapter = GenericRSSAdapter("Feed", "https://feeds.example.com/jobs.rss", client)
+    adapter.chunk_size = 1024
+
+    assert len(adapter.search(make_profile(), 5)) == 5
+    assert streams[0].pulled < len(chunks) // 4
+    # A partly read body is not cached, so the next request is not made conditional on it.
+    assert cache.lookup("https://feeds.example.com/jobs.rss") is None
+
+    with client.stream("GET", "https://feeds.example.com/jobs.rss", extensions={STREAM_EXTENSION: True}) as response:
+        assert response.read() == body
+    assert streams[1].pulled == len(chunks)
+    assert cache.lookup("https://feeds.example.com/jobs.rss") is not None
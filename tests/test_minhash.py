@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from factories import make_job
+
+from jobpipeline.dedupe.minhash import MinHasher
+from jobpipeline.storage.near_duplicates import NearDuplicateIndex
+
+
+BASE = " ".join(f"Monitor circuit {i} and escalate outages to the carrier within SLA." for i in range(40))
+
+
+def test_similarity_tracks_text_overlap() -> None:
+    hasher = MinHasher()
+    base = hasher.signature(make_job("a", description_raw=BASE))
+    assert hasher.similarity(base, hasher.signature(make_job("b", description_raw=BASE))) == 1.0
+    assert hasher.similarity(base, hasher.signature(make_job("c", description_raw=BASE + " Relocation offered."))) > 0.8
+    assert hasher.similarity(base, hasher.signature(make_job("d", description_raw="Bake bread and pastries daily.", title="Baker", company="Bakery"))) < 0.2
+
+
+def test_index_persists_and_respects_threshold(tmp_path: Path) -> None:
+    db = str(tmp_path / "jobs.db")
+    index = NearDuplicateIndex(db, threshold=0.8)
+    index.add("a", index.hasher.signature(make_job("a", description_raw=BASE)))
+    index.close()
+
+    reopened = NearDuplicateIndex(db, threshold=0.8)
+    match = reopened.find(reopened.hasher.signature(make_job("b", description_raw=BASE + " Relocation offered.")), "b")
+    assert match is not None and match[0] == "a"
+    assert reopened.find(reopened.hasher.signature(make_job("a", description_raw=BASE)), "a") is None
+    assert reopened.find(reopened.hasher.signature(make_job("c", description_raw="Answer phones at the front desk.", title="Receptionist"))) is None
+    assert reopened.contains("a") and not reopened.contains("b")
+    reopened.close()
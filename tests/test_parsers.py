@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from jobpipeline.collectors import extract
+from jobpipeline.collectors.job_collector import JobCollector
+from jobpipeline.collectors.parsers import BeautifulSoupBackend, LxmlBackend, scan_json_ld
+from jobpipeline.core.models import SourceItem
+
+pytest.importorskip("lxml")
+
+PAGES = sorted((Path(__file__).parent / "fixtures" / "pages").glob("*.html"))
+
+
+@pytest.mark.parametrize("page", PAGES, ids=lambda p: p.stem)
+def test_backends_agree_on_saved_pages(page: Path) -> None:
+    html = page.read_text(encoding="utf-8")
+    reference = BeautifulSoupBackend().parse(html)
+    fast = LxmlBackend().parse(html)
+
+    assert fast.title == reference.title
+    assert fast.json_ld == reference.json_ld
+    assert fast.text == reference.text
+
+
+@pytest.mark.parametrize("page", PAGES, ids=lambda p: p.stem)
+def test_collector_output_matches_across_backends(page: Path) -> None:
+    html = page.read_text(encoding="utf-8")
+    item = SourceItem(job_url="https://jobs.example.com/p/1", source_name="RSS", source_domain="jobs.example.com")
+    jobs = [
+        JobCollector(0, 0, parser=backend)._parse_success(item, html, item.job_url, "2026-10-17T00:00:00")
+        for backend in (BeautifulSoupBackend(), LxmlBackend())
+    ]
+    assert jobs[0] == jobs[1]
+    assert jobs[0].description_raw
+
+
+def test_json_ld_description_is_reduced_to_text() -> None:
+    html = (Path(__file__).parent / "fixtures" / "pages" / "greenhouse_jsonld.html").read_text(encoding="utf-8")
+    item = SourceItem(job_url="https://boards.greenhouse.io/acme/jobs/4455667", source_name="Greenhouse", source_domain="x")
+    job = JobCollector(0, 0, parser=LxmlBackend())._parse_success(item, html, item.job_url, "2026-10-17T00:00:00")
+
+    assert job.title == "Network Engineer"
+    assert job.company == "Acme Networks"
+    assert job.location_text == "Remote - US"
+    assert job.description_raw.startswith("About the role You will support our WAN & campus networks.")
+
+
+@pytest.mark.parametrize("page", PAGES, ids=lambda p: p.stem)
+def test_json_ld_fast_path_matches_dom_path(page: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    html = page.read_text(encoding="utf-8")
+    item = SourceItem(job_url="https://jobs.example.com/p/1", source_name="RSS", source_domain="jobs.example.com")
+    fast_collector = JobCollector(0, 0, parser=LxmlBackend())
+    fast = fast_collector._parse_success(item, html, item.job_url, "2026-10-17T00:00:00")
+
+    monkeypatch.setattr(extract, "scan_json_ld", lambda _: {})
+    dom_collector = JobCollector(0, 0, parser=LxmlBackend())
+    dom = dom_collector._parse_success(item, html, item.job_url, "2026-10-17T00:00:00")
+
+    assert fast == dom
+    assert dom_collector.parse_paths == {"dom": 1}
+    expected = "json_ld" if page.stem in {"greenhouse_jsonld", "jsonld_list"} else "dom"
+    assert fast_collector.parse_paths == {expected: 1}
+
+
+def test_scan_json_ld_matches_dom_selection() -> None:
+    for page in PAGES:
+        html = page.read_text(encoding="utf-8")
+        assert scan_json_ld(html) == BeautifulSoupBackend().parse(html).json_ld
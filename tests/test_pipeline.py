@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+from collections import Counter
 from pathlib import Path
 
+import pytest
+from factories import make_job, make_profile
 from openpyxl import load_workbook
 
 from jobpipeline.core.models import CanonicalJob, SearchProfile, SourceItem
 from jobpipeline.core.orchestrator import PipelineOrchestrator
-from jobpipeline.export.excel_sync import COLUMNS
+from jobpipeline.export.excel_sync import COLUMNS, profile_sheet_names
 from jobpipeline.scoring.service import FitScorer
+from jobpipeline.sources.base import SourceAdapter
+from jobpipeline.sources.manager import SourceManager
 from jobpipeline.storage.repository import JobRepository
+from jobpipeline.utils.text import canonicalize_url
 
 
 class FakeManager:
@@ -18,10 +24,14 @@ class FakeManager:
     def search(self, profile: SearchProfile, max_jobs: int) -> list[SourceItem]:
         return self.items[:max_jobs]
 
+    def search_with_stats(self, profile: SearchProfile, max_jobs: int) -> tuple[list[SourceItem], list]:
+        return self.search(profile, max_jobs), []
+
 
 class FakeCollector:
     def __init__(self, jobs: list[CanonicalJob]) -> None:
         self.jobs = jobs
+        self.parse_paths: Counter[str] = Counter()
 
     def collect(self, item: SourceItem) -> CanonicalJob:
         return self.jobs.pop(0)
@@ -55,38 +65,6 @@ def make_config(tmp_path: Path) -> dict:
     }
 
 
-def mkjob(job_id: str, canonical_url: str, source_name: str = "RSS") -> CanonicalJob:
-    return CanonicalJob(
-        job_id=job_id,
-        source_domain="example.com",
-        source_name=source_name,
-        job_url=canonical_url,
-        canonical_url=canonical_url,
-        apply_url=canonical_url,
-        title="IT Support Specialist",
-        company="Acme",
-        location_text="Remote",
-        remote_flag="Y",
-        employment_type="FT",
-        posted_date="2026-01-01",
-        collected_at="2026-01-02T00:00:00",
-        description_raw="Great role troubleshooting customer service active directory 2 years",
-        salary_text=None,
-        skills_extracted=["troubleshooting"],
-        fetch_status="success",
-        failure_reason=None,
-        first_seen="2026-01-02T00:00:00",
-        last_seen="2026-01-02T00:00:00",
-        repost_count=0,
-        merged_from=[],
-        fit_score=0,
-        fit_grade="D",
-        fit_notes="",
-        missing_must_have=[],
-        flags=[],
-    )
-
-
 def test_pipeline_creates_sqlite_and_excel(tmp_path: Path) -> None:
     config = make_config(tmp_path)
     repo = JobRepository(str(tmp_path / "jobs.db"))
@@ -94,7 +72,7 @@ def test_pipeline_creates_sqlite_and_excel(tmp_path: Path) -> None:
 
     items = [SourceItem(job_url="https://example.com/j/1", source_name="RSS", source_domain="example.com")]
     orchestrator._source_manager = lambda: FakeManager(items)  # type: ignore[method-assign]
-    orchestrator.collector = FakeCollector([mkjob("job1", "https://example.com/j/1")])
+    orchestrator.collector = FakeCollector([make_job("job1", "https://example.com/j/1")])
 
     counts = orchestrator.run()
     assert counts["found"] == 1
@@ -119,8 +97,8 @@ def test_rerun_updates_last_seen_not_duplicate_and_preserves_sources(tmp_path: P
     orchestrator._source_manager = lambda: FakeManager(items)  # type: ignore[method-assign]
     orchestrator.collector = FakeCollector(
         [
-            mkjob("job1", "https://example.com/j/1", "RSS"),
-            mkjob("job2", "https://example.com/j/1", "RSS2"),
+            make_job("job1", "https://example.com/j/1", "RSS"),
+            make_job("job2", "https://example.com/j/1", "RSS2"),
         ]
     )
 
@@ -137,11 +115,11 @@ def test_excel_sync_preserves_user_fields(tmp_path: Path) -> None:
 
     item = [SourceItem(job_url="https://example.com/j/1", source_name="RSS", source_domain="example.com")]
     orchestrator._source_manager = lambda: FakeManager(item)  # type: ignore[method-assign]
-    orchestrator.collector = FakeCollector([mkjob("job1", "https://example.com/j/1")])
+    orchestrator.collector = FakeCollector([make_job("job1", "https://example.com/j/1")])
     orchestrator.run()
     repo.update_user_fields("job1", "Applied", "sent resume")
 
-    orchestrator.collector = FakeCollector([mkjob("job1", "https://example.com/j/1")])
+    orchestrator.collector = FakeCollector([make_job("job1", "https://example.com/j/1")])
     orchestrator.run()
 
     wb = load_workbook(config["excel_path"])
@@ -151,24 +129,507 @@ def test_excel_sync_preserves_user_fields(tmp_path: Path) -> None:
 
 
 def test_fit_scoring_is_deterministic() -> None:
-    profile = SearchProfile(
-        name="default",
+    profile = make_profile(
         target_titles=["IT Support Specialist"],
-        adjacent_titles=[],
         location_mode="Remote",
-        city="",
-        radius_km=0,
-        experience_min_years=1,
-        experience_max_years=3,
         must_have_keywords=["troubleshooting"],
         nice_to_have_keywords=["azure"],
-        exclude_keywords=[],
-        time_window_days=7,
         master_resume_skills=["troubleshooting"],
     )
-    job = mkjob("job1", "https://example.com/j/1")
+    job = make_job("job1", "https://example.com/j/1")
     scorer = FitScorer()
     first = scorer.score(job, profile)
     second = scorer.score(job, profile)
     assert first.fit_score == second.fit_score
     assert first.fit_notes == second.fit_notes
+
+
+def test_fresh_jobs_are_reused_without_fetching(tmp_path: Path) -> None:
+    config = make_config(tmp_path)
+    config["collector"]["fresh_ttl_hours"] = 12
+    repo = JobRepository(str(tmp_path / "jobs.db"))
+    orchestrator = PipelineOrchestrator(config, repo)
+
+    items = [SourceItem(job_url="https://example.com/j/1?utm_source=feed", source_name="RSS", source_domain="example.com")]
+    orchestrator._source_manager = lambda: FakeManager(items)  # type: ignore[method-assign]
+    job = make_job("job1", "https://example.com/j/1")
+    job.collected_at = CanonicalJob.now_iso()
+    orchestrator.collector = FakeCollector([job])
+    orchestrator.run()
+
+    orchestrator.collector = FakeCollector([])
+    counts = orchestrator.run()
+
+    stored = repo.list_jobs()
+    assert counts["reused"] == 1
+    assert len(stored) == 1
+    assert stored[0]["repost_count"] == 1
+    assert stored[0]["description_raw"] == job.description_raw
+
+
+def test_duplicate_items_are_fetched_once(tmp_path: Path) -> None:
+    config = make_config(tmp_path)
+    repo = JobRepository(str(tmp_path / "jobs.db"))
+    orchestrator = PipelineOrchestrator(config, repo)
+
+    items = [
+        SourceItem(job_url="https://example.com/j/1?utm_source=rss", source_name="RSS", source_domain="example.com"),
+        SourceItem(job_url="https://example.com/j/1#apply", source_name="Greenhouse", source_domain="example.com"),
+        SourceItem(job_url="https://example.com/j/2", source_name="RSS", source_domain="example.com"),
+    ]
+    orchestrator._source_manager = lambda: FakeManager(items)  # type: ignore[method-assign]
+    collector = FakeCollector([make_job("job1", "https://example.com/j/1"), make_job("job2", "https://example.com/j/2")])
+    orchestrator.collector = collector
+    counts = orchestrator.run()
+
+    assert collector.jobs == []
+    assert counts["skipped_duplicates"] == 1
+    stored = {row["job_id"]: row for row in repo.list_jobs()}
+    assert stored["job1"]["source_name"] == "RSS,Greenhouse"
+    assert stored["job1"]["repost_count"] == 1
+    seen = repo.conn.execute("SELECT source_name FROM job_sources_seen WHERE job_id='job1'").fetchall()
+    assert "Greenhouse" in [row["source_name"] for row in seen]
+
+
+class ApiStubAdapter(SourceAdapter):
+    name = "Greenhouse"
+
+    def __init__(self, urls: list[str]) -> None:
+        self.urls = urls
+
+    def search(self, profile: SearchProfile, max_items: int) -> list[SourceItem]:
+        items = []
+        for idx, url in enumerate(self.urls[:max_items]):
+            item = SourceItem(job_url=url, source_name=self.name, source_domain="example.com")
+            item.job = make_job(f"job{idx}", canonicalize_url(url), self.name)
+            items.append(item)
+        return items
+
+
+def test_streaming_mode_stores_jobs_as_they_arrive(tmp_path: Path) -> None:
+    config = make_config(tmp_path)
+    config["collector"].update({"streaming": True, "stream_queue_size": 2})
+    repo = JobRepository(str(tmp_path / "jobs.db"))
+    orchestrator = PipelineOrchestrator(config, repo)
+    urls = [f"https://example.com/j/{i}" for i in range(20)]
+    urls.insert(5, "https://example.com/j/1?utm_source=feed")
+    adapter = ApiStubAdapter(urls)
+    orchestrator._source_manager = lambda: SourceManager([adapter], deadline_seconds=10)  # type: ignore[method-assign]
+
+    try:
+        counts = orchestrator.run()
+    finally:
+        orchestrator.close()
+
+    assert counts["found"] == 21
+    assert counts["skipped_duplicates"] == 1
+    assert counts["collected"] == 20
+    assert counts["exported"] == 20
+    assert counts["parsed_api"] == 20
+    assert len(repo.list_jobs()) == 20
+    assert load_workbook(config["excel_path"])["Jobs"].max_row == 21
+    seen = repo.conn.execute("SELECT COUNT(*) FROM job_sources_seen WHERE job_id='job1'").fetchone()[0]
+    assert seen == 2
+
+
+def test_profiles_share_one_fetch_and_get_their_own_scores(tmp_path: Path) -> None:
+    config = make_config(tmp_path)
+    second = dict(config["profiles"][0], name="network/ops", target_titles=["Network Engineer"], must_have_keywords=["ccna"])
+    config["profiles"].append(second)
+    repo = JobRepository(str(tmp_path / "jobs.db"))
+    orchestrator = PipelineOrchestrator(config, repo)
+    items = [SourceItem(job_url="https://example.com/j/1", source_name="RSS", source_domain="example.com")]
+    orchestrator._source_manager = lambda: FakeManager(items)  # type: ignore[method-assign]
+    collector = FakeCollector([make_job("job1", "https://example.com/j/1")])
+    orchestrator.collector = collector
+
+    orchestrator.run()
+
+    assert collector.jobs == []
+    default = repo.list_jobs(profile="default")[0]
+    network = repo.list_jobs(profile="network/ops")[0]
+    assert default["fit_score"] == repo.list_jobs()[0]["fit_score"]
+    assert network["fit_score"] < default["fit_score"]
+    assert network["missing_must_have"] == '["ccna"]'
+    wb = load_workbook(config["excel_path"])
+    assert wb.sheetnames == ["Jobs", "network_ops"]
+    assert wb["network_ops"].cell(2, 11).value == network["fit_score"]
+
+
+def test_unscored_profile_does_not_borrow_the_primary_fit(tmp_path: Path) -> None:
+    repo = JobRepository(str(tmp_path / "jobs.db"))
+    job = make_job("job1", "https://example.com/j/1")
+    job.fit_score = 80
+    repo.upsert_job(job)
+
+    assert repo.list_jobs(profile="network", primary_profile="default")[0]["fit_score"] is None
+    assert next(repo.iter_jobs(["job1"], profile="network", primary_profile="default")).fit_score is None
+    # Jobs stored before job_scores existed still report their fit under the primary profile.
+    assert repo.list_jobs(profile="default", primary_profile="default")[0]["fit_score"] == 80
+
+
+def test_profile_sheet_names_never_collide() -> None:
+    names = profile_sheet_names(["Jobs", "a/b", "a?b", "jobs", "x" * 40, "x" * 35])
+    assert names == ["Jobs_2", "a_b", "a_b_2", "jobs_3", "x" * 31, "x" * 29 + "_2"]
+
+
+def test_near_duplicate_repost_is_merged_across_runs(tmp_path: Path) -> None:
+    config = make_config(tmp_path)
+    config["dedupe"] = {"near_duplicates": True, "near_duplicate_threshold": 0.7}
+    repo = JobRepository(str(tmp_path / "jobs.db"))
+    orchestrator = PipelineOrchestrator(config, repo)
+    original = make_job("job1", "https://example.com/j/1")
+    original.description_raw = " ".join(f"Duty {i}: keep the service desk running for remote staff." for i in range(30))
+    first = [SourceItem(job_url="https://example.com/j/1", source_name="RSS", source_domain="example.com")]
+    orchestrator._source_manager = lambda: FakeManager(first)  # type: ignore[method-assign]
+    orchestrator.collector = FakeCollector([original])
+    orchestrator.run()
+
+    repost = make_job("job2", "https://boards.example.org/p/99", "Greenhouse")
+    repost.description_raw = original.description_raw + " Apply by Friday."
+    unrelated = make_job("job3", "https://example.com/j/3")
+    unrelated.title = "Payroll Clerk"
+    unrelated.description_raw = "Process payroll and reconcile ledgers every week."
+    items = [
+        SourceItem(job_url="https://boards.example.org/p/99", source_name="Greenhouse", source_domain="boards.example.org"),
+        SourceItem(job_url="https://example.com/j/3", source_name="RSS", source_domain="example.com"),
+    ]
+    orchestrator._source_manager = lambda: FakeManager(items)  # type: ignore[method-assign]
+    orchestrator.collector = FakeCollector([repost, unrelated])
+    try:
+        counts = orchestrator.run()
+    finally:
+        orchestrator.close()
+
+    stored = {row["job_id"]: row for row in repo.list_jobs()}
+    assert counts["near_duplicates"] == 1
+    assert sorted(stored) == ["job1", "job3"]
+    assert stored["job1"]["repost_count"] == 1
+    assert stored["job1"]["merged_from"] == '["job2"]'
+    assert stored["job1"]["source_name"] == "RSS,Greenhouse"
+
+
+def test_folded_repost_resolves_to_the_stored_job_on_later_runs(tmp_path: Path) -> None:
+    config = make_config(tmp_path)
+    config["dedupe"] = {"near_duplicates": True, "near_duplicate_threshold": 0.7}
+    repo = JobRepository(str(tmp_path / "jobs.db"))
+    orchestrator = PipelineOrchestrator(config, repo)
+    original = make_job("job1", "https://example.com/j/1")
+    original.description_raw = " ".join(f"Duty {i}: keep the service desk running for remote staff." for i in range(30))
+    orchestrator._source_manager = lambda: FakeManager(  # type: ignore[method-assign]
+        [SourceItem(job_url="https://example.com/j/1", source_name="RSS", source_domain="example.com")]
+    )
+    orchestrator.collector = FakeCollector([original])
+    orchestrator.run()
+
+    item = SourceItem(job_url="https://boards.example.org/p/99", source_name="Greenhouse", source_domain="boards.example.org")
+    orchestrator._source_manager = lambda: FakeManager([item])  # type: ignore[method-assign]
+    runs = []
+    try:
+        for _ in range(2):
+            repost = make_job("job2", "https://boards.example.org/p/99", "Greenhouse")
+            repost.description_raw = original.description_raw + " Apply by Friday."
+            orchestrator.collector = FakeCollector([repost])
+            runs.append(orchestrator.run())
+    finally:
+        orchestrator.close()
+
+    stored = repo.list_jobs()
+    assert [run["near_duplicates"] for run in runs] == [1, 0]
+    assert [row["job_id"] for row in stored] == ["job1"]
+    assert stored[0]["repost_count"] == 1
+    assert stored[0]["job_url"] == "https://example.com/j/1"
+    assert stored[0]["merged_from"] == '["job2"]'
+    assert repo.lookup_identities(["url:https://boards.example.org/p/99"]) == {"url:https://boards.example.org/p/99": "job1"}
+
+
+def test_edited_title_keeps_stable_job_id(tmp_path: Path) -> None:
+    config = make_config(tmp_path)
+    repo = JobRepository(str(tmp_path / "jobs.db"))
+    orchestrator = PipelineOrchestrator(config, repo)
+    url = "https://acme.example.com/careers?gh_jid=4012345"
+    orchestrator._source_manager = lambda: FakeManager(  # type: ignore[method-assign]
+        [SourceItem(job_url=url, source_name="RSS", source_domain="acme.example.com")]
+    )
+    orchestrator.collector = FakeCollector([make_job("job-v1", url)])
+    orchestrator.run()
+
+    edited = make_job("job-v2", url)
+    edited.title = "IT Support Specialist II"
+    moved = make_job("job-v3", "https://boards.greenhouse.io/acme/jobs/4012345", "Greenhouse")
+    orchestrator._source_manager = lambda: FakeManager(  # type: ignore[method-assign]
+        [
+            SourceItem(job_url=url, source_name="RSS", source_domain="acme.example.com"),
+            SourceItem(job_url=moved.job_url, source_name="Greenhouse", source_domain="boards.greenhouse.io"),
+        ]
+    )
+    orchestrator.collector = FakeCollector([edited, moved])
+    counts = orchestrator.run()
+
+    stored = repo.list_jobs()
+    assert [row["job_id"] for row in stored] == ["job-v1"]
+    assert stored[0]["title"] == "IT Support Specialist II"
+    assert stored[0]["merged_from"] == '["job-v3"]'
+    assert counts["merged"] == 1
+
+
+def test_run_stores_a_batch_without_committing_per_job(tmp_path: Path) -> None:
+    config = make_config(tmp_path)
+    repo = JobRepository(str(tmp_path / "jobs.db"))
+    orchestrator = PipelineOrchestrator(config, repo)
+    jobs = [make_job(f"job{i}", f"https://example.com/j/{i}") for i in range(299)]
+    items = [SourceItem(job_url=job.job_url, source_name="RSS", source_domain="example.com") for job in jobs]
+    items.append(SourceItem(job_url="https://example.com/j/0?utm_source=x", source_name="Greenhouse", source_domain="example.com"))
+    orchestrator._source_manager = lambda: FakeManager(items)  # type: ignore[method-assign]
+    orchestrator.collector = FakeCollector(jobs)
+    commits = []
+    repo.conn.set_trace_callback(lambda sql: commits.append(sql) if sql == "COMMIT" else None)
+    orchestrator.run()
+    repo.conn.set_trace_callback(None)
+
+    assert len(commits) < 10
+    assert len(repo.list_jobs()) == 299
+    assert repo.lookup_identities(["url:https://example.com/j/7"]) == {"url:https://example.com/j/7": "job7"}
+    seen = repo.conn.execute("SELECT source_name FROM job_sources_seen WHERE job_id='job0' ORDER BY source_name")
+    assert [row[0] for row in seen] == ["Greenhouse", "RSS,Greenhouse"]
+
+
+def test_failed_run_does_not_leave_its_batch_for_the_next_run(tmp_path: Path) -> None:
+    config = make_config(tmp_path)
+    repo = JobRepository(str(tmp_path / "jobs.db"))
+    orchestrator = PipelineOrchestrator(config, repo)
+    jobs = [make_job("job1", "https://example.com/j/1"), make_job("job2", "https://example.com/j/2")]
+    orchestrator._source_manager = lambda: FakeManager(  # type: ignore[method-assign]
+        [SourceItem(job_url=job.job_url, source_name="RSS", source_domain="example.com") for job in jobs]
+    )
+    orchestrator.collector = FakeCollector(jobs)
+
+    def fail_on_second(job: CanonicalJob) -> str | None:
+        if job.job_id == "job2":
+            raise RuntimeError("boom")
+        return None
+
+    orchestrator._merge_near_duplicate = fail_on_second  # type: ignore[method-assign]
+    with pytest.raises(RuntimeError):
+        orchestrator.run()
+    assert orchestrator._pending == []
+
+    del orchestrator._merge_near_duplicate
+    later = make_job("job3", "https://example.com/j/3")
+    orchestrator._source_manager = lambda: FakeManager(  # type: ignore[method-assign]
+        [SourceItem(job_url=later.job_url, source_name="RSS", source_domain="example.com")]
+    )
+    orchestrator.collector = FakeCollector([later])
+    orchestrator.run()
+
+    assert [row["job_id"] for row in repo.list_jobs()] == ["job3"]
+
+
+def test_rescore_updates_changed_scores_once_per_profile_version(tmp_path: Path) -> None:
+    config = make_config(tmp_path)
+    repo = JobRepository(str(tmp_path / "jobs.db"))
+    orchestrator = PipelineOrchestrator(config, repo)
+    orchestrator._source_manager = lambda: FakeManager(  # type: ignore[method-assign]
+        [SourceItem(job_url=f"https://example.com/j/{n}", source_name="RSS", source_domain="example.com") for n in (1, 2)]
+    )
+    orchestrator.collector = FakeCollector([make_job("job1", "https://example.com/j/1"), make_job("job2", "https://example.com/j/2")])
+    orchestrator.run()
+    before = repo.list_jobs()[0]["fit_score"]
+    with pytest.raises(ValueError):
+        orchestrator.rescore(chunk_size=0)
+
+    # Nothing changed since the run: the first rescore compares but writes nothing.
+    assert orchestrator.rescore(chunk_size=1) == {"profiles": 1, "scanned": 2, "changed": 0}
+    assert orchestrator.rescore() == {"profiles": 0, "scanned": 0, "changed": 0}
+
+    config["profiles"][0]["must_have_keywords"] = ["troubleshooting", "ccna"]
+    assert orchestrator.rescore(chunk_size=1) == {"profiles": 1, "scanned": 2, "changed": 2}
+    rows = repo.list_jobs()
+    assert all(row["fit_score"] < before and row["missing_must_have"] == '["ccna"]' for row in rows)
+    assert repo.list_jobs(profile="default")[0]["fit_score"] == rows[0]["fit_score"]
+    assert orchestrator.rescore() == {"profiles": 0, "scanned": 0, "changed": 0}
+
+
+def test_similarity_index_updates_incrementally(tmp_path: Path) -> None:
+    config = make_config(tmp_path)
+    config["profiles"][0]["master_resume_skills"] = ["active directory", "azure"]
+    repo = JobRepository(str(tmp_path / "jobs.db"))
+    orchestrator = PipelineOrchestrator(config, repo)
+    matching = make_job("job1", "https://example.com/j/1")
+    matching.description_raw = "Support Active Directory and Azure tenants"
+    other = make_job("job2", "https://example.com/j/2")
+    other.title = "Warehouse Associate"
+    other.description_raw = "Forklift and inventory work"
+    orchestrator._source_manager = lambda: FakeManager(  # type: ignore[method-assign]
+        [SourceItem(job_url=job.job_url, source_name="RSS", source_domain="example.com") for job in (matching, other)]
+    )
+    orchestrator.collector = FakeCollector([matching, other])
+    orchestrator.run()
+
+    similarity = orchestrator.similarity("default")
+    assert 0 < similarity["job1"] <= 100
+    assert "job2" not in similarity
+    assert orchestrator.term_index.conn.execute("SELECT docs FROM term_corpus").fetchone()[0] == 2
+
+    # Re-storing a job replaces its postings instead of counting it twice.
+    other.description_raw = "Azure help desk"
+    orchestrator._store_scored(other, orchestrator._profiles())
+    assert orchestrator.term_index.conn.execute("SELECT docs FROM term_corpus").fetchone()[0] == 2
+    assert "job2" in orchestrator.similarity("default")
+    assert orchestrator.term_index.conn.execute("SELECT df FROM term_df WHERE term='forklift'").fetchone()[0] == 0
+
+    # A database from before the index existed is backfilled from the stored jobs.
+    orchestrator.close()
+    repo.conn.executescript("DROP TABLE term_postings; DROP TABLE term_df; DROP TABLE term_docs; DROP TABLE term_corpus;")
+    reopened = PipelineOrchestrator(config, repo)
+    assert set(reopened.similarity("default")) == {"job1", "job2"}
+
+
+def test_snippet_prefilter_drops_certain_rejections_before_fetch(tmp_path: Path) -> None:
+    config = make_config(tmp_path)
+    config["filters"]["exclude_keywords"] = ["contract"]
+    repo = JobRepository(str(tmp_path / "jobs.db"))
+    orchestrator = PipelineOrchestrator(config, repo)
+    titles = {
+        "1": "Senior IT Support Specialist",
+        "2": "IT Support Specialist - Clearance Required",
+        "3": "Contract Help Desk Analyst",
+        "4": "IT Support Specialist",
+        "5": "",
+    }
+    orchestrator._source_manager = lambda: FakeManager(  # type: ignore[method-assign]
+        [
+            SourceItem(
+                job_url=f"https://example.com/j/{key}",
+                source_name="RSS",
+                source_domain="example.com",
+                snippet_meta={"feed_title": title},
+            )
+            for key, title in titles.items()
+        ]
+    )
+    collector = FakeCollector([make_job("job4", "https://example.com/j/4"), make_job("job5", "https://example.com/j/5")])
+    orchestrator.collector = collector
+
+    counts = orchestrator.run()
+
+    assert collector.jobs == []
+    assert counts["prefiltered"] == 3
+    assert counts["prefiltered_excluded"] == 2
+    assert counts["prefiltered_clearance"] == 1
+    assert counts["collected"] == 2
+    assert sorted(row["job_id"] for row in repo.list_jobs()) == ["job4", "job5"]
+
+
+def test_incremental_run_only_touches_new_postings(tmp_path: Path) -> None:
+    config = make_config(tmp_path)
+    config["sources"]["incremental"] = True
+    repo = JobRepository(str(tmp_path / "jobs.db"))
+    orchestrator = PipelineOrchestrator(config, repo)
+
+    class NewestFirstAdapter(ApiStubAdapter):
+        def search(self, profile: SearchProfile, max_items: int) -> list[SourceItem]:
+            items = super().search(profile, max_items)
+            for item in items:
+                if item.job_url.endswith("/new"):
+                    item.job.job_id, item.job.posted_date = "job-new", "2026-02-01"
+            return items
+
+    adapter = NewestFirstAdapter([f"https://example.com/j/{i}" for i in range(3)])
+    orchestrator._source_manager = lambda: SourceManager(  # type: ignore[method-assign]
+        [adapter], deadline_seconds=10, watermarks=orchestrator.watermarks.load()
+    )
+    try:
+        assert orchestrator.run()["found"] == 3
+        assert orchestrator.run()["found"] == 0
+        adapter.urls.insert(0, "https://example.com/j/new")
+        counts = orchestrator.run()
+    finally:
+        orchestrator.close()
+
+    assert counts["found"] == 1
+    assert len(repo.list_jobs()) == 4
+
+
+def test_jobs_older_than_time_window_are_dropped(tmp_path: Path) -> None:
+    config = make_config(tmp_path)
+    config["filters"]["enforce_time_window"] = True
+    repo = JobRepository(str(tmp_path / "jobs.db"))
+    orchestrator = PipelineOrchestrator(config, repo)
+    old, recent = make_job("old", "https://example.com/j/1"), make_job("recent", "https://example.com/j/2")
+    recent.posted_date = CanonicalJob.now_iso()
+    orchestrator._source_manager = lambda: FakeManager(  # type: ignore[method-assign]
+        [SourceItem(job_url=job.job_url, source_name="RSS", source_domain="example.com") for job in (old, recent)]
+    )
+    orchestrator.collector = FakeCollector([old, recent])
+
+    counts = orchestrator.run()
+
+    assert counts["out_of_window"] == 1
+    assert [row["job_id"] for row in repo.list_jobs()] == ["recent"]
+
+
+def test_skills_are_interned_and_queryable(tmp_path: Path) -> None:
+    repo = JobRepository(str(tmp_path / "jobs.db"))
+    first, second = make_job("job1", "https://example.com/j/1"), make_job("job2", "https://example.com/j/2")
+    first.skills_extracted = ["bgp", "troubleshooting"]
+    second.skills_extracted = ["troubleshooting"]
+    repo.upsert_job(first)
+    repo.upsert_job(second)
+
+    assert [row["job_id"] for row in repo.jobs_with_skill("Border Gateway Protocol")] == ["job1"]
+    assert sorted(row["job_id"] for row in repo.jobs_with_skill("troubleshoot")) == ["job1", "job2"]
+    assert repo.conn.execute("SELECT COUNT(*) FROM skills").fetchone()[0] == 2
+
+    first.skills_extracted = ["troubleshooting"]
+    repo.upsert_job(first)
+    assert repo.jobs_with_skill("bgp") == []
+    plan = repo.conn.execute("EXPLAIN QUERY PLAN SELECT job_id FROM job_skills WHERE skill_id = 1").fetchall()
+    assert "idx_job_skills_skill" in " ".join(row[3] for row in plan)
+
+
+def test_skill_backfill_runs_once_per_database(tmp_path: Path) -> None:
+    path = str(tmp_path / "jobs.db")
+    repo = JobRepository(path)
+    job = make_job("job1", "https://example.com/j/1")
+    job.description_raw = "Configure BGP and firewall rules"
+    job.skills_extracted = ["raw token"]
+    repo.upsert_job(job)
+    # Simulate a database from before job_skills existed.
+    repo.conn.execute("DELETE FROM job_skills")
+    repo.conn.execute("PRAGMA user_version = 0")
+    repo.conn.commit()
+    repo.close()
+
+    repo = JobRepository(path)
+    assert repo.list_jobs()[0]["skills_extracted"] == '["bgp", "firewalls"]'
+    repo.conn.execute("DELETE FROM job_skills")
+    repo.conn.execute("UPDATE jobs SET skills_extracted='[]'")
+    repo.conn.commit()
+    repo.close()
+
+    # An empty job_skills table no longer triggers a rewrite once the migration is recorded.
+    repo = JobRepository(path)
+    assert repo.list_jobs()[0]["skills_extracted"] == "[]"
+    repo.close()
+
+
+def test_upsert_jobs_writes_a_batch_in_one_transaction(tmp_path: Path) -> None:
+    repo = JobRepository(str(tmp_path / "jobs.db"))
+    assert repo.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    repo.upsert_job(make_job("job1", "https://example.com/j/1"))
+    repo.update_user_fields("job1", "Applied", "called recruiter")
+
+    batch = [make_job(f"job{i}", f"https://example.com/j/{i}") for i in range(1, 1001)]
+    batch.append(make_job("job1", "https://example.com/j/1", source_name="Greenhouse"))
+    commits = []
+    repo.conn.set_trace_callback(lambda sql: commits.append(sql) if sql == "COMMIT" else None)
+    repo.upsert_jobs(batch)
+    repo.add_run_errors(1, [("a.example.com", "timeout", ""), ("b.example.com", "http_404", "")])
+    repo.conn.set_trace_callback(None)
+
+    assert len(commits) == 2
+    row = repo.conn.execute("SELECT user_status, user_notes, source_name FROM jobs WHERE job_id='job1'").fetchone()
+    assert tuple(row) == ("Applied", "called recruiter", "RSS,Greenhouse")
+    assert repo.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] == 1000
+    assert repo.conn.execute("SELECT COUNT(*) FROM run_errors").fetchone()[0] == 2
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+from factories import make_job, make_profile
+
+from jobpipeline.core.models import SearchProfile, SourceItem
+from jobpipeline.scoring.matcher import KeywordMatcher
+from jobpipeline.scoring.prefilter import SnippetFilter
+from jobpipeline.scoring.service import FitScorer
+
+
+def make_network_profile() -> SearchProfile:
+    return make_profile(
+        name="network",
+        adjacent_titles=["NOC Technician"],
+        location_mode="Remote",
+        must_have_keywords=["BGP", "routing"],
+        nice_to_have_keywords=["python"],
+        exclude_keywords=["intern"],
+    )
+
+
+def test_matcher_uses_word_boundaries_and_finds_overlapping_keywords() -> None:
+    matcher = KeywordMatcher({"kw": ["bgp", "network", "network engineer", "customer service", "c++"]})
+    hits = matcher.scan("Network\nEngineer with eBGP, C++ and customer  service")
+    assert hits["kw"] == {"network", "network engineer", "customer service", "c++"}
+    assert matcher.scan("BGP peering")["kw"] == {"bgp"}
+
+
+def test_scorer_ignores_substring_hits() -> None:
+    result = FitScorer().evaluate(make_job(title="Network Engineer", description_raw="Handles ebgp rerouting."), make_network_profile())
+    assert result.missing_must_have == ["bgp", "routing"]
+    assert "seniority" not in result.flags
+
+
+def test_exclude_keywords_in_title_zero_the_score() -> None:
+    scorer = FitScorer()
+    excluded = scorer.evaluate(make_job(title="Network Engineer Intern", description_raw="BGP routing with python."), make_network_profile())
+    assert excluded.fit_score == 0
+    assert "excluded" in excluded.flags
+
+    noted = scorer.evaluate(make_job(title="Network Engineer", description_raw="BGP routing with python; mentor our intern."), make_network_profile())
+    assert noted.fit_score > 0
+    assert "excluded" not in noted.flags
+    assert "excluded terms in description: intern" in noted.fit_notes
+
+
+def test_score_many_matches_evaluate() -> None:
+    base = make_network_profile()
+    other = make_profile(
+        name="support",
+        target_titles=["Support Engineer", "network"],
+        location_mode="Onsite",
+        experience_min_years=0,
+        experience_max_years=2,
+        must_have_keywords=["ticketing", "c", "BGP"],
+        exclude_keywords=["contract"],
+    )
+    descriptions = [
+        "BGP and routing with python, 2 years.",
+        "Senior role; ticketing in c++ and eBGP. 5+ years.",
+        "Security clearance required. Contract position with routing.",
+        "",
+        "Mentor an intern; customer service, ticketing, C and BGP. 10 years",
+    ]
+    titles = ["Network Engineer", "Support Engineer (Contract)", "NOC Technician", "Intern", "Staff Network Engineer"]
+    jobs = [make_job(title=title, description_raw=text) for title in titles for text in descriptions]
+    for idx, job in enumerate(jobs):
+        job.remote_flag = "Y" if idx % 2 else "N"
+
+    scorer = FitScorer()
+    for mode in ("downrank", "reject"):
+        batch = scorer.score_many(jobs, [base, other], mode)
+        assert batch == [[scorer.evaluate(job, profile, mode) for profile in (base, other)] for job in jobs]
+
+
+def test_snippet_filter_rejects_only_when_every_profile_would() -> None:
+    network = make_network_profile()
+    support = replace(network, name="support", target_titles=["Support Engineer"], exclude_keywords=[])
+
+    def item(title: str) -> SourceItem:
+        return SourceItem(job_url="https://example.com/1", source_name="RSS", source_domain="example.com", snippet_meta={"feed_title": title})
+
+    downrank = SnippetFilter([network])
+    assert downrank.reject(item("Senior Network Engineer")) is None
+    assert downrank.reject(item("Network Engineer Intern")) == "excluded"
+    assert SnippetFilter([network], seniority_mode="reject").reject(item("Senior Network Engineer")) == "seniority"
+    # "intern" is excluded only by the network profile, so the support profile keeps the posting.
+    assert SnippetFilter([network, support]).reject(item("Support Engineer Intern")) is None
+    assert SnippetFilter([network], require_title_match=True).reject(item("Warehouse Associate")) == "title"
+    assert SnippetFilter([network], require_title_match=True).reject(item("")) is None
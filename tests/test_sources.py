@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+import pytest
+from factories import make_profile
+
+from jobpipeline.collectors.job_collector import JobCollector
+from jobpipeline.core.models import SearchProfile, SourceItem
+from jobpipeline.sources.base import SourceAdapter
+from jobpipeline.sources.greenhouse import GreenhouseJobBoardApiAdapter, GreenhousePublicBoardAdapter
+from jobpipeline.sources.lever import LeverPostingsApiAdapter
+from jobpipeline.sources.manager import SourceManager
+from jobpipeline.sources.rss import GenericRSSAdapter
+from jobpipeline.storage.watermarks import SourceWatermark
+from jobpipeline.utils.http import build_http_client, http_settings
+
+RSS = """<?xml version="1.0"?><rss><channel>
+<item><title>NOC Engineer</title><link>https://jobs.example.com/1</link></item>
+<item><title>Network Engineer</title><link>https://jobs.example.com/2</link></item>
+</channel></rss>"""
+
+BOARD = """<html><body>
+<a href="/acme/jobs/101">Network Engineer</a>
+<a href="/acme/jobs/102">Support Engineer</a>
+</body></html>"""
+
+
+ATS_FIXTURES = Path(__file__).parent / "fixtures" / "ats"
+# Recorded API responses, served the way boards-api.greenhouse.io and api.lever.co serve them.
+ATS_ROUTES = {
+    "/v1/boards/acme/jobs?content=true": "greenhouse_board.json",
+    "/v0/postings/globex?mode=json": "lever_postings.json",
+}
+
+
+class AtsStandIn(BaseHTTPRequestHandler):
+    requests: list[str] = []
+
+    def do_GET(self) -> None:  # noqa: N802
+        AtsStandIn.requests.append(self.path)
+        fixture = ATS_ROUTES.get(self.path)
+        if fixture is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = (ATS_FIXTURES / fixture).read_bytes()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        return
+
+
+@pytest.fixture()
+def ats_server() -> Iterator[str]:
+    AtsStandIn.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), AtsStandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_adapters_share_injected_client() -> None:
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.host)
+        if request.url.path.endswith(".rss"):
+            return httpx.Response(200, text=RSS)
+        return httpx.Response(200, text=BOARD)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    rss = GenericRSSAdapter("Feed", "https://feeds.example.com/jobs.rss", client)
+    board = GreenhousePublicBoardAdapter("https://boards.greenhouse.io/acme", client)
+
+    assert [item.job_url for item in rss.search(make_profile(), 5)] == [
+        "https://jobs.example.com/1",
+        "https://jobs.example.com/2",
+    ]
+    assert len(board.search(make_profile(), 5)) == 2
+    assert seen == ["feeds.example.com", "boards.greenhouse.io"]
+
+
+def test_http_settings_merge_config_over_defaults() -> None:
+    settings = http_settings({"http": {"timeout_seconds": 5, "http2": True}})
+    assert settings["timeout_seconds"] == 5
+    assert settings["max_connections_per_host"] == 4
+    with build_http_client(settings) as client:
+        assert client.timeout.read == 5
+
+
+def test_ats_api_adapters_emit_complete_jobs_without_per_job_fetches(ats_server: str) -> None:
+    with httpx.Client() as client:
+        greenhouse = GreenhouseJobBoardApiAdapter("acme", client, api_base=ats_server).search(make_profile(), 10)
+        lever = LeverPostingsApiAdapter("globex", client, api_base=ats_server, company_name="Globex").search(
+            make_profile(), 10
+        )
+
+    collector = JobCollector(per_domain_delay_seconds=0, max_retries=0)
+    jobs = [collector.collect(item) for item in greenhouse + lever]
+
+    assert AtsStandIn.requests == list(ATS_ROUTES)
+    assert collector.parse_paths == {"api": 3}
+    first = jobs[0]
+    assert (first.title, first.company, first.location_text) == ("Network Engineer", "Acme Networks", "Remote - US")
+    assert first.canonical_url == "https://boards.greenhouse.io/acme/jobs/4455667"
+    assert first.description_raw == "About the role Support WAN & campus networks. Routing and switching CCNA preferred"
+    assert first.remote_flag == "Y"
+    administrator = jobs[2]
+    assert administrator.company == "Globex"
+    assert administrator.employment_type == "Full-time"
+    assert administrator.remote_flag == "Y"
+    assert administrator.posted_date == "2025-10-16"
+    assert "Requirements CCNA Active Directory" in administrator.description_raw
+
+
+class StubAdapter(SourceAdapter):
+    def __init__(self, name: str, count: int, delay: float = 0.0) -> None:
+        self.name = name
+        self.count = count
+        self.delay = delay
+
+    def search(self, profile: SearchProfile, max_items: int) -> list[SourceItem]:
+        time.sleep(self.delay)
+        domain = f"{self.name}.example.com"
+        return [
+            SourceItem(job_url=f"https://{domain}/{i}", source_name=self.name, source_domain=domain)
+            for i in range(min(self.count, max_items))
+        ]
+
+
+def test_source_manager_fans_out_and_redistributes_unused_quota() -> None:
+    adapters = [StubAdapter("small", 2, delay=0.2), StubAdapter("large", 50, delay=0.2), StubAdapter("slow", 50, delay=2)]
+    manager = SourceManager(adapters, deadline_seconds=0.6)
+
+    started = time.monotonic()
+    found, stats = manager.search_with_stats(make_profile(), max_jobs=10)
+
+    assert time.monotonic() - started < 1.5
+    assert [item.source_name for item in found].count("small") == 2
+    assert [item.source_name for item in found].count("large") == 8
+    by_name = {stat.name: stat for stat in stats}
+    assert by_name["slow"].timed_out and by_name["slow"].used == 0
+    assert by_name["large"].returned == 10 and by_name["large"].used == 8
+
+
+ATOM = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Jobs</title>
+<entry><title>NOC Engineer</title><link rel="alternate" href="https://jobs.example.com/a1"/>
+<updated>2026-01-05T10:00:00Z</updated></entry>
+<entry><title>SRE</title><link href="https://jobs.example.com/a2"/><updated>2026-01-04T08:30:00+02:00</updated></entry>
+</feed>"""
+
+
+def test_rss_adapter_streams_atom_and_reads_dates() -> None:
+    client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, text=ATOM)))
+    items = GenericRSSAdapter("Atom", "https://feeds.example.com/jobs.atom", client).search(make_profile(), 5)
+
+    assert [item.job_url for item in items] == ["https://jobs.example.com/a1", "https://jobs.example.com/a2"]
+    assert items[0].snippet_meta == {"feed_title": "NOC Engineer", "published": "2026-01-05T10:00:00"}
+    assert items[1].snippet_meta["published"] == "2026-01-04T06:30:00"
+
+
+def test_rss_adapter_stops_reading_after_max_items() -> None:
+    entries = "".join(
+        f"<item><title>Job {i}</title><link>https://jobs.example.com/{i}</link>"
+        f"<pubDate>Mon, 05 Jan 2026 10:00:00 GMT</pubDate></item>"
+        for i in range(5000)
+    )
+    body = f"<rss><channel>{entries}</channel></rss>".encode()
+    chunks_read: list[int] = []
+
+    def chunks() -> Iterator[bytes]:
+        for start in range(0, len(body), 4096):
+            chunks_read.append(start)
+            yield body[start : start + 4096]
+
+    adapter = GenericRSSAdapter("Feed", "https://feeds.example.com/jobs.rss")
+    items = list(adapter._iter_items(chunks(), 3))
+
+    assert [item.job_url for item in items] == [f"https://jobs.example.com/{i}" for i in range(3)]
+    assert items[0].snippet_meta["published"] == "2026-01-05T10:00:00"
+    assert len(chunks_read) == 1
+
+
+def test_iter_new_stops_at_watermark_and_time_window() -> None:
+    entries = "".join(
+        f"<item><title>Job {day}</title><link>https://jobs.example.com/{day}</link>"
+        f"<pubDate>{day:02d} Jan 2026 10:00:00 GMT</pubDate></item>"
+        for day in (9, 8, 7, 6, 5, 4)
+    )
+    body = f"<rss><channel>{entries}</channel></rss>"
+    client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, text=body)))
+    adapter = GenericRSSAdapter("Feed", "https://feeds.example.com/jobs.rss", client)
+
+    fresh = list(adapter.iter_new(make_profile(), 50, None, "2026-01-05T12:00:00"))
+    assert [item.job_url.rsplit("/", 1)[1] for item in fresh] == ["9", "8", "7", "6"]
+    assert fresh[0].snippet_meta["watermark_key"] == "rss:https://feeds.example.com/jobs.rss"
+
+    seen = SourceWatermark(newest="2026-01-07T10:00:00", seen={"https://jobs.example.com/7", "https://jobs.example.com/6"})
+    assert [item.job_url for item in adapter.iter_new(make_profile(), 50, seen, None)] == [
+        "https://jobs.example.com/9",
+        "https://jobs.example.com/8",
+    ]
+
+    # Undated board links have no order, so seen ones are skipped rather than ending the walk.
+    board = StubAdapter("board", 4)
+    marks = SourceWatermark(seen={"https://board.example.com/0", "https://board.example.com/2"})
+    assert [item.job_url for item in board.iter_new(make_profile(), 10, marks, None)] == [
+        "https://board.example.com/1",
+        "https://board.example.com/3",
+    ]
+
+
+def test_iter_new_skips_instead_of_stopping_on_unordered_api_listings() -> None:
+    postings = [
+        {"absolute_url": f"https://boards.greenhouse.io/acme/jobs/{n}", "title": "NOC Engineer", "first_published": published}
+        for n, published in ((1, "2026-01-01T00:00:00Z"), (2, "2026-01-09T00:00:00Z"), (3, "2026-01-10T00:00:00Z"))
+    ]
+    client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"jobs": postings})))
+    adapter = GreenhouseJobBoardApiAdapter("acme", client)
+
+    in_window = adapter.iter_new(make_profile(), 50, None, "2026-01-08T00:00:00")
+    assert [item.job_url.rsplit("/", 1)[1] for item in in_window] == ["2", "3"]
+
+    seen = SourceWatermark(newest="2026-01-05T00:00:00", seen={"https://boards.greenhouse.io/acme/jobs/1"})
+    assert [item.job_url.rsplit("/", 1)[1] for item in adapter.iter_new(make_profile(), 50, seen, None)] == ["2", "3"]